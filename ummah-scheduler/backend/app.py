@@ -1,17 +1,21 @@
 # backend/app.py
-from flask import Flask, jsonify
+from flask import Flask, jsonify, request
 from flask_cors import CORS
 from routes.monday import monday_bp
 from routes.auth import auth_bp
 from routes.schedule import schedule
 from routes.followup import followup_bp
 from app_config import FLASK_SECRET_KEY
-from db import init_db, seed_admin
+from db import init_db, seed_admin, query_all
 from routes.admin import admin_bp
 from routes.message_logger import message_logger
-import sqlite3
+from routes.monday_webhook import monday_webhook_bp
+from routes.events import events_bp
+from services.job_queue import sweep_jobs
+from services.monday_sync import start_background_sync
+from services.pagination import InvalidCursor, decode_cursor, paginate, parse_limit
+from services.http_cache import compress_response, conditional
 import os
-from db import DB_PATH
 
 
 
@@ -26,7 +30,8 @@ CORS(app, supports_credentials=True, resources={
     r"/api/*": {
         "origins": FRONTEND_URL,
         "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-        "allow_headers": ["Content-Type", "Authorization"]
+        "allow_headers": ["Content-Type", "Authorization"],
+        "expose_headers": ["X-Next-Cursor", "ETag"]
     }
 })
 
@@ -37,6 +42,17 @@ app.register_blueprint(auth_bp)
 app.register_blueprint(schedule)
 app.register_blueprint(followup_bp, url_prefix='/api')
 app.register_blueprint(message_logger)
+app.register_blueprint(monday_webhook_bp)
+app.register_blueprint(events_bp)
+
+# ✅ gzip / brotli for larger JSON bodies (streams are left alone)
+app.after_request(compress_response)
+
+# ✅ Apply schema migrations, then keep the local Monday.com mirror fresh
+init_db()
+sweep_jobs()  # jobs a previous run left behind
+if os.getenv("MONDAY_SYNC_ENABLED", "true").lower() == "true":
+    start_background_sync()
 
 
 @app.route("/")
@@ -44,25 +60,54 @@ def index():
     return "Backend is running"
 
 @app.route("/api/mentor-activity")
+@conditional("mentor_actions")
 def mentor_activity():
+    """
+    Mentor activity log, newest first.
+
+    Filters: ?email=, ?action= (comma-separated), ?from= / ?to= (ISO timestamps).
+    Paging: ?limit= (max 1000) and ?cursor= from the previous page's X-Next-Cursor header.
+    """
     try:
-        with sqlite3.connect("admin_data.db") as conn:
-            c = conn.cursor()
-            c.execute("""
-                SELECT email, action, timestamp, details
-                FROM mentor_actions
-                ORDER BY timestamp DESC
-            """)
-            rows = c.fetchall()
-            results = []
-            for email, action, ts, details in rows:
-                results.append({
-                    "email": email,
-                    "action": action,
-                    "timestamp": ts,
-                    "details": details
-                })
-            return jsonify(results)
+        where, params = [], []
+
+        if request.args.get("email"):
+            where.append("email = ?")
+            params.append(request.args["email"].strip())
+
+        actions = [a.strip() for a in request.args.get("action", "").split(",") if a.strip()]
+        if actions:
+            where.append(f"action IN ({', '.join('?' for _ in actions)})")
+            params += actions
+
+        if request.args.get("from"):
+            where.append("timestamp >= ?")
+            params.append(request.args["from"])
+        if request.args.get("to"):
+            where.append("timestamp < ?")
+            params.append(request.args["to"])
+
+        limit = parse_limit(request.args.get("limit"))
+        offset = 0
+        if request.args.get("cursor"):
+            where.append("(timestamp, id) < (?, ?)")
+            params += decode_cursor(request.args["cursor"])
+        elif request.args.get("offset"):
+            # Legacy offset paging, still bounded by the page size
+            offset = int(request.args["offset"])
+
+        rows = query_all(f"""
+            SELECT id, email, action, timestamp, details
+            FROM mentor_actions
+            {"WHERE " + " AND ".join(where) if where else ""}
+            ORDER BY timestamp DESC, id DESC
+            LIMIT ? OFFSET ?
+        """, params + [limit + 1, offset])
+
+        page, headers = paginate(rows, limit, "timestamp", "id")
+        return jsonify([dict(row) for row in page]), 200, headers
+    except (InvalidCursor, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         print("Mentor activity fetch error:", e)
         return jsonify([])
@@ -70,7 +115,6 @@ def mentor_activity():
 
 
 if __name__ == "__main__":
-    init_db()
     seed_admin()
 
     print("\n📍 Registered routes:")
@@ -13,9 +13,22 @@ MONDAY_BOARD_ID = os.getenv("MONDAY_BOARD_ID")
 
 # ───── Discord Config ─────
 DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
+# Per-channel webhooks for new-submission notifications
+DISCORD_CHANNEL_WEBHOOKS = {
+    "general": os.getenv("DISCORD_GENERAL_WEBHOOK"),
+    "business": os.getenv("DISCORD_BUSINESS_WEBHOOK"),
+    "education": os.getenv("DISCORD_EDUCATION_WEBHOOK"),
+    "engineering": os.getenv("DISCORD_ENGINEERING_WEBHOOK"),
+    "finance": os.getenv("DISCORD_FINANCE_WEBHOOK"),
+    "it": os.getenv("DISCORD_IT_WEBHOOK"),
+    "law": os.getenv("DISCORD_LAW_WEBHOOK"),
+}
 
 # ───── Google Calendar Config ─────
 GOOGLE_CALENDAR_CREDENTIALS = os.getenv("GOOGLE_CALENDAR_CREDENTIALS")
 GOOGLE_CALENDAR_TIMEZONE = os.getenv("GOOGLE_CALENDAR_TIMEZONE", "America/New_York")
 
 FLASK_SECRET_KEY = os.getenv("FLASK_SECRET_KEY")
+
+# ───── Frontend ─────
+FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
@@ -0,0 +1,76 @@
+# ummah-scheduler/backend/benchmarks/compare.py
+"""
+Compare two benchmarks.run result files.
+
+    python -m benchmarks.compare baseline.json candidate.json --threshold 10
+
+Prints p50/p95/p99 for every (scale, endpoint) present in both files and
+exits with status 1 if any endpoint's --metric (p95 by default) got more
+than --threshold percent slower, or started returning errors.
+"""
+import argparse
+import json
+import sys
+
+METRICS = ["p50", "p95", "p99"]
+
+
+def _load(path):
+    with open(path) as f:
+        report = json.load(f)
+    return report.get("meta", {}), {(r["scale"], r["endpoint"]): r for r in report["results"]}
+
+
+def _change(old, new):
+    if not old or new is None:
+        return None
+    return (new - old) / old * 100
+
+
+def compare(baseline, candidate, metric="p95", threshold=10.0):
+    """(rows, regressions) for two loaded result maps."""
+    rows, regressions = [], []
+    for key in sorted(baseline.keys() & candidate.keys(), key=lambda k: (k[0] is None, k[0] or 0, k[1])):
+        old, new = baseline[key], candidate[key]
+        changes = {m: _change(old["latencyMs"][m], new["latencyMs"][m]) for m in METRICS}
+        rows.append((key, old, new, changes))
+        if changes[metric] is not None and changes[metric] > threshold:
+            regressions.append(f"{key[1]} @ {key[0]}: {metric} {changes[metric]:+.1f}%")
+        if new["errors"] > old["errors"]:
+            regressions.append(f"{key[1]} @ {key[0]}: errors {old['errors']} -> {new['errors']}")
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--metric", choices=METRICS, default="p95")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown in percent")
+    args = parser.parse_args(argv)
+
+    old_meta, baseline = _load(args.baseline)
+    new_meta, candidate = _load(args.candidate)
+    print(f"📊 {old_meta.get('commit') or args.baseline} -> {new_meta.get('commit') or args.candidate}")
+
+    rows, regressions = compare(baseline, candidate, args.metric, args.threshold)
+    for (scale, endpoint), old, new, changes in rows:
+        cells = "  ".join(
+            f"{m} {old['latencyMs'][m]}→{new['latencyMs'][m]} ms"
+            + (f" ({changes[m]:+.1f}%)" if changes[m] is not None else "")
+            for m in METRICS
+        )
+        print(f"{scale if scale is not None else '-':>7}  {endpoint:<45} {cells}")
+    for key in sorted(baseline.keys() ^ candidate.keys(), key=str):
+        print(f"➖ Only in {'baseline' if key in baseline else 'candidate'}: {key[1]} @ {key[0]}")
+
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) over {args.threshold}%:")
+        for line in regressions:
+            print(f"   {line}")
+        sys.exit(1)
+    print(f"✅ No {args.metric} regression over {args.threshold}%")
+
+
+if __name__ == "__main__":
+    main()
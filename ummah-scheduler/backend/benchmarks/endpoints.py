@@ -0,0 +1,119 @@
+# ummah-scheduler/backend/benchmarks/endpoints.py
+"""
+The calls the benchmark drives, against data from benchmarks.seed.
+
+Reads come before writes so ETag and cache numbers aren't disturbed by
+the benchmark's own save-status / schedule-meeting traffic.
+"""
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.load import Endpoint
+from benchmarks.seed import FIRST_NAMES, INDUSTRIES, STATUSES, submission_id
+
+JOB_POLL_INTERVAL = 0.01
+JOB_TIMEOUT = 30
+
+
+def _random_id(rng, scale):
+    return submission_id(rng.randrange(scale))
+
+
+def _meeting_time(rng):
+    day = datetime.now(timezone.utc).date() + timedelta(days=rng.randint(1, 14))
+    start = datetime(day.year, day.month, day.day, rng.randint(13, 22), rng.choice([0, 30]), tzinfo=timezone.utc)
+    return start.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _schedule(session, base, rng, scale, mentors):
+    n = rng.randrange(scale)
+    return session.post(f"{base}/api/schedule-meeting", json={
+        "id": submission_id(n),
+        "studentEmail": f"student{n}@student.example",
+        "mentorEmail": rng.choice(mentors),
+        "time": _meeting_time(rng),
+    })
+
+
+def _schedule_until_done(session, base, rng, scale, mentors):
+    resp = _schedule(session, base, rng, scale, mentors)
+    if resp.status_code != 202:
+        return resp
+    deadline = time.monotonic() + JOB_TIMEOUT
+    status_url = f"{base}{resp.json()['statusUrl']}"
+    while time.monotonic() < deadline:
+        resp = session.get(status_url)
+        if resp.status_code != 200 or resp.json().get("status") in ("done", "failed"):
+            return resp
+        time.sleep(JOB_POLL_INTERVAL)
+    return resp
+
+
+def _job_done(resp):
+    # A 409 means the slot was already taken (cached free/busy); that's a valid answer
+    return resp.status_code == 409 or (resp.status_code == 200 and resp.json().get("status") == "done")
+
+
+def build_endpoints(scale, mentors):
+    """Every benchmark endpoint, in run order, as {name: Endpoint}."""
+    etag = {}
+
+    def fetch_etag(session, base):
+        etag["value"] = session.get(f"{base}/api/submissions").headers.get("ETag")
+
+    endpoints = [
+        Endpoint(
+            "GET /api/submissions",
+            lambda s, base, rng: s.get(f"{base}/api/submissions"),
+        ),
+        Endpoint(
+            "GET /api/submissions (If-None-Match)",
+            lambda s, base, rng: s.get(f"{base}/api/submissions", headers={"If-None-Match": etag.get("value") or ""}),
+            ok=lambda resp: resp.status_code == 304,
+            setup=fetch_etag,
+        ),
+        Endpoint(
+            "GET /api/admin-submissions",
+            lambda s, base, rng: s.get(f"{base}/api/admin-submissions", params={
+                "limit": 50, "status": rng.choice(STATUSES),
+            }),
+        ),
+        Endpoint(
+            "GET /api/submissions/search",
+            lambda s, base, rng: s.get(f"{base}/api/submissions/search", params={
+                "q": f"{rng.choice(FIRST_NAMES)} {rng.choice(INDUSTRIES)[:3]}", "limit": 20,
+            }),
+        ),
+        Endpoint(
+            "GET /api/mentor-queue",
+            lambda s, base, rng: s.get(f"{base}/api/mentor-queue", params={
+                "industries": ",".join(rng.sample(INDUSTRIES, 2)), "limit": 50,
+            }),
+        ),
+        Endpoint(
+            "GET /api/suggest-slots",
+            lambda s, base, rng: s.get(f"{base}/api/suggest-slots", params={
+                "submissionId": _random_id(rng, scale),
+                "mentors": ",".join(rng.sample(mentors, min(10, len(mentors)))),
+            }),
+        ),
+        Endpoint(
+            "POST /api/save-status",
+            lambda s, base, rng: s.post(f"{base}/api/save-status", json={
+                "id": _random_id(rng, scale),
+                "status": rng.choice(STATUSES),
+                "pickedBy": rng.choice(mentors),
+            }),
+        ),
+        Endpoint(
+            "POST /api/schedule-meeting",
+            lambda s, base, rng: _schedule(s, base, rng, scale, mentors),
+            ok=lambda resp: resp.status_code in (202, 409),
+        ),
+        Endpoint(
+            "POST /api/schedule-meeting (until job done)",
+            lambda s, base, rng: _schedule_until_done(s, base, rng, scale, mentors),
+            ok=_job_done,
+        ),
+    ]
+    return {endpoint.name: endpoint for endpoint in endpoints}
@@ -0,0 +1,95 @@
+# ummah-scheduler/backend/benchmarks/load.py
+"""
+Concurrent HTTP load driver and latency summaries.
+
+An Endpoint makes one call with a requests.Session and says whether the
+response counts as a success. drive() runs it `requests` times across
+`concurrency` threads (one session each) and summarize() turns the
+timings into p50/p95/p99 and throughput.
+"""
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+class Endpoint:
+    def __init__(self, name, call, ok=None, setup=None):
+        self.name = name
+        self.call = call    # (session, base_url, rng) -> requests.Response
+        self.ok = ok or (lambda resp: resp.status_code < 400)
+        self.setup = setup  # (session, base_url) -> None, run once before the warmup
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def drive(endpoint, base_url, requests_count, concurrency, warmup=0, seed=0):
+    """Run the endpoint `requests_count` times with `concurrency` threads."""
+    local = threading.local()
+    timings = {"latencies": [], "errors": 0, "errorSamples": [], "wall": 0.0}
+    lock = threading.Lock()
+
+    def session():
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+            local.rng = random.Random(f"{seed}-{endpoint.name}-{threading.get_ident()}")
+        return local.session, local.rng
+
+    def one(record=True):
+        sess, rng = session()
+        started = time.perf_counter()
+        try:
+            resp = endpoint.call(sess, base_url, rng)
+            ok, detail = endpoint.ok(resp), f"HTTP {resp.status_code}"
+        except requests.RequestException as e:
+            ok, detail = False, type(e).__name__
+        elapsed = time.perf_counter() - started
+        if record:
+            with lock:
+                timings["latencies"].append(elapsed)
+                if not ok:
+                    timings["errors"] += 1
+                    if len(timings["errorSamples"]) < 5:
+                        timings["errorSamples"].append(detail)
+
+    if endpoint.setup:
+        endpoint.setup(requests.Session(), base_url)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda _: one(record=False), range(warmup)))
+        started = time.perf_counter()
+        list(pool.map(lambda _: one(), range(requests_count)))
+        timings["wall"] = time.perf_counter() - started
+    return timings
+
+
+def summarize(timings):
+    latencies = sorted(timings["latencies"])
+    count, wall = len(latencies), timings["wall"]
+
+    def ms(seconds):
+        return round(seconds * 1000, 2) if seconds is not None else None
+
+    return {
+        "requests": count,
+        "errors": timings["errors"],
+        "errorRate": round(timings["errors"] / count, 4) if count else None,
+        "errorSamples": timings["errorSamples"],
+        "durationSeconds": round(wall, 3),
+        "throughputRps": round(count / wall, 2) if wall else None,
+        "latencyMs": {
+            "p50": ms(percentile(latencies, 50)),
+            "p95": ms(percentile(latencies, 95)),
+            "p99": ms(percentile(latencies, 99)),
+            "mean": ms(sum(latencies) / count) if count else None,
+            "max": ms(latencies[-1]) if count else None,
+        },
+    }
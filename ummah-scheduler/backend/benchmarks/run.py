@@ -0,0 +1,269 @@
+# ummah-scheduler/backend/benchmarks/run.py
+"""
+End-to-end benchmark: seeded database, real app server, fake upstreams.
+
+    cd backend
+    python -m benchmarks.run --scales 1000,10000,100000 --requests 300 \
+        --concurrency 8 --latency-ms 50 --output results.json
+
+For every scale a fresh database is seeded (benchmarks.seed) and the app
+is started in a subprocess (threaded Werkzeug, or gunicorn with
+--server gunicorn) against fakes.monday, fakes.google_calendar and
+fakes.discord. Each endpoint in benchmarks.endpoints is then driven with
+`--concurrency` clients, and scripts/monday_to_discord.py is timed once
+against the fake board. Results are JSON; compare two runs with
+`python -m benchmarks.compare`.
+"""
+import argparse
+import json
+import os
+import platform
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import requests
+
+from benchmarks.endpoints import build_endpoints
+from benchmarks.load import drive, summarize
+from benchmarks.seed import INDUSTRIES, mentor_emails
+from fakes.discord import FakeDiscord
+from fakes.google_calendar import FakeGoogleCalendar
+from fakes.monday import FakeMonday
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+SCRIPT_PATH = BACKEND_DIR.parent / "scripts" / "monday_to_discord.py"
+SCRIPT_NAME = "scripts/monday_to_discord.py"
+DISCORD_CHANNELS = ["general", "business", "education", "engineering", "finance", "it", "law"]
+SERVER_START_TIMEOUT = 60
+
+
+def log(message):
+    # Progress goes to stderr so the JSON on stdout stays clean
+    print(message, file=sys.stderr, flush=True)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _git_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=BACKEND_DIR, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--", "."], cwd=BACKEND_DIR,
+                               capture_output=True, text=True).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ---------------------------
+# Fakes and environment
+# ---------------------------
+def start_fakes(args):
+    latency = args.latency_ms / 1000
+    monday = FakeMonday(latency=latency, error_rate=args.error_rate).start()
+    google = FakeGoogleCalendar(latency=latency, error_rate=args.error_rate).start()
+    discord = FakeDiscord(latency=latency, error_rate=args.error_rate,
+                          bucket_size=args.discord_bucket, reset_after=args.discord_reset).start()
+    week_start = datetime.now(timezone.utc).strftime("%Y-%m-%dT00:00:00Z")
+    for email in mentor_emails(args.mentors):
+        google.add_calendar(email)
+        google.add_busy_pattern(email, week_start, days=21)
+    return monday, google, discord
+
+
+def upstream_env(monday, google, discord):
+    """Environment pointing the backend (and the Discord script) at the fakes."""
+    env = {
+        **os.environ,
+        "MONDAY_SYNC_ENABLED": "false",
+        "MONDAY_API_URL": monday.url,
+        "MONDAY_API_KEY": "fake-key",
+        "MONDAY_BOARD_ID": monday.board_id,
+        "GOOGLE_API_ROOT_URL": google.root_url,
+        "DISCORD_WEBHOOK_PREFIX": discord.prefix,
+        "DISCORD_WEBHOOK_URL": discord.webhook_url("general"),
+        "FLASK_SECRET_KEY": os.getenv("FLASK_SECRET_KEY", "benchmark-secret"),
+        "PYTHONUNBUFFERED": "1",
+    }
+    for channel in DISCORD_CHANNELS:
+        env[f"DISCORD_{channel.upper()}_WEBHOOK"] = discord.webhook_url(channel)
+    return env
+
+
+# ---------------------------
+# App server
+# ---------------------------
+def start_server(args, env, port, log_file):
+    if args.server == "gunicorn":
+        command = [sys.executable, "-m", "gunicorn", "-b", f"127.0.0.1:{port}", "-w", str(args.workers),
+                   "-k", "gthread", "--threads", str(args.threads), "app:app"]
+    else:
+        command = [sys.executable, "-m", "benchmarks.serve", "--port", str(port)]
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env, stdout=log_file, stderr=subprocess.STDOUT)
+
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"App server exited with code {process.returncode}")
+        try:
+            requests.get(f"{base_url}/", timeout=1)
+            return process, base_url
+        except requests.RequestException:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"App server did not answer within {SERVER_START_TIMEOUT}s")
+
+
+def stop_server(process):
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def bench_scale(args, scale, env, selected):
+    results = []
+    with tempfile.TemporaryDirectory(prefix=f"bench-{scale}-") as tmp:
+        scale_env = {**env, "ADMIN_DB_PATH": str(Path(tmp) / "admin_data.db")}
+        log_path = Path(tmp) / "server.log"
+        with open(log_path, "w") as log_file:
+            log(f"🌱 Seeding {scale} submissions")
+            subprocess.run([sys.executable, "-m", "benchmarks.seed", "--scale", str(scale),
+                            "--mentors", str(args.mentors), "--google-root", env["GOOGLE_API_ROOT_URL"]],
+                           cwd=BACKEND_DIR, env=scale_env, stdout=log_file, stderr=subprocess.STDOUT, check=True)
+            process, base_url = start_server(args, scale_env, _free_port(), log_file)
+            try:
+                for name, endpoint in build_endpoints(scale, mentor_emails(args.mentors)).items():
+                    if not selected(name):
+                        continue
+                    timings = drive(endpoint, base_url, args.requests, args.concurrency,
+                                    warmup=args.warmup, seed=args.seed)
+                    result = {"scale": scale, "endpoint": name, "concurrency": args.concurrency, **summarize(timings)}
+                    log(f"⏱️ {scale:>7} {name:<45} p50 {result['latencyMs']['p50']} ms  "
+                        f"p95 {result['latencyMs']['p95']} ms  errors {result['errors']}")
+                    results.append(result)
+            finally:
+                stop_server(process)
+        if any(r["errors"] for r in results):
+            log(f"⚠️ Server log tail:\n{log_path.read_text()[-2000:]}")
+    return results
+
+
+# ---------------------------
+# Discord script
+# ---------------------------
+def bench_discord_script(args, monday, discord, env):
+    """Time scripts/monday_to_discord.py posting `--script-items` new items from a fresh ledger."""
+    created = datetime.now(timezone.utc) - timedelta(hours=1)
+    for n in range(args.script_items):
+        monday.add_item(f"Student {n}", created_at=(created + timedelta(seconds=n)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        industry=INDUSTRIES[n % len(INDUSTRIES)], email=f"student{n}@student.example")
+
+    timings = {"latencies": [], "errors": 0, "errorSamples": [], "wall": 0.0}
+    posts = 0
+    for run in range(args.script_runs):
+        with tempfile.TemporaryDirectory(prefix="bench-ledger-") as tmp:
+            ledger = Path(tmp) / "ledger.db"
+            conn = sqlite3.connect(ledger)
+            conn.execute("CREATE TABLE state (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("INSERT INTO state VALUES ('created_at_watermark', '2000-01-01T00:00:00Z')")
+            conn.commit()
+            conn.close()
+
+            before = sum(len(m) for m in discord.messages.values())
+            started = time.perf_counter()
+            proc = subprocess.run([sys.executable, str(SCRIPT_PATH)], cwd=BACKEND_DIR.parent,
+                                  env={**env, "DISCORD_LEDGER_PATH": str(ledger)}, capture_output=True, text=True)
+            elapsed = time.perf_counter() - started
+            timings["latencies"].append(elapsed)
+            timings["wall"] += elapsed
+            posts += sum(len(m) for m in discord.messages.values()) - before
+            if proc.returncode != 0:
+                timings["errors"] += 1
+                timings["errorSamples"].append(f"exit {proc.returncode}: {proc.stderr.strip()[-300:]}")
+
+    result = {
+        "scale": None,
+        "endpoint": SCRIPT_NAME,
+        "concurrency": 1,
+        **summarize(timings),
+        "items": args.script_items,
+        "discordMessagesPerRun": posts / args.script_runs if args.script_runs else 0,
+        "discordRateLimited": discord.rate_limited,
+    }
+    log(f"⏱️ {'-':>7} {SCRIPT_NAME:<45} p50 {result['latencyMs']['p50']} ms  errors {result['errors']}")
+    return result
+
+
+# ---------------------------
+# CLI
+# ---------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scales", default="1000,10000", help="comma-separated submission counts")
+    parser.add_argument("--requests", type=int, default=200, help="measured requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=10, help="unmeasured requests per endpoint")
+    parser.add_argument("--endpoints", default="", help="comma-separated substrings of endpoint names to run")
+    parser.add_argument("--mentors", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="latency added by every fake upstream")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of fake upstream calls that fail")
+    parser.add_argument("--discord-bucket", type=int, default=5, help="messages per webhook rate-limit window")
+    parser.add_argument("--discord-reset", type=float, default=2.0, help="webhook rate-limit window (s)")
+    parser.add_argument("--script-items", type=int, default=100, help="new board items for the Discord script")
+    parser.add_argument("--script-runs", type=int, default=3)
+    parser.add_argument("--server", choices=["werkzeug", "gunicorn"], default="werkzeug")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn workers")
+    parser.add_argument("--threads", type=int, default=8, help="gunicorn threads per worker")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    filters = [f.strip().lower() for f in args.endpoints.split(",") if f.strip()]
+
+    def selected(name):
+        return not filters or any(f in name.lower() for f in filters)
+
+    meta = {
+        "commit": _git_commit(),
+        "startedAt": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "config": vars(args),
+    }
+    results = []
+    monday, google, discord = start_fakes(args)
+    try:
+        env = upstream_env(monday, google, discord)
+        for scale in (int(s) for s in args.scales.split(",") if s.strip()):
+            results.extend(bench_scale(args, scale, env, selected))
+        if args.script_runs and selected(SCRIPT_NAME):
+            results.append(bench_discord_script(args, monday, discord, env))
+    finally:
+        for fake in (monday, google, discord):
+            fake.stop()
+
+    report = json.dumps({"meta": meta, "results": results}, indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n")
+        log(f"💾 Wrote {len(results)} results to {args.output}")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# ummah-scheduler/backend/benchmarks/seed.py
+"""
+Fill a fresh admin_data.db with synthetic submissions for benchmarks.
+
+Run with ADMIN_DB_PATH pointing at the database to create:
+
+    ADMIN_DB_PATH=/tmp/bench.db python -m benchmarks.seed --scale 10000 \
+        --google-root http://127.0.0.1:8081/
+
+Writes `scale` mirrored Monday items, saved statuses for about a third
+of them, mentor activity, and Google credentials for the benchmark
+mentors (accepted by fakes.google_calendar). The data is deterministic
+for a given --seed.
+"""
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from db import transaction, init_db
+from fakes.google_calendar import token_data
+from routes.followup import SUBMISSION_FIELDS, UPSERT_STATUS_SQL
+from services.admin_stats import rebuild_stats
+from services.credential_store import save_credentials
+from services.monday_sync import upsert_monday_items
+
+FIRST_NAMES = ["Aisha", "Omar", "Fatima", "Yusuf", "Zainab", "Ibrahim", "Maryam", "Bilal", "Khadija", "Hamza"]
+LAST_NAMES = ["Rahman", "Khan", "Ali", "Hussein", "Abdullah", "Siddiqui", "Haddad", "Osman", "Yilmaz", "Malik"]
+INDUSTRIES = ["Business", "Education", "Engineering", "Finance", "Information Technology", "Law", "Healthcare"]
+LOOKING_FOR = ["Resume Review", "Mock Interview", "Career Advice", "Networking", "Internship Search"]
+STANDINGS = ["Freshman", "Sophomore", "Junior", "Senior", "Graduate", "Alumni"]
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+PARTS = ["Morning", "Afternoon", "Evening"]
+STATUSES = ["To Do", "In Progress", "Done", "Canceled"]
+ACTIONS = ["login", "propose", "done", "cancel"]
+
+BATCH_SIZE = 5000
+
+
+def mentor_emails(count):
+    return [f"mentor{i}@bench.example" for i in range(count)]
+
+
+def submission_id(n):
+    return str(100000 + n)
+
+
+def make_item(rng, n, now):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    submitted = now - timedelta(days=rng.randint(0, 365), minutes=rng.randint(0, 1439))
+    start = now.date() + timedelta(days=rng.randint(-7, 14))
+    availability = "Anytime" if rng.random() < 0.1 else ", ".join(
+        f"{day} {part}" for day in rng.sample(DAYS, rng.randint(1, 3)) for part in rng.sample(PARTS, 1)
+    )
+    return {
+        "id": submission_id(n),
+        "name": f"{first} {last}",
+        "email": f"{first.lower()}.{last.lower()}{n}@student.example",
+        "phone": f"555-{n % 10000:04d}",
+        "industry": ", ".join(rng.sample(INDUSTRIES, rng.randint(1, 3))),
+        "academicStanding": rng.choice(STANDINGS),
+        "lookingFor": ", ".join(rng.sample(LOOKING_FOR, rng.randint(1, 2))),
+        "resume": f"resume_{n}.pdf",
+        "howTheyHeard": "Instagram",
+        "availability": availability,
+        "timeline": f"{start} - {start + timedelta(days=rng.randint(7, 30))}",
+        "otherInfo": f"Looking to grow in {rng.choice(INDUSTRIES).lower()} (#{n})",
+        "submitted": submitted.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "status": "",
+    }
+
+
+def seed(scale, google_root, mentors=40, seed_value=2025):
+    rng = random.Random(seed_value)
+    now = datetime.utcnow()
+    init_db()
+    emails = mentor_emails(mentors)
+
+    for start in range(0, scale, BATCH_SIZE):
+        items = [make_item(rng, n, now) for n in range(start, min(start + BATCH_SIZE, scale))]
+        saved = [item for item in items if rng.random() < 0.33]
+        updated_at = now.isoformat()
+        with transaction() as conn:
+            upsert_monday_items(conn, items)
+            conn.executemany(UPSERT_STATUS_SQL, [
+                (item["id"], *(item.get(f, "") for f in SUBMISSION_FIELDS), rng.choice(STATUSES),
+                 rng.choice(emails), updated_at)
+                for item in saved
+            ])
+            conn.executemany("""
+                INSERT INTO mentor_actions (email, action, timestamp, details) VALUES (?, ?, ?, ?)
+            """, [
+                (rng.choice(emails), rng.choice(ACTIONS),
+                 (now - timedelta(minutes=rng.randint(0, 525600))).isoformat(), f"with {item['email']}")
+                for item in items[::2]
+            ])
+
+    with transaction() as conn:
+        rebuild_stats(conn)
+    for email in emails:
+        save_credentials(email, token_data(email, google_root))
+    print(f"🌱 Seeded {scale} submissions and {mentors} mentors")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scale", type=int, default=1000)
+    parser.add_argument("--mentors", type=int, default=40)
+    parser.add_argument("--google-root", required=True, help="root URL of fakes.google_calendar")
+    parser.add_argument("--seed", type=int, default=2025)
+    args = parser.parse_args(argv)
+    seed(args.scale, args.google_root, args.mentors, args.seed)
+
+
+if __name__ == "__main__":
+    main()
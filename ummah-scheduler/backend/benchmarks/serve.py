@@ -0,0 +1,25 @@
+# ummah-scheduler/backend/benchmarks/serve.py
+"""
+Serve app.app on a threaded Werkzeug server without the debugger or
+reloader, so benchmark numbers aren't skewed by `python app.py` (debug).
+
+    python -m benchmarks.serve --port 5055
+"""
+import argparse
+
+from werkzeug.serving import make_server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5055)
+    args = parser.parse_args(argv)
+
+    from app import app
+    print(f"🚀 Serving on http://{args.host}:{args.port}", flush=True)
+    make_server(args.host, args.port, app, threaded=True).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,69 +1,168 @@
 import sqlite3
-from pathlib import Path
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
 
 import os
-DB_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "admin_data.db"))
+DB_PATH = os.path.abspath(
+    os.getenv("ADMIN_DB_PATH") or os.path.join(os.path.dirname(__file__), "admin_data.db")
+)
+# Mentor OAuth tokens live in their own file (never committed), attached as "credentials"
+CREDENTIALS_DB_PATH = os.path.abspath(
+    os.getenv("MENTOR_CREDENTIALS_DB_PATH") or os.path.join(os.path.dirname(DB_PATH), "mentor_credentials.db")
+)
 
+# Connection tuning (see https://www.sqlite.org/pragma.html)
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
 
+_local = threading.local()
 
+
+# ---------------------------
+# Connections
+# ---------------------------
+def _connect() -> sqlite3.Connection:
+    # Autocommit mode: transactions are opened explicitly by transaction()
+    conn = sqlite3.connect(DB_PATH, isolation_level=None, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")  # readers don't block the writer
+    conn.execute("PRAGMA synchronous=NORMAL")  # fsync on checkpoint, safe with WAL
+    conn.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    if not os.path.exists(CREDENTIALS_DB_PATH):
+        # Owner-only: the file holds refresh tokens and the OAuth client secret
+        os.close(os.open(CREDENTIALS_DB_PATH, os.O_CREAT | os.O_WRONLY, 0o600))
+    conn.execute("ATTACH DATABASE ? AS credentials", (CREDENTIALS_DB_PATH,))
+    conn.execute("PRAGMA credentials.journal_mode=WAL")
+    return conn
+
+
+def get_connection() -> sqlite3.Connection:
+    """Return this thread's connection, opening it on first use (and after a fork)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.pid != os.getpid():
+        conn = _connect()
+        _local.conn = conn
+        _local.pid = os.getpid()
+        _local.depth = 0
+    return conn
+
+
+def close_connection() -> None:
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.pid == os.getpid():
+        conn.close()
+    _local.conn = None
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """
+    Run a block in one write transaction (BEGIN IMMEDIATE, so the write lock
+    is taken up front instead of failing on upgrade). Nested blocks become
+    savepoints of the outer transaction.
+    """
+    conn = get_connection()
+    depth = _local.depth
+    savepoint = f"sp_{depth}"
+    conn.execute(f"SAVEPOINT {savepoint}" if depth else "BEGIN IMMEDIATE")
+    _local.depth = depth + 1
+    try:
+        yield conn
+    except BaseException:
+        if depth:
+            conn.execute(f"ROLLBACK TO {savepoint}")
+            conn.execute(f"RELEASE {savepoint}")
+        else:
+            conn.execute("ROLLBACK")
+        raise
+    else:
+        conn.execute(f"RELEASE {savepoint}" if depth else "COMMIT")
+    finally:
+        _local.depth = depth
+
+
+# ---------------------------
+# Query helpers
+# ---------------------------
+def query_all(sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+    return get_connection().execute(sql, params).fetchall()
+
+
+def query_one(sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+    return get_connection().execute(sql, params).fetchone()
+
+
+def query_value(sql: str, params: Sequence[Any] = (), default: Any = None) -> Any:
+    row = query_one(sql, params)
+    return row[0] if row is not None and row[0] is not None else default
+
+
+def execute(sql: str, params: Sequence[Any] = ()) -> int:
+    """Run a single write statement in its own transaction; returns rowcount."""
+    with transaction() as conn:
+        return conn.execute(sql, params).rowcount
+
+
+def executemany(sql: str, seq_of_params: Iterable[Sequence[Any]]) -> int:
+    with transaction() as conn:
+        return conn.executemany(sql, seq_of_params).rowcount
+
+
+def table_versions(tables: Sequence[str]) -> dict:
+    """{table: write counter} from data_versions (bumped by triggers on every write)."""
+    tables = list(tables)
+    rows = query_all(
+        f"SELECT name, version FROM data_versions WHERE name IN ({', '.join('?' for _ in tables)})",
+        tables
+    )
+    return {row["name"]: row["version"] for row in rows}
+
+
+def bump_table_versions(conn: sqlite3.Connection, tables: Sequence[str]) -> None:
+    """Mark `tables` as changed for writes their triggers don't see (e.g. derived tables)."""
+    conn.executemany(
+        "UPDATE data_versions SET version = version + 1 WHERE name = ?",
+        [(table,) for table in tables]
+    )
+
+
+# ---------------------------
+# Schema + admin helpers
+# ---------------------------
 def init_db():
-    with sqlite3.connect(DB_PATH) as conn:
-        c = conn.cursor()
-        c.execute("""
-        CREATE TABLE IF NOT EXISTS admin (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            email TEXT UNIQUE NOT NULL,
-            password TEXT NOT NULL
-        )
-        """)
-
-        # ✅ Create mentor_actions table
-        c.execute("""
-        CREATE TABLE IF NOT EXISTS mentor_actions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            email TEXT NOT NULL,
-            action TEXT NOT NULL,
-            timestamp TEXT NOT NULL,
-            details TEXT
-        )
-        """)
-        # Try to add 'details' if missing
-        try:
-            c.execute("ALTER TABLE mentor_actions ADD COLUMN details TEXT")
-        except sqlite3.OperationalError:
-            pass  # column already exists
-        conn.commit()
+    """Bring the schema up to date (see migrations.py)."""
+    from migrations import run_migrations
+    run_migrations()
 
 def verify_admin(email, password):
-    with sqlite3.connect(DB_PATH) as conn:
-        c = conn.cursor()
-        c.execute("SELECT * FROM admin WHERE email=? AND password=?", (email, password))
-        return c.fetchone() is not None
+    return query_one("SELECT * FROM admin WHERE email=? AND password=?", (email, password)) is not None
 
 def seed_admin():
     from os import getenv
     email = getenv("ADMIN_EMAIL")
     password = getenv("ADMIN_PASSWORD")
-    with sqlite3.connect(DB_PATH) as conn:
-        c = conn.cursor()
-        c.execute("INSERT OR IGNORE INTO admin (email, password) VALUES (?, ?)", (email, password))
-        conn.commit()
+    execute("INSERT OR IGNORE INTO admin (email, password) VALUES (?, ?)", (email, password))
 
 def log_mentor_action(email, action, details=None):
-    with sqlite3.connect(DB_PATH) as conn:
-        c = conn.cursor()
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS mentor_actions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT NOT NULL,
-                action TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                details TEXT
-            )
-        """)
-        c.execute("""
+    log_mentor_actions([(email, action, details)])
+
+def log_mentor_actions(actions):
+    """Insert (email, action, details) rows and their stats in one transaction."""
+    from services.admin_stats import record_mentor_actions
+    from services.change_events import record_events
+    timestamp = datetime.utcnow().isoformat()
+    rows = [(email, action, timestamp, details) for email, action, details in actions]
+    with transaction() as conn:
+        conn.executemany("""
             INSERT INTO mentor_actions (email, action, timestamp, details)
             VALUES (?, ?, ?, ?)
-        """, (email, action, datetime.utcnow().isoformat(), details))
-        conn.commit()
+        """, rows)
+        record_mentor_actions(conn, [(email, action, ts) for email, action, ts, _ in rows])
+        record_events(conn, [
+            ("mentor_action", {"email": email, "action": action, "timestamp": ts, "details": details})
+            for email, action, ts, details in rows
+        ])
@@ -1,42 +1,10 @@
 # db_schema.py
+# Creates / upgrades admin_data.db without touching existing data.
+# The schema itself lives in migrations.py.
 
+from db import DB_PATH
+from migrations import run_migrations, current_version
 
-import sqlite3
-import os
+run_migrations()
 
-DB_PATH = os.path.join(os.path.dirname(__file__), "admin_data.db")
-
-conn = sqlite3.connect(DB_PATH)
-cur = conn.cursor()
-
-
-cur.execute("DROP TABLE IF EXISTS admin_submissions")
-
-
-cur.execute("""
-CREATE TABLE admin_submissions (
-    id TEXT PRIMARY KEY,
-    name TEXT,
-    email TEXT,
-    phone TEXT,
-    industry TEXT,
-    academicStanding TEXT,
-    lookingFor TEXT,
-    resume TEXT,
-    howTheyHeard TEXT,
-    availability TEXT,
-    timeline TEXT,
-    otherInfo TEXT,
-    submitted TEXT,
-    status TEXT,
-    pickedBy TEXT,
-    updated_at TEXT,
-    pickedByEmail TEXT,
-    event_id TEXT
-)
-""")
-
-conn.commit()
-conn.close()
-
-print(f"✅ SQLite DB initialized at {DB_PATH} with admin_submissions table.")
+print(f"✅ SQLite DB initialized at {DB_PATH} (schema version {current_version()}).")
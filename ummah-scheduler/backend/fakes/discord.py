@@ -0,0 +1,101 @@
+# ummah-scheduler/backend/fakes/discord.py
+"""
+In-process fake of Discord webhooks for local runs and tests.
+
+Accepts POST /api/webhooks/<id>/<token> like Discord does, keeps each
+webhook's rate-limit bucket (X-RateLimit-* headers, 429 with retry_after
+once it is spent) and records every delivered message.
+
+    fake = FakeDiscord(bucket_size=5, reset_after=2.0).start()
+    # DISCORD_WEBHOOK_PREFIX=fake.prefix, DISCORD_LAW_WEBHOOK=fake.webhook_url("law")
+    fake.messages["law"]  # [payload, ...]
+    fake.stop()
+"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeDiscord:
+    def __init__(self, latency=0.0, error_rate=0.0, bucket_size=5, reset_after=2.0):
+        self.latency = latency        # seconds added to every request
+        self.error_rate = error_rate  # share of requests answered with HTTP 500
+        self.bucket_size = bucket_size
+        self.reset_after = reset_after
+        self.messages = {}            # { webhook name: [payload] }
+        self.rate_limited = 0         # 429s sent
+        self._buckets = {}            # { webhook name: (remaining, reset_at) }
+        self._lock = threading.Lock()
+        self._server = None
+
+    def start(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                parts = self.path.split("?", 1)[0].strip("/").split("/")
+                if len(parts) != 4 or parts[:2] != ["api", "webhooks"]:
+                    return self._reply(404, {"message": "Unknown Webhook", "code": 10015})
+                if fake.latency:
+                    time.sleep(fake.latency)
+                if fake.error_rate and random.random() < fake.error_rate:
+                    return self._reply(500, {"message": "Internal Server Error"})
+                status, payload, headers = fake.deliver(parts[2], json.loads(body or b"{}"))
+                self._reply(status, payload, headers)
+
+            def _reply(self, status, payload, headers=None):
+                raw = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(raw)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def prefix(self):
+        return f"http://127.0.0.1:{self._server.server_port}/api/webhooks/"
+
+    def webhook_url(self, name):
+        return f"{self.prefix}{name}/fake-token"
+
+    def deliver(self, name, payload):
+        """(status, body, headers) for one message, charging the webhook's bucket."""
+        now = time.monotonic()
+        with self._lock:
+            remaining, reset_at = self._buckets.get(name, (self.bucket_size, now + self.reset_after))
+            if now >= reset_at:
+                remaining, reset_at = self.bucket_size, now + self.reset_after
+            if remaining <= 0:
+                self.rate_limited += 1
+                retry_after = round(reset_at - now, 3)
+                return 429, {"message": "You are being rate limited.", "retry_after": retry_after, "global": False}, {
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset-After": str(retry_after),
+                }
+            remaining -= 1
+            self._buckets[name] = (remaining, reset_at)
+            self.messages.setdefault(name, []).append(payload)
+        headers = {
+            "X-RateLimit-Limit": str(self.bucket_size),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset-After": str(round(reset_at - now, 3)),
+        }
+        return 200, {"id": str(int(now * 1000)), "embeds": payload.get("embeds", [])}, headers
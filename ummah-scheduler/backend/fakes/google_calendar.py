@@ -0,0 +1,247 @@
+# ummah-scheduler/backend/fakes/google_calendar.py
+"""
+In-process fake of the Google Calendar API for local runs and tests.
+
+Speaks enough of the REST and batch protocols for googleapiclient:
+freeBusy.query, events.insert / events.delete on "primary" and the
+multipart/mixed batch endpoint, plus the OAuth token endpoint for
+refreshes. Each mentor is identified by their bearer token, so per-mentor
+credentials work the same as against Google.
+
+    fake = FakeGoogleCalendar().start()
+    # GOOGLE_API_ROOT_URL=fake.root_url (read by services.google_services)
+    fake.add_calendar("mentor@example.com")
+    save_credentials("mentor@example.com", fake.token_data("mentor@example.com"))
+    fake.add_busy("mentor@example.com", "2025-07-01T14:00:00Z", "2025-07-01T15:00:00Z")
+    fake.stop()
+"""
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+def _parse_time(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+
+
+def _format_time(value):
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def token_for(email):
+    """Access token the fake accepts for `email` (stable, so seeders can precompute it)."""
+    return f"fake-token-{email}"
+
+
+def token_data(email, root_url):
+    """Token dict in the shape credential_store keeps (no expiry, so never refreshed)."""
+    return {
+        "token": token_for(email),
+        "refresh_token": f"refresh-{email}",
+        "token_uri": f"{root_url}token",
+        "client_id": "fake-client",
+        "client_secret": "fake-secret",
+        "scopes": ["https://www.googleapis.com/auth/calendar"],
+    }
+
+
+class FakeGoogleCalendar:
+    def __init__(self, latency=0.0, error_rate=0.0):
+        self.latency = latency        # seconds added to every HTTP round trip
+        self.error_rate = error_rate  # share of round trips answered with HTTP 503
+        self.busy = {}          # { email: [(start, end)] } as aware datetimes
+        self.events = {}        # { email: { event_id: event } }
+        self.calls = []         # (method, path) of every request, batch parts included
+        self.http_requests = 0  # HTTP round trips (a batch counts once)
+        self._tokens = {}       # { token: email }
+        self._lock = threading.Lock()
+        self._server = None
+
+    # ---------------------------
+    # Calendars
+    # ---------------------------
+    def add_calendar(self, email):
+        token = token_for(email)
+        with self._lock:
+            self._tokens[token] = email
+            self.busy.setdefault(email, [])
+            self.events.setdefault(email, {})
+        return token
+
+    def token_data(self, email):
+        self.add_calendar(email)
+        return token_data(email, self.root_url)
+
+    def add_busy(self, email, start, end):
+        with self._lock:
+            self.busy.setdefault(email, []).append((_parse_time(start), _parse_time(end)))
+
+    def add_busy_pattern(self, email, start, days=7, meetings_per_day=4, minutes=60, first_hour=13):
+        """Fill `days` from `start` with meetings every 2 hours from first_hour (UTC)."""
+        day0 = _parse_time(start).replace(hour=0, minute=0, second=0, microsecond=0)
+        for day in range(days):
+            for n in range(meetings_per_day):
+                begin = day0 + timedelta(days=day, hours=first_hour + 2 * n)
+                self.add_busy(email, _format_time(begin), _format_time(begin + timedelta(minutes=minutes)))
+
+    # ---------------------------
+    # Server
+    # ---------------------------
+    def start(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body, content_type="application/json"):
+                data = body if isinstance(body, bytes) else json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _dispatch(self, method):
+                if fake.latency:
+                    time.sleep(fake.latency)
+                with fake._lock:
+                    fake.http_requests += 1
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if fake.error_rate and random.random() < fake.error_rate:
+                    return self._reply(503, {"error": {"code": 503, "message": "Backend Error"}})
+                path = self.path.split("?", 1)[0]
+                if path == "/token":
+                    status, payload = fake._token(body)
+                    return self._reply(status, payload)
+                if path.rstrip("/").endswith("/batch/calendar/v3"):
+                    status, payload, content_type = fake._batch(self.headers.get("Content-Type"), body)
+                    return self._reply(status, payload, content_type)
+                status, payload = fake.handle(method, self.path, self.headers.get("Authorization"), body)
+                self._reply(status, payload)
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def do_DELETE(self):
+                self._dispatch("DELETE")
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def root_url(self):
+        return f"http://127.0.0.1:{self._server.server_port}/"
+
+    # ---------------------------
+    # REST
+    # ---------------------------
+    def handle(self, method, path, authorization, body):
+        """(status, json body) for one Calendar REST call."""
+        path = path.split("?", 1)[0]
+        with self._lock:
+            self.calls.append((method, path))
+            email = self._tokens.get((authorization or "").replace("Bearer ", "", 1))
+        if email is None:
+            return 401, {"error": {"code": 401, "message": "Invalid Credentials"}}
+
+        if method == "POST" and path.endswith("/freeBusy"):
+            return 200, self._freebusy(email, json.loads(body or b"{}"))
+        match = re.search(r"/calendars/([^/]+)/events(?:/([^/]+))?$", path)
+        if match and method == "POST" and not match.group(2):
+            return 200, self._insert_event(email, json.loads(body or b"{}"))
+        if match and method == "DELETE" and match.group(2):
+            with self._lock:
+                event = self.events.get(email, {}).pop(match.group(2), None)
+            return (204, b"") if event else (404, {"error": {"code": 404, "message": "Not Found"}})
+        return 404, {"error": {"code": 404, "message": f"Unsupported {method} {path}"}}
+
+    def _token(self, body):
+        """OAuth refresh: a known refresh token gets the calendar's access token back."""
+        refresh_token = parse_qs(body.decode()).get("refresh_token", [""])[0]
+        email = refresh_token.replace("refresh-", "", 1)
+        with self._lock:
+            known = token_for(email) in self._tokens
+        if not known:
+            return 400, {"error": "invalid_grant", "error_description": "Token has been expired or revoked."}
+        return 200, {"access_token": token_for(email), "expires_in": 3599, "token_type": "Bearer"}
+
+    def _freebusy(self, email, body):
+        time_min, time_max = _parse_time(body["timeMin"]), _parse_time(body["timeMax"])
+        calendars = {}
+        for item in body.get("items", []):
+            calendar_id = item["id"]
+            owner = email if calendar_id == "primary" else calendar_id
+            with self._lock:
+                intervals = self.busy.get(owner)
+            if intervals is None:
+                calendars[calendar_id] = {"busy": [], "errors": [{"domain": "global", "reason": "notFound"}]}
+                continue
+            calendars[calendar_id] = {"busy": [
+                {"start": _format_time(max(start, time_min)), "end": _format_time(min(end, time_max))}
+                for start, end in sorted(intervals)
+                if start < time_max and end > time_min
+            ]}
+        return {
+            "kind": "calendar#freeBusy",
+            "timeMin": body["timeMin"],
+            "timeMax": body["timeMax"],
+            "calendars": calendars,
+        }
+
+    def _insert_event(self, email, event):
+        event_id = uuid.uuid4().hex
+        start = _parse_time(event["start"]["dateTime"])
+        end = _parse_time(event["end"]["dateTime"])
+        created = {**event, "id": event_id, "htmlLink": f"https://calendar.example/{event_id}"}
+        with self._lock:
+            self.events.setdefault(email, {})[event_id] = created
+            self.busy.setdefault(email, []).append((start, end))
+        return created
+
+    # ---------------------------
+    # Batch (multipart/mixed of application/http parts)
+    # ---------------------------
+    def _batch(self, content_type, body):
+        message = BytesParser().parsebytes(b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body)
+        boundary = f"batch_{uuid.uuid4().hex}"
+        out = []
+        for part in message.get_payload():
+            status, payload = self._batch_part(part.get_payload(decode=True) or part.get_payload().encode())
+            data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+            out.append(
+                f"--{boundary}\r\n"
+                f"Content-Type: application/http\r\n"
+                f"Content-ID: <response-{part['Content-ID'][1:-1]}>\r\n\r\n"
+                f"HTTP/1.1 {status} {'OK' if status < 300 else 'Error'}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n\r\n".encode() + data + b"\r\n"
+            )
+        payload = b"".join(out) + f"--{boundary}--\r\n".encode()
+        return 200, payload, f"multipart/mixed; boundary={boundary}"
+
+    def _batch_part(self, raw):
+        head, _, body = raw.replace(b"\r\n", b"\n").partition(b"\n\n")
+        lines = head.decode().split("\n")
+        method, path = lines[0].split(" ")[:2]
+        headers = dict(line.split(": ", 1) for line in lines[1:] if ": " in line)
+        authorization = next((v for k, v in headers.items() if k.lower() == "authorization"), None)
+        return self.handle(method, path, authorization, body.rstrip(b"\n"))
+
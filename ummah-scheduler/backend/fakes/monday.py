@@ -0,0 +1,211 @@
+# ummah-scheduler/backend/fakes/monday.py
+"""
+In-process fake of the Monday.com API for local runs and tests.
+
+Serves the GraphQL calls services.monday_poll makes (items_page with
+rules / order_by, next_items_page cursors, items(ids:)) from an in-memory
+board, and can drive the webhook receiver with the same payloads Monday
+sends (challenge handshake, create_pulse, update_column_value, ...).
+
+    fake = FakeMonday().start()
+    monday_poll.MONDAY_API = fake.url          # or MONDAY_API_URL=fake.url
+    item = fake.add_item("Aisha", industry="Law", email="a@example.com")
+    fake.send_event(client_or_url, "create_pulse", item["id"])
+    fake.stop()
+"""
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Friendly names -> board column ids, shared with the parser so the two never drift
+from services.monday_parser import MONDAY_COLUMN_MAP
+
+
+
+def _now():
+    return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class FakeMonday:
+    def __init__(self, board_id="1", latency=0.0, error_rate=0.0, webhook_secret=None):
+        self.board_id = board_id
+        self.webhook_secret = webhook_secret  # sent as ?secret= to a test client receiver
+        self.latency = latency        # seconds added to every request
+        self.error_rate = error_rate  # share of requests answered with HTTP 500
+        self.items = {}      # { id: raw item }
+        self.calls = []      # GraphQL queries received, in order
+        self._cursors = {}   # { cursor: (remaining items) }
+        self._next_id = 1000
+        self._lock = threading.Lock()
+        self._server = None
+
+    # ---------------------------
+    # Board contents
+    # ---------------------------
+    def add_item(self, name, created_at=None, **columns):
+        with self._lock:
+            self._next_id += 1
+            item_id = str(self._next_id)
+            created_at = created_at or _now()
+            self.items[item_id] = {
+                "id": item_id,
+                "name": name,
+                "state": "active",
+                "created_at": created_at,
+                "updated_at": created_at,
+                "column_values": [],
+            }
+        return self.update_item(item_id, updated_at=created_at, **columns)
+
+    def update_item(self, item_id, updated_at=None, **columns):
+        with self._lock:
+            item = self.items[str(item_id)]
+            values = {c["id"]: c for c in item["column_values"]}
+            for name, text in columns.items():
+                column_id = MONDAY_COLUMN_MAP.get(name, name)
+                values[column_id] = {"id": column_id, "text": text, "value": json.dumps(text)}
+            item["column_values"] = list(values.values())
+            item["updated_at"] = updated_at or _now()
+            return item
+
+    def delete_item(self, item_id):
+        with self._lock:
+            self.items.pop(str(item_id), None)
+
+    def archive_item(self, item_id):
+        """Archived items are still returned by items(ids:), with state "archived"."""
+        with self._lock:
+            self.items[str(item_id)]["state"] = "archived"
+
+    # ---------------------------
+    # Server
+    # ---------------------------
+    def start(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                if fake.latency:
+                    time.sleep(fake.latency)
+                if fake.error_rate and random.random() < fake.error_rate:
+                    self.send_response(500)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                try:
+                    payload = {"data": fake.handle(body.get("query", ""), body.get("variables") or {})}
+                except ValueError as e:
+                    payload = {"errors": [{"message": str(e)}]}
+                raw = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_port}/v2"
+
+    # ---------------------------
+    # GraphQL
+    # ---------------------------
+    def handle(self, query, variables):
+        with self._lock:
+            self.calls.append(query)
+            shape = self._projection(query)
+            if "next_items_page" in query:
+                return {"next_items_page": self._page(variables["cursor"], variables.get("limit", 25), shape)}
+            if "items_page" in query:
+                items = self._select(variables.get("queryParams") or {})
+                cursor = self._store(items)
+                return {"boards": [{"items_page": self._page(cursor, variables.get("limit", 25), shape)}]}
+            match = re.search(r"items\s*\(\s*ids", query)
+            if match:
+                ids = [str(i) for i in variables.get("ids", [])]
+                return {"items": [shape(self.items[i]) for i in ids if i in self.items]}
+        raise ValueError("Unsupported query")
+
+    @staticmethod
+    def _projection(query):
+        """Honour column_values(ids: [...]) and drop `value` unless it was selected."""
+        match = re.search(r"column_values\s*(?:\(\s*ids\s*:\s*(\[[^\]]*\])\s*\))?\s*\{([^}]*)\}", query)
+        if not match:
+            return dict
+        wanted = set(json.loads(match.group(1))) if match.group(1) else None
+        fields = match.group(2).split()
+
+        def shape(item):
+            columns = [
+                {key: column[key] for key in fields if key in column}
+                for column in item["column_values"]
+                if wanted is None or column["id"] in wanted
+            ]
+            return {**item, "column_values": columns}
+        return shape
+
+    def _select(self, query_params):
+        items = [item for item in self.items.values() if item.get("state", "active") == "active"]
+        for rule in query_params.get("rules", []):
+            field = {"__creation_log__": "created_at", "__last_updated__": "updated_at"}[rule["column_id"]]
+            day = rule["compare_value"][1]
+            items = [item for item in items if item[field][:10] >= day]
+        order = (query_params.get("order_by") or [{"column_id": "__creation_log__", "direction": "asc"}])[0]
+        field = {"__creation_log__": "created_at", "__last_updated__": "updated_at"}[order["column_id"]]
+        items.sort(key=lambda item: (item[field], int(item["id"])), reverse=order["direction"] == "desc")
+        return items
+
+    def _store(self, items):
+        cursor = f"cursor-{len(self._cursors) + 1}"
+        self._cursors[cursor] = items
+        return cursor
+
+    def _page(self, cursor, limit, shape=dict):
+        remaining = self._cursors.pop(cursor, None)
+        if remaining is None:
+            raise ValueError("CursorExpiredError")
+        page, rest = remaining[:limit], remaining[limit:]
+        return {"cursor": self._store(rest) if rest else None, "items": [shape(item) for item in page]}
+
+    # ---------------------------
+    # Webhooks
+    # ---------------------------
+    def event_payload(self, event_type, item_id):
+        return {"event": {
+            "type": event_type,
+            "pulseId": int(item_id),
+            "boardId": int(self.board_id),
+            "triggerTime": _now(),
+        }}
+
+    def send_challenge(self, target, challenge="fake-challenge"):
+        return self._deliver(target, {"challenge": challenge})
+
+    def send_event(self, target, event_type, item_id):
+        return self._deliver(target, self.event_payload(event_type, item_id))
+
+    def _deliver(self, target, payload):
+        """`target` is a receiver URL or a Flask test client (posts to /api/monday/webhook)."""
+        if isinstance(target, str):
+            return requests.post(target, json=payload, timeout=10)
+        return target.post("/api/monday/webhook", query_string={"secret": self.webhook_secret or ""}, json=payload)
@@ -0,0 +1,21 @@
+# ummah-scheduler/backend/gunicorn.conf.py
+"""
+Production gunicorn settings, picked up automatically when gunicorn is
+started from backend/:
+
+    cd backend
+    gunicorn app:app
+
+Workers are threaded (gthread), so a long request such as an open
+/api/events stream (SSE_ENABLED=true) ties up one thread rather than a
+whole worker. Keep GUNICORN_THREADS comfortably above the number of
+browser tabs expected to hold a stream open per worker.
+"""
+import os
+
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '5000')}")
+workers = int(os.getenv("GUNICORN_WORKERS", "2"))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "16"))
+# gthread workers heartbeat independently of requests, so streams don't trip this
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
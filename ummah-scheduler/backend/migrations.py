@@ -0,0 +1,560 @@
+# backend/migrations.py
+"""
+Versioned schema migrations for admin_data.db.
+
+Each migration runs once, in order, inside its own transaction and is
+recorded in the schema_version table. Add new migrations to the end of
+MIGRATIONS; never edit one that has already shipped.
+
+    python migrations.py            # apply pending migrations
+    python migrations.py --check    # also verify hot queries use indexes
+"""
+import sys
+from datetime import datetime
+
+from db import DB_PATH, get_connection, query_all, query_value, transaction
+
+
+def _columns(conn, table):
+    return {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def _add_missing_columns(conn, table, columns):
+    existing = _columns(conn, table)
+    for name, decl in columns:
+        if name not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+
+
+# ---------------------------
+# Migrations
+# ---------------------------
+def m001_base_schema(conn):
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS admin (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        email TEXT UNIQUE NOT NULL,
+        password TEXT NOT NULL
+    )
+    """)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS mentor_actions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        email TEXT NOT NULL,
+        action TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        details TEXT
+    )
+    """)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS admin_submissions (
+        id TEXT PRIMARY KEY,
+        name TEXT,
+        email TEXT,
+        phone TEXT,
+        industry TEXT,
+        academicStanding TEXT,
+        lookingFor TEXT,
+        resume TEXT,
+        howTheyHeard TEXT,
+        availability TEXT,
+        timeline TEXT,
+        otherInfo TEXT,
+        submitted TEXT,
+        status TEXT,
+        pickedBy TEXT,
+        pickedByEmail TEXT,
+        event_id TEXT,
+        updated_at TEXT
+    )
+    """)
+    # Older databases predate these columns
+    _add_missing_columns(conn, "mentor_actions", [("details", "TEXT")])
+    _add_missing_columns(conn, "admin_submissions", [
+        ("pickedByEmail", "TEXT"),
+        ("event_id", "TEXT"),
+        ("updated_at", "TEXT"),
+    ])
+
+
+def m002_monday_mirror(conn):
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS monday_items (
+        id TEXT PRIMARY KEY,
+        name TEXT,
+        email TEXT,
+        phone TEXT,
+        industry TEXT,
+        academicStanding TEXT,
+        lookingFor TEXT,
+        resume TEXT,
+        howTheyHeard TEXT,
+        availability TEXT,
+        timeline TEXT,
+        otherInfo TEXT,
+        submitted TEXT,
+        status TEXT,
+        synced_at TEXT NOT NULL
+    )
+    """)
+    # Cursor, watermark and lease bookkeeping for services.monday_sync
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS monday_sync_state (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )
+    """)
+
+
+def m003_list_indexes(conn):
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_admin_submissions_status_submitted
+        ON admin_submissions(status, submitted)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_admin_submissions_submitted
+        ON admin_submissions(submitted)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_admin_submissions_picked_by_email
+        ON admin_submissions(pickedByEmail)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_mentor_actions_email_timestamp
+        ON mentor_actions(email, timestamp)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_mentor_actions_timestamp
+        ON mentor_actions(timestamp)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_monday_items_submitted
+        ON monday_items(submitted)
+    """)
+
+
+def m004_keyset_indexes(conn):
+    # Keyset pagination orders by (submitted, id); include id so ties need no sort
+    conn.execute("DROP INDEX IF EXISTS idx_admin_submissions_submitted")
+    conn.execute("DROP INDEX IF EXISTS idx_admin_submissions_status_submitted")
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_admin_submissions_submitted_id
+        ON admin_submissions(submitted, id)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_admin_submissions_status_submitted_id
+        ON admin_submissions(status, submitted, id)
+    """)
+
+
+def m005_stats_tables(conn):
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS stats_submission_counts (
+        dimension TEXT NOT NULL,
+        key TEXT NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (dimension, key)
+    )
+    """)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS stats_mentor_daily (
+        email TEXT NOT NULL,
+        day TEXT NOT NULL,
+        action TEXT NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (email, day, action)
+    )
+    """)
+    # Backfilled by m014, which reshapes stats_submission_counts
+
+
+def m006_sqlite_status_store(conn):
+    # One-shot import of the legacy data/submissions.json status file;
+    # save-status writes SQLite only from here on
+    from migrate_json_to_sqlite import import_legacy_submissions, load_legacy_submissions
+
+    # Stats for the imported rows are backfilled by m014
+    submissions = load_legacy_submissions()
+    if submissions:
+        import_legacy_submissions(conn, submissions, overwrite=False)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_monday_items_status
+        ON monday_items(status)
+    """)
+
+
+def m007_mentor_credentials(conn):
+    # Shared by all workers; replaces the per-process mentor_tokens dict
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS mentor_credentials (
+        email TEXT PRIMARY KEY,
+        token_json TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    """)
+
+
+def m008_jobs(conn):
+    # Background job state for services.job_queue (polled from any worker)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS jobs (
+        id TEXT PRIMARY KEY,
+        kind TEXT NOT NULL,
+        status TEXT NOT NULL,
+        payload_json TEXT,
+        result_json TEXT,
+        error TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    """)
+
+
+def m009_discord_ledger(conn):
+    # (item, channel) pairs already announced by the Monday webhook receiver
+    from services.discord_notify import LEDGER_SCHEMA
+    for statement in LEDGER_SCHEMA:
+        conn.execute(statement)
+
+
+def m010_change_events(conn):
+    # Feed for the /api/events stream (see services.change_events)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS change_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        type TEXT NOT NULL,
+        payload_json TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    )
+    """)
+
+
+# Tables whose writes bump data_versions (ETags, response caches)
+VERSIONED_TABLES = ["admin_submissions", "monday_items", "mentor_actions"]
+
+
+def m011_data_versions(conn):
+    # Per-table write counters kept by triggers: an O(1) "has it changed?" check
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS data_versions (
+        name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0
+    )
+    """)
+    for table in VERSIONED_TABLES:
+        conn.execute("INSERT OR IGNORE INTO data_versions (name, version) VALUES (?, 0)", (table,))
+        for op in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_version_{op.lower()}
+                AFTER {op} ON {table}
+                BEGIN
+                    UPDATE data_versions SET version = version + 1 WHERE name = '{table}';
+                END
+            """)
+
+
+# Columns of admin_submissions indexed for /api/submissions/search
+SEARCH_COLUMNS = ["name", "email", "industry", "lookingFor", "otherInfo", "academicStanding"]
+
+
+def m012_submission_search(conn):
+    # External-content FTS5 index: rows live in admin_submissions only and the
+    # triggers keep the index in step by rowid. Run
+    # services.submission_search.rebuild_index() after a VACUUM (which may
+    # renumber rowids of tables without an INTEGER PRIMARY KEY).
+    columns = ", ".join(SEARCH_COLUMNS)
+    new_values = ", ".join(f"new.{c}" for c in SEARCH_COLUMNS)
+    old_values = ", ".join(f"old.{c}" for c in SEARCH_COLUMNS)
+    changed = " OR ".join(f"old.{c} IS NOT new.{c}" for c in SEARCH_COLUMNS)
+    conn.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS admin_submissions_fts USING fts5(
+            {columns},
+            content='admin_submissions',
+            content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_admin_submissions_fts_insert
+        AFTER INSERT ON admin_submissions
+        BEGIN
+            INSERT INTO admin_submissions_fts (rowid, {columns}) VALUES (new.rowid, {new_values});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_admin_submissions_fts_delete
+        AFTER DELETE ON admin_submissions
+        BEGIN
+            INSERT INTO admin_submissions_fts (admin_submissions_fts, rowid, {columns})
+            VALUES ('delete', old.rowid, {old_values});
+        END
+    """)
+    # Status/pickedBy/event_id writes don't touch the index
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_admin_submissions_fts_update
+        AFTER UPDATE OF {columns} ON admin_submissions
+        WHEN {changed}
+        BEGIN
+            INSERT INTO admin_submissions_fts (admin_submissions_fts, rowid, {columns})
+            VALUES ('delete', old.rowid, {old_values});
+            INSERT INTO admin_submissions_fts (rowid, {columns}) VALUES (new.rowid, {new_values});
+        END
+    """)
+    conn.execute("INSERT INTO admin_submissions_fts (admin_submissions_fts) VALUES ('rebuild')")
+
+
+def _tag_rows_sql(row, field, table=None):
+    # Split a ", "-joined dropdown text into trimmed values inside SQL
+    # (json_quote keeps the JSON valid whatever the text contains); same
+    # rules as services.monday_parser.split_values
+    source = f"{table} {row}, " if table else ""
+    return f"""
+        SELECT DISTINCT {row}.id, '{field}', trim(j.value)
+        FROM {source}json_each(
+            '[' || replace(json_quote(COALESCE({row}.{field}, '')), ',', '","') || ']'
+        ) j
+        WHERE trim(j.value) NOT IN ('', 'N/A')
+    """
+
+
+def m013_submission_tags(conn):
+    # Junction table for the multi-valued dropdowns of mirrored items, so
+    # /api/mentor-queue finds an industry's submissions by index lookup
+    from services.monday_parser import MULTI_VALUE_FIELDS
+
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS submission_tags (
+        field TEXT NOT NULL,
+        value TEXT NOT NULL COLLATE NOCASE,
+        item_id TEXT NOT NULL,
+        PRIMARY KEY (field, value, item_id)
+    ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_submission_tags_item_id ON submission_tags(item_id)")
+
+    insert_new = "\n".join(
+        f"INSERT OR IGNORE INTO submission_tags (item_id, field, value) {_tag_rows_sql('new', f)};"
+        for f in MULTI_VALUE_FIELDS
+    )
+    changed = " OR ".join(f"old.{f} IS NOT new.{f}" for f in MULTI_VALUE_FIELDS)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_monday_items_tags_insert
+        AFTER INSERT ON monday_items
+        BEGIN
+            {insert_new}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_monday_items_tags_update
+        AFTER UPDATE OF {", ".join(MULTI_VALUE_FIELDS)} ON monday_items
+        WHEN {changed}
+        BEGIN
+            DELETE FROM submission_tags WHERE item_id = old.id;
+            {insert_new}
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_monday_items_tags_delete
+        AFTER DELETE ON monday_items
+        BEGIN
+            DELETE FROM submission_tags WHERE item_id = old.id;
+        END
+    """)
+    for field in MULTI_VALUE_FIELDS:
+        conn.execute(
+            f"INSERT OR IGNORE INTO submission_tags (item_id, field, value) "
+            f"{_tag_rows_sql('m', field, table='monday_items')}"
+        )
+
+
+def m014_daily_submission_counts(conn):
+    # Counters per submission day, so a date range filters every figure
+    conn.execute("DROP TABLE IF EXISTS stats_submission_counts")
+    conn.execute("""
+    CREATE TABLE stats_submission_counts (
+        dimension TEXT NOT NULL,
+        key TEXT NOT NULL,
+        day TEXT NOT NULL DEFAULT '',
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (dimension, day, key)
+    ) WITHOUT ROWID
+    """)
+    # Backfilled by m018, which replaces this table
+
+
+def m015_separate_credentials_db(conn):
+    # Move mentor tokens out of admin_data.db (tracked in git) into the
+    # attached, untracked credentials database
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS credentials.mentor_credentials (
+        email TEXT PRIMARY KEY,
+        token_json TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    """)
+    conn.execute("""
+        INSERT OR REPLACE INTO credentials.mentor_credentials (email, token_json, updated_at)
+        SELECT email, token_json, updated_at FROM main.mentor_credentials
+    """)
+    conn.execute("DROP TABLE main.mentor_credentials")
+
+
+def m016_jobs_sweep_index(conn):
+    # services.job_queue.sweep_jobs: stale and expired jobs by status and age
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_jobs_status_updated_at
+        ON jobs(status, updated_at)
+    """)
+
+
+def m017_monday_sync_seen(conn):
+    # services.monday_sync: ids returned by the current full board walk, so
+    # the reconcile at its end can drop items deleted or archived on Monday
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS monday_sync_seen (
+        id TEXT PRIMARY KEY
+    ) WITHOUT ROWID
+    """)
+
+
+def m018_submission_stats_cube(conn):
+    # Counters per (day, status, mentor, industry set) covering untouched
+    # mirror rows too, so every statistics filter is a GROUP BY over them
+    conn.execute("DROP TABLE IF EXISTS stats_submission_counts")
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS stats_submission_daily (
+        day TEXT NOT NULL DEFAULT '',
+        status TEXT NOT NULL,
+        mentor TEXT NOT NULL DEFAULT '',
+        industries TEXT NOT NULL DEFAULT '',
+        count INTEGER NOT NULL DEFAULT 0,
+        turnaround_seconds INTEGER NOT NULL DEFAULT 0,
+        turnaround_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, status, mentor, industries)
+    ) WITHOUT ROWID
+    """)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS stats_industry_sets (
+        industries TEXT NOT NULL,
+        industry TEXT NOT NULL,
+        PRIMARY KEY (industry, industries)
+    ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_stats_mentor_daily_day
+        ON stats_mentor_daily(day)
+    """)
+    from services.admin_stats import rebuild_stats
+    rebuild_stats(conn)
+
+
+MIGRATIONS = [
+    (1, "base schema", m001_base_schema),
+    (2, "monday.com mirror tables", m002_monday_mirror),
+    (3, "indexes for list endpoints", m003_list_indexes),
+    (4, "keyset pagination indexes", m004_keyset_indexes),
+    (5, "admin statistics aggregate tables", m005_stats_tables),
+    (6, "sqlite-only status store", m006_sqlite_status_store),
+    (7, "mentor credential store", m007_mentor_credentials),
+    (8, "background jobs", m008_jobs),
+    (9, "discord notification ledger", m009_discord_ledger),
+    (10, "change event feed", m010_change_events),
+    (11, "table version counters", m011_data_versions),
+    (12, "submission full-text search", m012_submission_search),
+    (13, "multi-value submission tags", m013_submission_tags),
+    (14, "per-day submission stats", m014_daily_submission_counts),
+    (15, "mentor credentials in a separate database", m015_separate_credentials_db),
+    (16, "job sweep index", m016_jobs_sweep_index),
+    (17, "monday reconcile scratch table", m017_monday_sync_seen),
+    (18, "submission stats by day, status, mentor and industries", m018_submission_stats_cube),
+]
+
+
+# ---------------------------
+# Runner
+# ---------------------------
+def current_version():
+    get_connection().execute("""
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        applied_at TEXT NOT NULL
+    )
+    """)
+    return query_value("SELECT MAX(version) FROM schema_version", default=0)
+
+
+def run_migrations():
+    """Apply every pending migration once. Safe to call from several workers."""
+    applied = []
+    for version, name, migrate in MIGRATIONS:
+        if version <= current_version():
+            continue
+        with transaction() as conn:
+            # Re-check under the write lock: another worker may have won the race
+            done = conn.execute("SELECT 1 FROM schema_version WHERE version = ?", (version,)).fetchone()
+            if done:
+                continue
+            migrate(conn)
+            conn.execute(
+                "INSERT INTO schema_version (version, name, applied_at) VALUES (?, ?, ?)",
+                (version, name, datetime.utcnow().isoformat())
+            )
+        applied.append(version)
+        print(f"🗄️ Applied migration {version:03d}: {name}")
+    return applied
+
+
+# ---------------------------
+# Query plan checks
+# ---------------------------
+# Hot queries and the index each one must use (no full scan / temp sort)
+QUERY_PLAN_CHECKS = [
+    ("SELECT * FROM admin_submissions ORDER BY submitted DESC, id DESC",
+     "idx_admin_submissions_submitted_id"),
+    ("SELECT * FROM admin_submissions WHERE status = 'To Do' ORDER BY submitted DESC, id DESC",
+     "idx_admin_submissions_status_submitted_id"),
+    ("SELECT * FROM admin_submissions WHERE pickedByEmail = 'a@b.c'",
+     "idx_admin_submissions_picked_by_email"),
+    ("SELECT * FROM mentor_actions WHERE (timestamp, id) < ('2025', 1) ORDER BY timestamp DESC, id DESC",
+     "idx_mentor_actions_timestamp"),
+    ("SELECT * FROM mentor_actions WHERE email = 'a@b.c' AND (timestamp, id) < ('2025', 1) "
+     "ORDER BY timestamp DESC, id DESC",
+     "idx_mentor_actions_email_timestamp"),
+    ("SELECT item_id FROM submission_tags WHERE field = 'industry' AND value IN ('Finance', 'Business')",
+     "PRIMARY KEY"),
+    ("SELECT day, status, mentor, SUM(count) FROM stats_submission_daily WHERE day >= '2025-01-01' "
+     "GROUP BY day, status, mentor",
+     "PRIMARY KEY"),
+    ("SELECT industries FROM stats_industry_sets WHERE industry IN ('Finance', 'Law')",
+     "PRIMARY KEY"),
+    ("SELECT email, day, action, count FROM stats_mentor_daily WHERE day >= '2025-01-01'",
+     "idx_stats_mentor_daily_day"),
+]
+
+
+def explain(sql, params=()):
+    return [row["detail"] for row in query_all(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def check_query_plans(checks=QUERY_PLAN_CHECKS):
+    """Return a list of problems; empty when every hot query uses its index."""
+    problems = []
+    for sql, index in checks:
+        plan = explain(sql)
+        if not any(index in step for step in plan) or any("TEMP B-TREE" in step for step in plan):
+            problems.append(f"{sql}\n    expected {index}, got: {plan}")
+    return problems
+
+
+if __name__ == "__main__":
+    run_migrations()
+    print(f"✅ {DB_PATH} is at schema version {current_version()}")
+    if "--check" in sys.argv:
+        problems = check_query_plans()
+        for problem in problems:
+            print("❌", problem)
+        if problems:
+            sys.exit(1)
+        print("✅ All hot queries use their indexes")
@@ -0,0 +1,12 @@
+# rebuild_stats.py
+# Recomputes the /api/admin-stats summary tables from admin_submissions and
+# mentor_actions. Run after bulk imports or manual edits to the database.
+
+from db import DB_PATH
+from migrations import run_migrations
+from services.admin_stats import rebuild_stats
+
+run_migrations()
+keys = rebuild_stats()
+
+print(f"✅ Rebuilt admin statistics in {DB_PATH} ({keys} submission counters).")
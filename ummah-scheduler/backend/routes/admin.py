@@ -1,15 +1,22 @@
 # backend/routes/admin.py
 from flask import Blueprint, request, jsonify
-from db import verify_admin
-import os, sqlite3
+from db import verify_admin, query_all, query_one, transaction
+from services.admin_stats import get_stats, tracking_submission, tracking_submissions
+from services.pagination import (
+    InvalidCursor, decode_cursor, encode_cursor, fetch_keyset_page, paginate, parse_limit,
+)
+import json
+import os
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 from datetime import datetime
+from services.change_events import record_submission_changes
+from services.google_services import get_service
+from services.http_cache import conditional
+from services.response_cache import cache_stats
+from services.submission_search import search_submissions
 
 admin_bp = Blueprint("admin", __name__)
 
-DB_PATH = os.path.join(os.path.dirname(__file__), "..", "admin_data.db")
-
 
 # ---------------------------
 # Admin Login (legacy password)
@@ -26,33 +33,59 @@ def admin_login():
 
 
 # ---------------------------
-# Fetch Live Submissions (Internal Dashboard)
+# Fetch Mirrored Submissions (Internal Dashboard)
 # ---------------------------
 @admin_bp.route("/api/submissions", methods=["GET"])
+@conditional("admin_submissions", "monday_items")
 def list_submissions():
-    """Live Monday.com submissions merged with admin status for internal dashboard."""
+    """Mirrored Monday.com submissions merged with admin status for internal dashboard."""
     try:
-        from services.monday_poll import get_latest_items
-        items = get_latest_items(limit=50)
+        from services.monday_sync import get_submissions
+        return jsonify(get_submissions(newest_first=False))
+
+    except Exception as e:
+        print("❌ Error fetching Monday.com submissions:", e)
+        return jsonify({"error": str(e)}), 500
+
+
+# ---------------------------
+# Full-text Search
+# ---------------------------
+SEARCH_PAGE_SIZE = 50
+MAX_SEARCH_PAGE_SIZE = 200
+
 
-        # Merge admin statuses
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute("SELECT id, status, pickedBy FROM admin_submissions").fetchall()
-        conn.close()
-        status_map = {row["id"]: row for row in rows}
+@admin_bp.route("/api/submissions/search", methods=["GET"])
+@conditional("admin_submissions")
+def search_submissions_route():
+    """
+    BM25-ranked search over name, email, industry, lookingFor, otherInfo and
+    academicStanding. Every word must match, as a prefix ("eng" finds
+    "Engineering"). Paging: ?limit= (max 200) and ?cursor= from X-Next-Cursor.
+    """
+    try:
+        query = request.args.get("q", "").strip()
+        if not query:
+            return jsonify({"error": "Missing ?q="}), 400
 
-        for item in items:
-            sub_id = item["id"]
-            if sub_id in status_map:
-                db_row = status_map[sub_id]
-                item["status"] = db_row["status"]
-                item["pickedBy"] = db_row["pickedBy"]
+        limit = parse_limit(request.args.get("limit"), default=SEARCH_PAGE_SIZE, maximum=MAX_SEARCH_PAGE_SIZE)
+        offset = 0
+        if request.args.get("cursor"):
+            (offset,) = decode_cursor(request.args["cursor"], size=1)
+            if not isinstance(offset, int) or offset < 0:
+                raise InvalidCursor("Malformed cursor")
 
-        return jsonify(items)
+        rows = search_submissions(query, limit + 1, offset)
+        headers = {}
+        if len(rows) > limit:
+            rows = rows[:limit]
+            headers["X-Next-Cursor"] = encode_cursor(offset + limit)
+        return jsonify(rows), 200, headers
 
+    except InvalidCursor as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        print("❌ Error fetching Monday.com submissions:", e)
+        print("❌ Error searching submissions:", e)
         return jsonify({"error": str(e)}), 500
 
 
@@ -60,27 +93,195 @@ def list_submissions():
 # Fetch Admin-only Submissions
 # ---------------------------
 @admin_bp.route("/api/admin-submissions", methods=["GET"])
+@conditional("admin_submissions")
 def list_admin_submissions():
-    """Admin-only dashboard (SQLite entries with meeting info)."""
+    """
+    Admin-only dashboard (SQLite entries with meeting info), newest first.
+
+    Filters: ?status= (comma-separated), ?mentor=, ?industry=, ?from= / ?to= (YYYY-MM-DD).
+    Paging: ?limit= (max 1000) and ?cursor= from the previous page's X-Next-Cursor header.
+    """
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute("""
-            SELECT 
-                id, name, email, status, pickedBy, pickedByEmail, 
-                event_id, phone, industry, academicStanding,
-                availability, timeline, resume, otherInfo, submitted, updated_at
-            FROM admin_submissions
-            ORDER BY submitted DESC
-        """).fetchall()
-        conn.close()
-        return jsonify([dict(row) for row in rows])
+        where, params = [], []
+
+        statuses = [normalize_status(s) for s in request.args.get("status", "").split(",") if s.strip()]
+        if statuses:
+            where.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            params += statuses
+
+        mentor = request.args.get("mentor", "").strip()
+        if mentor:
+            where.append("(pickedByEmail = ? OR pickedBy = ?)")
+            params += [mentor, mentor]
+
+        industry = request.args.get("industry", "").strip()
+        if industry:
+            where.append("industry LIKE ?")
+            params.append(f"%{industry}%")
+
+        if request.args.get("from"):
+            where.append("submitted >= date(?)")
+            params.append(request.args["from"])
+        if request.args.get("to"):
+            where.append("submitted < date(?, '+1 day')")
+            params.append(request.args["to"])
+
+        limit = parse_limit(request.args.get("limit"))
+
+        def fetch(condition, extra_params, n, offset=0):
+            return query_all(f"""
+                SELECT 
+                    id, name, email, status, pickedBy, pickedByEmail, 
+                    event_id, phone, industry, academicStanding,
+                    availability, timeline, resume, otherInfo, submitted, updated_at
+                FROM admin_submissions
+                WHERE {" AND ".join(where + [condition])}
+                ORDER BY submitted DESC, id DESC
+                LIMIT ? OFFSET ?
+            """, params + extra_params + [n, offset])
 
+        if not request.args.get("cursor") and (request.args.get("offset") or request.args.get("page")):
+            # Legacy offset paging, still bounded by the page size
+            offset = int(request.args.get("offset") or (max(int(request.args["page"]), 1) - 1) * limit)
+            page, headers = paginate(fetch("1", [], limit + 1, offset), limit, "submitted", "id")
+        else:
+            page, headers = fetch_keyset_page(fetch, "submitted", "id", request.args.get("cursor"), limit)
+        return jsonify([dict(row) for row in page]), 200, headers
+
+    except (InvalidCursor, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         print("❌ Error fetching admin submissions:", e)
         return jsonify({"error": str(e)}), 500
 
 
+# Aliases the dashboards use for the stored status values
+STATUS_ALIASES = {
+    "todo": "To Do",
+    "to-do": "To Do",
+    "to do": "To Do",
+    "new": "To Do",
+    "pending": "To Do",
+    "in progress": "In Progress",
+    "in-progress": "In Progress",
+    "inprogress": "In Progress",
+    "done": "Done",
+    "canceled": "Canceled",
+    "cancelled": "Canceled",
+}
+
+
+def normalize_status(value):
+    value = value.strip()
+    return STATUS_ALIASES.get(value.lower(), value)
+
+
+# ---------------------------
+# Precomputed Statistics
+# ---------------------------
+@admin_bp.route("/api/admin-stats", methods=["GET"])
+@conditional("admin_submissions", "monday_items", "mentor_actions")
+def admin_stats():
+    """
+    Counts by status / industry / mentor / day and mentor actions per day.
+
+    Filters: ?from= / ?to= (YYYY-MM-DD, applied to every figure), ?status=
+    and ?industry= (comma-separated), ?mentor=.
+    """
+    try:
+        statuses = tuple(sorted({normalize_status(s) for s in request.args.get("status", "").split(",") if s.strip()}))
+        industries = tuple(sorted({i.strip() for i in request.args.get("industry", "").split(",") if i.strip()}))
+        return jsonify(get_stats(
+            request.args.get("from") or None,
+            request.args.get("to") or None,
+            statuses=statuses,
+            industries=industries,
+            mentor=request.args.get("mentor", "").strip() or None,
+        ))
+    except Exception as e:
+        print("❌ Error fetching admin stats:", e)
+        return jsonify({"error": str(e)}), 500
+
+
+# ---------------------------
+# Read Cache Counters (this worker)
+# ---------------------------
+@admin_bp.route("/api/cache-stats", methods=["GET"])
+def response_cache_stats():
+    return jsonify(cache_stats())
+
+
+# ---------------------------
+# Admin Calendar Access
+# ---------------------------
+ADMIN_TOKEN_PATH = os.path.join(os.path.dirname(__file__), "..", "credentials", "admin_token.json")
+
+# Google accepts at most 50 calls per batch request
+CALENDAR_BATCH_SIZE = 50
+MAX_CANCEL_IDS = 500
+
+_admin_creds = {}  # { "mtime": ..., "creds": Credentials }
+
+
+class AdminTokenError(RuntimeError):
+    pass
+
+
+def load_admin_credentials():
+    """Admin credentials from admin_token.json, re-read only when the file changes."""
+    if not os.path.exists(ADMIN_TOKEN_PATH):
+        raise AdminTokenError("Admin token not found. Run generate_admin_token.py first.")
+
+    mtime = os.path.getmtime(ADMIN_TOKEN_PATH)
+    if _admin_creds.get("mtime") != mtime:
+        with open(ADMIN_TOKEN_PATH, "r") as f:
+            token_data = json.load(f)
+        # ✅ Ensure refresh_token exists (requires new script with prompt='consent')
+        creds = Credentials.from_authorized_user_info(token_data)
+        if not creds.refresh_token:
+            raise AdminTokenError("Admin token missing refresh_token. Re-generate with prompt='consent'.")
+        _admin_creds.update(mtime=mtime, creds=creds)
+    return _admin_creds["creds"]
+
+
+def delete_calendar_events(calendar_service, event_ids):
+    """
+    Delete {key: event_id} through the Calendar batch endpoint, in chunks.
+    Returns {key: error message or None}. Events already gone count as deleted.
+    """
+    errors = {}
+
+    def on_response(key, response, exception):
+        status = getattr(getattr(exception, "resp", None), "status", None)
+        errors[key] = None if exception is None or status in (404, 410) else str(exception)
+
+    items = list(event_ids.items())
+    for start in range(0, len(items), CALENDAR_BATCH_SIZE):
+        chunk = items[start:start + CALENDAR_BATCH_SIZE]
+        batch = calendar_service.new_batch_http_request(callback=on_response)
+        for key, event_id in chunk:
+            batch.add(calendar_service.events().delete(
+                calendarId='primary',
+                eventId=event_id,
+                sendUpdates='all'  # Google sends official cancellation to mentor + student
+            ), request_id=key)
+        try:
+            batch.execute()
+        except Exception as e:
+            for key, _ in chunk:
+                errors.setdefault(key, str(e))
+    return errors
+
+
+def mark_canceled(conn, sub_ids):
+    conn.executemany("""
+        UPDATE admin_submissions
+        SET status = ?, updated_at = ?
+        WHERE id = ?
+    """, [("Canceled", datetime.utcnow().isoformat(), sub_id) for sub_id in sub_ids])
+    record_submission_changes(conn, sub_ids)
+
+
 # ---------------------------
 # Cancel Meeting (Admin) - Uses Admin Token
 # ---------------------------
@@ -93,48 +294,26 @@ def cancel_meeting():
         return jsonify({"error": "Missing submission ID"}), 400
 
     try:
-        # Connect to DB
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-
         # Get the submission row
-        row = cur.execute("""
+        row = query_one("""
             SELECT id, name, email, pickedByEmail, event_id
             FROM admin_submissions
             WHERE id = ?
-        """, (sub_id,)).fetchone()
+        """, (sub_id,))
 
         if not row:
-            conn.close()
             return jsonify({"error": "Submission not found"}), 404
 
         student_name = row["name"]
         event_id = row["event_id"]
 
-        # ✅ Load Admin Token (with refresh_token) from credentials/admin_token.json
-        import os, json
-        from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
+        try:
+            creds = load_admin_credentials()
+        except AdminTokenError as e:
+            return jsonify({"error": str(e)}), 500
 
-        token_path = os.path.join(
-            os.path.dirname(__file__), "..", "credentials", "admin_token.json"
-        )
-        if not os.path.exists(token_path):
-            conn.close()
-            return jsonify({"error": "Admin token not found. Run generate_admin_token.py first."}), 500
-
-        with open(token_path, "r") as f:
-            token_data = json.load(f)
-
-        # ✅ Ensure refresh_token exists (requires new script with prompt='consent')
-        creds = Credentials.from_authorized_user_info(token_data)
-        if not creds.refresh_token:
-            conn.close()
-            return jsonify({"error": "Admin token missing refresh_token. Re-generate with prompt='consent'."}), 500
-
-        # Build calendar service
-        calendar_service = build("calendar", "v3", credentials=creds)
+        # Cached calendar service (no discovery fetch / rebuild per call)
+        calendar_service = get_service("calendar", "v3", creds, identity="admin")
 
         # ✅ Delete event and trigger Google official cancellation email
         if event_id:
@@ -149,16 +328,67 @@ def cancel_meeting():
                 print(f"⚠️ Could not delete event {event_id}: {ce}")
 
         # ✅ Update SQLite status
-        cur.execute("""
-            UPDATE admin_submissions
-            SET status = ?, updated_at = ?
-            WHERE id = ?
-        """, ("Canceled", datetime.utcnow().isoformat(), sub_id))
-        conn.commit()
-        conn.close()
+        with transaction() as conn, tracking_submission(conn, sub_id):
+            mark_canceled(conn, [sub_id])
 
         return jsonify({"message": f"Meeting for {student_name} canceled."})
 
     except Exception as e:
         print("❌ Error in cancel_meeting:", e)
         return jsonify({"error": str(e)}), 500
+
+
+@admin_bp.route("/api/cancel-meetings", methods=["POST"])
+def cancel_meetings():
+    """
+    Cancel many meetings at once. Body: {"ids": [...]}.
+    Calendar deletes go out in batch requests; every status update is one
+    transaction. Returns one result per ID, in request order.
+    """
+    data = request.json or {}
+    ids = data.get("ids") if isinstance(data, dict) else data
+    if not isinstance(ids, list) or not ids:
+        return jsonify({"error": "Expected a non-empty list of ids"}), 400
+    if len(ids) > MAX_CANCEL_IDS:
+        return jsonify({"error": f"At most {MAX_CANCEL_IDS} ids per request"}), 400
+    ids = list(dict.fromkeys(str(sub_id) for sub_id in ids))
+
+    try:
+        rows = {row["id"]: row for row in query_all(f"""
+            SELECT id, name, event_id FROM admin_submissions
+            WHERE id IN ({", ".join("?" for _ in ids)})
+        """, ids)}
+
+        event_ids = {sub_id: row["event_id"] for sub_id, row in rows.items() if row["event_id"]}
+        calendar_errors = {}
+        if event_ids:
+            try:
+                creds = load_admin_credentials()
+            except AdminTokenError as e:
+                return jsonify({"error": str(e)}), 500
+            calendar_service = get_service("calendar", "v3", creds, identity="admin")
+            calendar_errors = delete_calendar_events(calendar_service, event_ids)
+            deleted = sum(1 for error in calendar_errors.values() if error is None)
+            print(f"✅ Deleted {deleted}/{len(event_ids)} calendar events in batch")
+
+        if rows:
+            with transaction() as conn, tracking_submissions(conn, rows):
+                mark_canceled(conn, rows)
+
+        results = []
+        for sub_id in ids:
+            if sub_id not in rows:
+                results.append({"id": sub_id, "ok": False, "error": "Submission not found"})
+                continue
+            result = {"id": sub_id, "ok": True, "status": "Canceled",
+                      "eventDeleted": sub_id in event_ids and calendar_errors.get(sub_id) is None}
+            if calendar_errors.get(sub_id):
+                result["calendarError"] = calendar_errors[sub_id]
+            results.append(result)
+
+        partial = any(not r["ok"] or r.get("calendarError") for r in results)
+        return jsonify({"results": results}), 207 if partial else 200
+
+    except Exception as e:
+        print("❌ Error in cancel_meetings:", e)
+        return jsonify({"error": str(e)}), 500
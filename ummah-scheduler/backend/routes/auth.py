@@ -2,10 +2,12 @@
 from flask import Blueprint, redirect, request, session, url_for, jsonify
 from google_auth_oauthlib.flow import Flow
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from services.google_services import evict, get_service
 import os
 import pathlib
 from db import log_mentor_action
+from services.credential_store import load_credentials, save_credentials
+from services.slot_suggestions import forget_busy
 
 # Use env vars for backend + frontend URLs
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:5050")
@@ -14,9 +16,6 @@ FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
 auth_bp = Blueprint("auth", __name__)
 os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = "1"  # Enable HTTP for localhost testing
 
-# In-memory token storage: { email: credentials }
-mentor_tokens = {}
-
 SCOPES = [
     "https://www.googleapis.com/auth/calendar.events",
     "https://www.googleapis.com/auth/calendar",
@@ -95,14 +94,17 @@ def oauth2callback():
     flow.fetch_token(authorization_response=request.url)
 
     credentials = flow.credentials
-    user_service = build("oauth2", "v2", credentials=credentials)
+    user_service = get_service("oauth2", "v2", credentials)
     user_info = user_service.userinfo().get().execute()
 
     mentor_email = user_info.get("email")
     if not mentor_email:
         return "Failed to get user email", 400
 
-    mentor_tokens[mentor_email] = credentials_to_dict(credentials)
+    save_credentials(mentor_email, credentials_to_dict(credentials))
+    # Fresh consent: drop calendar clients and free/busy results from the old tokens
+    evict(mentor_email)
+    forget_busy(mentor_email)
     log_mentor_action(mentor_email, "login")
 
     flow_type = session.get("flow")
@@ -134,11 +136,12 @@ def login_message():
 # ----------------------------
 @auth_bp.route("/auth/token")
 def get_token():
+    """Whether `email` has stored Google credentials. Never returns the tokens themselves."""
     email = request.args.get("email")
-    creds = mentor_tokens.get(email)
+    creds = load_credentials(email)
     if not creds:
         return jsonify({"error": "No credentials found"}), 404
-    return jsonify(creds)
+    return jsonify({"email": email, "authenticated": True, "scopes": creds.get("scopes")})
 
 
 # Utility to serialize credentials to dict
@@ -179,7 +182,7 @@ def admin_oauth2callback():
     flow.fetch_token(authorization_response=request.url)
 
     credentials = flow.credentials
-    user_service = build("oauth2", "v2", credentials=credentials)
+    user_service = get_service("oauth2", "v2", credentials)
     user_info = user_service.userinfo().get().execute()
 
     admin_email = user_info.get("email")
@@ -0,0 +1,31 @@
+# routes/events.py
+from flask import Blueprint, Response, jsonify, request
+
+from services.change_events import SSE_ENABLED, stream
+
+events_bp = Blueprint("events", __name__)
+
+
+# ---------------------------
+# Live change stream (Server-Sent Events)
+# ---------------------------
+@events_bp.route("/api/events", methods=["GET"])
+def events():
+    """
+    Stream "submission", "mentor_action" and "monday_item" change events.
+    Reconnects resume after Last-Event-ID (header, or ?lastEventId=);
+    a "reset" event means the client missed too much and should refetch.
+    """
+    if not SSE_ENABLED:
+        return jsonify({"error": "Live updates are disabled"}), 404
+
+    last_id = request.headers.get("Last-Event-ID") or request.args.get("lastEventId")
+    try:
+        last_id = int(last_id) if last_id else None
+    except ValueError:
+        return jsonify({"error": "Invalid Last-Event-ID"}), 400
+
+    return Response(stream(last_id), mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",  # don't let proxies buffer the stream
+    })
@@ -1,85 +1,30 @@
 # ummah-scheduler/backend/routes/followup.py
 from flask import Blueprint, jsonify, request
-import os
-import json
-from pathlib import Path
-import sqlite3
 from datetime import datetime
 import traceback
-from db import log_mentor_action
+from db import DB_PATH, log_mentor_action, log_mentor_actions, transaction
+from services.admin_stats import tracking_submission, tracking_submissions
+from services.change_events import record_submission_changes
+from services.http_cache import conditional
 
 
 followup_bp = Blueprint('followup', __name__)
 
-DATA_DIR = Path(__file__).resolve().parent.parent / "data"
-SUBMISSIONS_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'submissions.json')
-DB_PATH = Path(__file__).resolve().parent.parent / "admin_data.db"
-
 print("✅ followup.py loaded and blueprint created")
-print("🛠 Absolute DB Path:", DB_PATH.resolve())
-
-# Ensure the data directory exists
-DATA_DIR.mkdir(parents=True, exist_ok=True)
-
-# Create admin_submissions table if not exists
-def init_db():
-    with sqlite3.connect(DB_PATH) as conn:
-        c = conn.cursor()
-        c.execute("""
-        CREATE TABLE IF NOT EXISTS admin_submissions (
-            id TEXT PRIMARY KEY,
-            name TEXT,
-            email TEXT,
-            phone TEXT,
-            industry TEXT,
-            academicStanding TEXT,
-            lookingFor TEXT,
-            resume TEXT,
-            howTheyHeard TEXT,
-            availability TEXT,
-            timeline TEXT,
-            otherInfo TEXT,
-            submitted TEXT,
-            status TEXT,
-            pickedBy TEXT,
-            pickedByEmail TEXT,
-            event_id TEXT,
-            updated_at TEXT
-        )
-        """)
-        conn.commit()
-
-init_db()
+print("🛠 Absolute DB Path:", DB_PATH)
 
 @followup_bp.route('/save-status', methods=['OPTIONS'])
 def save_status_options():
     return '', 200
 
 @followup_bp.route('/followup', methods=['GET'])
+@conditional("admin_submissions", "monday_items")
 def get_done_submissions():
     try:
-        from services.monday_poll import get_latest_items
-
-        items = get_latest_items(limit=50)
-
-        # ✅ Load from JSON first (to keep existing flow)
-        if os.path.exists(SUBMISSIONS_FILE):
-            with open(SUBMISSIONS_FILE, 'r') as f:
-                saved = json.load(f)
-        else:
-            saved = []
-
-        saved_map = {entry["id"]: entry for entry in saved}
-
-        # Merge status and pickedBy from JSON to latest items
-        for item in items:
-            saved_entry = saved_map.get(item["id"])
-            if saved_entry:
-                item["status"] = saved_entry.get("status", "To Do")
-                item["pickedBy"] = saved_entry.get("pickedBy", "")
+        from services.monday_sync import get_submissions
 
-        # Only show Done items in followup page
-        done_items = [item for item in items if item.get("status") == "Done"]
+        # Only show Done items in followup page (indexed status lookup)
+        done_items = get_submissions(newest_first=False, status="Done")
         return jsonify(done_items), 200
 
     except Exception as e:
@@ -87,115 +32,125 @@ def get_done_submissions():
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
 
+# Submission fields copied from the dashboard payload into admin_submissions
+SUBMISSION_FIELDS = [
+    "name", "email", "phone", "industry", "academicStanding", "lookingFor",
+    "resume", "howTheyHeard", "availability", "timeline", "otherInfo", "submitted",
+]
+
+UPSERT_STATUS_SQL = f"""
+    INSERT INTO admin_submissions (
+        id, {", ".join(SUBMISSION_FIELDS)}, status, pickedBy, updated_at
+    ) VALUES ({", ".join("?" for _ in range(len(SUBMISSION_FIELDS) + 4))})
+    ON CONFLICT(id) DO UPDATE SET
+        {", ".join(f"{field}=excluded.{field}" for field in SUBMISSION_FIELDS)},
+        status=excluded.status,
+        pickedBy=excluded.pickedBy,
+        updated_at=excluded.updated_at
+"""
+
+# Largest batch accepted by /save-status/bulk
+MAX_BULK_ITEMS = 500
+
+
+def status_params(data, updated_at):
+    """Validate one save-status payload and return its upsert parameters."""
+    sub_id = data.get("id")
+    new_status = data.get("status")
+    if not sub_id or not new_status:
+        raise ValueError("Missing required fields")
+    return (
+        sub_id,
+        *(data.get(field, "") for field in SUBMISSION_FIELDS),
+        new_status,
+        data.get("pickedBy", ""),
+        updated_at,
+    )
+
+
+def done_action(data):
+    """Mentor action row for a submission marked Done, if any."""
+    picked_by = data.get("pickedBy", "")
+    if data.get("status") == "Done" and picked_by:
+        return (picked_by, "done", f"for {data.get('name', '')}")
+    return None
+
+
 @followup_bp.route('/save-status', methods=['POST'])
 def save_submission_status():
     try:
         data = request.json
-        sub_id = data.get("id")
-        new_status = data.get("status")
-        picked_by = data.get("pickedBy", "")
-
-        if not sub_id or not new_status:
-            return jsonify({"error": "Missing required fields"}), 400
-
-        full_fields = {
-            "name": data.get("name", ""),
-            "email": data.get("email", ""),
-            "phone": data.get("phone", ""),
-            "industry": data.get("industry", ""),
-            "academicStanding": data.get("academicStanding", ""),
-            "lookingFor": data.get("lookingFor", ""),
-            "resume": data.get("resume", ""),
-            "howTheyHeard": data.get("howTheyHeard", ""),
-            "availability": data.get("availability", ""),
-            "timeline": data.get("timeline", ""),
-            "otherInfo": data.get("otherInfo", ""),
-            "submitted": data.get("submitted", "")
-        }
-
-        # ✅ Step 1: Keep writing to JSON (original behavior)
-        if os.path.exists(SUBMISSIONS_FILE):
-            with open(SUBMISSIONS_FILE, 'r') as f:
-                submissions = json.load(f)
-        else:
-            submissions = []
-
-        updated = False
-        for sub in submissions:
-            if sub["id"] == sub_id:
-                sub.update({
-                    "status": new_status,
-                    "pickedBy": picked_by,
-                    **full_fields
-                })
-                updated = True
-                break
-
-        if not updated:
-            submissions.append({
-                "id": sub_id,
-                "status": new_status,
-                "pickedBy": picked_by,
-                **full_fields
-            })
-
-        with open(SUBMISSIONS_FILE, 'w') as f:
-            json.dump(submissions, f, indent=2)
-
-        # ✅ Step 2: Also save/update SQLite for migration
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute("""
-            INSERT INTO admin_submissions (
-                id, name, email, phone, industry, academicStanding,
-                lookingFor, resume, howTheyHeard, availability,
-                timeline, otherInfo, submitted, status, pickedBy, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                name=excluded.name,
-                email=excluded.email,
-                phone=excluded.phone,
-                industry=excluded.industry,
-                academicStanding=excluded.academicStanding,
-                lookingFor=excluded.lookingFor,
-                resume=excluded.resume,
-                howTheyHeard=excluded.howTheyHeard,
-                availability=excluded.availability,
-                timeline=excluded.timeline,
-                otherInfo=excluded.otherInfo,
-                submitted=excluded.submitted,
-                status=excluded.status,
-                pickedBy=excluded.pickedBy,
-                updated_at=excluded.updated_at
-            """, (
-                sub_id,
-                full_fields["name"],
-                full_fields["email"],
-                full_fields["phone"],
-                full_fields["industry"],
-                full_fields["academicStanding"],
-                full_fields["lookingFor"],
-                full_fields["resume"],
-                full_fields["howTheyHeard"],
-                full_fields["availability"],
-                full_fields["timeline"],
-                full_fields["otherInfo"],
-                full_fields["submitted"],
-                new_status,
-                picked_by,
-                datetime.utcnow().isoformat()
-            ))
-            conn.commit()
+        try:
+            params = status_params(data, datetime.utcnow().isoformat())
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        sub_id = params[0]
+
+        # ✅ Save/update SQLite (single source of truth for statuses)
+        with transaction() as conn, tracking_submission(conn, sub_id):
+            conn.execute(UPSERT_STATUS_SQL, params)
+            record_submission_changes(conn, [sub_id])
             print(f"✅ SQLite updated for ID {sub_id}")
 
-            if new_status == "Done" and picked_by:
-                log_mentor_action(picked_by, "done", f"for {full_fields['name']}")
-                
-
+            action = done_action(data)
+            if action:
+                log_mentor_action(*action)
 
-        return jsonify({"message": "Status saved (JSON + SQLite)"}), 200
+        return jsonify({"message": "Status saved"}), 200
 
     except Exception as e:
         print("❌ Error in save_submission_status:")
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
+
+
+@followup_bp.route('/save-status/bulk', methods=['OPTIONS'])
+def save_status_bulk_options():
+    return '', 200
+
+
+@followup_bp.route('/save-status/bulk', methods=['POST'])
+def save_submission_status_bulk():
+    """
+    Apply many status changes in one transaction.
+    Body: {"items": [<save-status payload>, ...]} (or a bare list).
+    Returns one result per item, in request order.
+    """
+    try:
+        data = request.json
+        items = data.get("items") if isinstance(data, dict) else data
+        if not isinstance(items, list) or not items:
+            return jsonify({"error": "Expected a non-empty list of items"}), 400
+        if len(items) > MAX_BULK_ITEMS:
+            return jsonify({"error": f"At most {MAX_BULK_ITEMS} items per request"}), 400
+
+        updated_at = datetime.utcnow().isoformat()
+        results, rows, actions = [], [], []
+        for item in items:
+            try:
+                if not isinstance(item, dict):
+                    raise ValueError("Item must be an object")
+                rows.append(status_params(item, updated_at))
+                results.append({"id": item["id"], "ok": True, "status": item["status"]})
+                action = done_action(item)
+                if action:
+                    actions.append(action)
+            except ValueError as e:
+                results.append({"id": item.get("id") if isinstance(item, dict) else None,
+                                "ok": False, "error": str(e)})
+
+        if rows:
+            with transaction() as conn, tracking_submissions(conn, [row[0] for row in rows]):
+                conn.executemany(UPSERT_STATUS_SQL, rows)
+                record_submission_changes(conn, {row[0] for row in rows})
+                if actions:
+                    log_mentor_actions(actions)
+            print(f"✅ SQLite bulk-updated {len(rows)} submissions")
+
+        status_code = 200 if all(r["ok"] for r in results) else 207
+        return jsonify({"results": results}), status_code
+
+    except Exception as e:
+        print("❌ Error in save_submission_status_bulk:")
+        traceback.print_exc()
+        return jsonify({"error": str(e)}), 500
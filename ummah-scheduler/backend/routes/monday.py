@@ -1,36 +1,52 @@
 # routes/monday.py
-from flask import Blueprint, jsonify
-from services.monday_poll import get_latest_items 
-import os
-import json
+from flask import Blueprint, jsonify, request
+from routes.admin import normalize_status
+from services.monday_sync import get_mentor_queue, get_submissions
+from services.http_cache import conditional
+from services.pagination import InvalidCursor, parse_limit
 
 monday_bp = Blueprint('monday', __name__)
 
-SUBMISSIONS_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'submissions.json')
-
 @monday_bp.route('/submissions', methods=['GET'])
+@conditional("admin_submissions", "monday_items")
 def fetch_submissions():
     try:
-        # Live items from Monday.com
-        items = get_latest_items(limit=50)
+        # Mirrored Monday.com items merged with saved status + pickedBy, newest first
+        return jsonify(get_submissions(newest_first=True))
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
 
-        # Load saved statuses (if file exists)
-        if os.path.exists(SUBMISSIONS_FILE):
-            with open(SUBMISSIONS_FILE, 'r') as f:
-                saved = json.load(f)
-        else:
-            saved = []
 
-        saved_map = {entry["id"]: entry for entry in saved}
+# Query parameter -> submission_tags field
+QUEUE_FILTERS = {"industries": "industry", "lookingFor": "lookingFor", "availability": "availability"}
 
-        # Merge status + pickedBy into each item
-        for item in items:
-            saved_entry = saved_map.get(item["id"])
-            if saved_entry:
-                item["status"] = saved_entry.get("status", "To Do")
-                item["pickedBy"] = saved_entry.get("pickedBy", "")
 
-        # Reverse to make newest submissions appear first
-        return jsonify(items[::-1])
+@monday_bp.route('/mentor-queue', methods=['GET'])
+@conditional("admin_submissions", "monday_items")
+def mentor_queue():
+    """
+    A mentor's open submissions: ?industries= (comma-separated, any may match),
+    optionally narrowed by ?lookingFor= / ?availability=, and ?status=
+    (comma-separated, default "To Do"; "all" for any). Paging as /api/admin-submissions.
+    """
+    try:
+        tags = {
+            field: [v.strip() for v in request.args.get(param, "").split(",") if v.strip()]
+            for param, field in QUEUE_FILTERS.items()
+        }
+        status_arg = request.args.get("status", "To Do")
+        statuses = () if status_arg.strip().lower() == "all" else tuple(
+            normalize_status(s) for s in status_arg.split(",") if s.strip()
+        )
+        rows, headers = get_mentor_queue(
+            tags,
+            statuses,
+            limit=parse_limit(request.args.get("limit"), default=50),
+            cursor=request.args.get("cursor"),
+        )
+        return jsonify(rows), 200, headers
+    except (InvalidCursor, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+        print("❌ Error fetching mentor queue:", e)
+        return jsonify({"error": str(e)}), 500
@@ -0,0 +1,118 @@
+# routes/monday_webhook.py
+"""
+Push-based ingestion from Monday.com board webhooks.
+
+Monday first POSTs {"challenge": ...} and expects it echoed back; after
+that each event names the affected item. The receiver answers at once and
+hands the event to the job pool, which fetches only that item, upserts it
+into monday_items and (optionally) announces new items on Discord. Delete
+and archive events only remove the mirrored row once Monday confirms the
+item is no longer active.
+
+Point the board webhook at /api/monday/webhook?secret=<MONDAY_WEBHOOK_SECRET>.
+Without MONDAY_WEBHOOK_SECRET the endpoint refuses every request (503).
+"""
+import hmac
+import os
+
+from flask import Blueprint, jsonify, request
+
+from db import get_connection, transaction
+from services.change_events import record_events
+from services.job_queue import submit
+from services.monday_parser import parse_monday_item
+from services.monday_poll import get_items_by_id
+from services.monday_sync import delete_monday_items, upsert_monday_items
+
+MONDAY_WEBHOOK_SECRET = os.getenv("MONDAY_WEBHOOK_SECRET")
+# Post new items to Discord from here (instead of the cron poster)
+MONDAY_WEBHOOK_NOTIFY_DISCORD = os.getenv("MONDAY_WEBHOOK_NOTIFY_DISCORD", "false").lower() == "true"
+
+CREATE_EVENTS = {"create_pulse", "create_item"}
+UPDATE_EVENTS = {
+    "update_column_value", "change_column_value", "change_specific_column_value",
+    "change_status_column_value", "update_name", "change_name", "move_pulse_into_group",
+}
+DELETE_EVENTS = {"delete_pulse", "item_deleted", "archive_pulse", "item_archived"}
+
+monday_webhook_bp = Blueprint("monday_webhook", __name__)
+
+
+@monday_webhook_bp.route("/api/monday/webhook", methods=["POST"])
+def monday_webhook():
+    if not MONDAY_WEBHOOK_SECRET:
+        print("⚠️ Monday webhook called but MONDAY_WEBHOOK_SECRET is not set; refusing")
+        return jsonify({"error": "Webhook receiver not configured"}), 503
+    if not hmac.compare_digest(request.args.get("secret", ""), MONDAY_WEBHOOK_SECRET):
+        return jsonify({"error": "Unauthorized"}), 401
+
+    data = request.get_json(silent=True) or {}
+
+    # ✅ Handshake: echo the challenge back
+    if "challenge" in data:
+        return jsonify({"challenge": data["challenge"]})
+
+    event = data.get("event") or {}
+    event_type = event.get("type")
+    item_id = event.get("pulseId") or event.get("itemId")
+    if not item_id:
+        return jsonify({"error": "Missing item id"}), 400
+
+    if event_type in DELETE_EVENTS:
+        job_id = submit("monday_webhook", {"itemId": str(item_id), "type": event_type}, remove_item)
+        return jsonify({"ok": True, "jobId": job_id})
+
+    if event_type not in CREATE_EVENTS | UPDATE_EVENTS:
+        # Acknowledge anything else so Monday doesn't retry it
+        return jsonify({"ok": True, "ignored": event_type})
+
+    job_id = submit("monday_webhook", {
+        "itemId": str(item_id),
+        "type": event_type,
+        "notify": MONDAY_WEBHOOK_NOTIFY_DISCORD and event_type in CREATE_EVENTS,
+    }, ingest_item)
+    return jsonify({"ok": True, "jobId": job_id})
+
+
+# ---------------------------
+# Job handler (runs on the job pool)
+# ---------------------------
+def remove_item(payload):
+    """Drop a mirrored item, but only if Monday no longer has it as an active item."""
+    items = get_items_by_id([payload["itemId"]])
+    active = [item for item in items if item.get("state", "active") == "active"]
+    if active:
+        print(f"⚠️ Ignoring {payload['type']} for Monday item {payload['itemId']}: still active on the board")
+        return {"itemId": payload["itemId"], "removed": 0}
+
+    with transaction() as conn:
+        exists = conn.execute("SELECT 1 FROM monday_items WHERE id = ?", (payload["itemId"],)).fetchone()
+        removed = delete_monday_items(conn, [payload["itemId"]]) if exists else 0
+    print(f"🗑️ Monday item {payload['itemId']} removed from mirror")
+    return {"itemId": payload["itemId"], "removed": removed}
+
+
+def ingest_item(payload):
+    """Fetch one item from Monday, mirror it, and announce it if asked to."""
+    items = get_items_by_id([payload["itemId"]])
+    if not items:
+        return {"itemId": payload["itemId"], "upserted": 0}
+
+    with transaction() as conn:
+        parsed = [parse_monday_item(item) for item in items]
+        upsert_monday_items(conn, parsed)
+        record_events(conn, [("monday_item", item) for item in parsed])
+    print(f"✅ Monday item {payload['itemId']} mirrored ({payload['type']})")
+
+    result = {"itemId": payload["itemId"], "upserted": len(items)}
+    if payload.get("notify"):
+        from services.discord_notify import post_items, posted_channels, record_posted
+
+        posted = posted_channels(get_connection(), [item["id"] for item in items])
+        delivered, failed = post_items(items, posted)
+        with transaction() as conn:
+            record_posted(conn, delivered)
+        result.update(posted=len(delivered), failed=sorted(failed))
+        if failed:
+            raise RuntimeError(f"Discord post failed for {', '.join(sorted(failed))}")
+    return result
@@ -3,18 +3,22 @@
 from flask import Blueprint, request, jsonify
 from datetime import datetime, timedelta
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from routes.auth import mentor_tokens
+from services.google_services import get_service, service_credentials
+from services.credential_store import authenticated_mentors, load_credentials, save_credentials
+from services.job_queue import get_job, submit
 from app_config import GOOGLE_CALENDAR_TIMEZONE
-import sqlite3, os
+from zoneinfo import ZoneInfo
 from datetime import datetime as dt
-from db import log_mentor_action
+from db import log_mentor_action, query_one, transaction
+from services.admin_stats import tracking_submission
+from services.change_events import record_submission_changes
+from services.slot_suggestions import (
+    SLOT_MINUTES, forget_busy, is_busy, parse_timeline, suggest_slots,
+)
 
 
 schedule = Blueprint('schedule', __name__)
 
-DB_PATH = os.path.join(os.path.dirname(__file__), "..", "admin_data.db")
-
 # ✅ Preflight handler to resolve CORS properly
 @schedule.route('/api/schedule-meeting', methods=['OPTIONS'])
 def handle_options():
@@ -22,7 +26,7 @@ def handle_options():
     response.status_code = 204
     return response
 
-# ✅ POST handler to schedule the meeting
+# ✅ POST handler: validate, then queue the calendar work
 @schedule.route('/api/schedule-meeting', methods=['POST'])
 def schedule_meeting():
     data = request.json
@@ -34,55 +38,108 @@ def schedule_meeting():
     if not student_email or not mentor_email or not meeting_time:
         return jsonify({"error": "Missing required fields"}), 400
 
-    token_data = mentor_tokens.get(mentor_email)
-    if not token_data:
+    if not load_credentials(mentor_email):
         return jsonify({"error": "Mentor not authenticated with Google"}), 401
 
     try:
-        creds = Credentials(**token_data)
-        calendar_service = build("calendar", "v3", credentials=creds)
-
         start = datetime.fromisoformat(meeting_time.replace("Z", "+00:00"))
-        end = start + timedelta(minutes=30)
-
-        event = {
-            'summary': f'Mentorship Session with {student_email}',
-            'description': f'Scheduled via Ummah Scheduler by {mentor_email}',
-            'start': {
-                'dateTime': start.isoformat(),
-                'timeZone': GOOGLE_CALENDAR_TIMEZONE,
-            },
-            'end': {
-                'dateTime': end.isoformat(),
-                'timeZone': GOOGLE_CALENDAR_TIMEZONE,
-            },
-            'attendees': [
-                {'email': mentor_email},
-                {'email': student_email}
-            ],
-            'conferenceData': {
-                'createRequest': {
-                    'conferenceSolutionKey': {'type': 'hangoutsMeet'},
-                    'requestId': f"ummah-{start.timestamp()}"
-                }
+    except ValueError:
+        return jsonify({"error": "Invalid meeting time"}), 400
+
+    # Only checks free/busy already cached by /api/suggest-slots (no Google call)
+    if start.tzinfo and is_busy(mentor_email, start, start + timedelta(minutes=SLOT_MINUTES)):
+        return jsonify({"error": "Mentor is busy at that time"}), 409
+
+    job_id = submit("schedule_meeting", {
+        "id": student_id,
+        "studentEmail": student_email,
+        "mentorEmail": mentor_email,
+        "time": meeting_time,
+    }, create_meeting)
+
+    return jsonify({
+        "jobId": job_id,
+        "status": "queued",
+        "statusUrl": f"/api/schedule-meeting/{job_id}"
+    }), 202
+
+# ✅ Job status polling
+@schedule.route('/api/schedule-meeting/<job_id>', methods=['GET'])
+def schedule_meeting_status(job_id):
+    job = get_job(job_id, kind="schedule_meeting")
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+
+    body = {"jobId": job["jobId"], "status": job["status"], "updatedAt": job["updatedAt"]}
+    if job["result"]:
+        body.update(job["result"])
+    if job["error"]:
+        body["error"] = job["error"]
+    return jsonify(body)
+
+
+# ---------------------------
+# Job handler (runs on the job pool)
+# ---------------------------
+def create_meeting(payload):
+    student_email = payload["studentEmail"]
+    mentor_email = payload["mentorEmail"]
+    student_id = payload.get("id")
+
+    token_data = load_credentials(mentor_email)
+    if not token_data:
+        raise RuntimeError("Mentor not authenticated with Google")
+
+    creds = Credentials(**token_data)
+    calendar_service = get_service("calendar", "v3", creds, identity=mentor_email)
+
+    start = datetime.fromisoformat(payload["time"].replace("Z", "+00:00"))
+    end = start + timedelta(minutes=SLOT_MINUTES)
+
+    event = {
+        'summary': f'Mentorship Session with {student_email}',
+        'description': f'Scheduled via Ummah Scheduler by {mentor_email}',
+        'start': {
+            'dateTime': start.isoformat(),
+            'timeZone': GOOGLE_CALENDAR_TIMEZONE,
+        },
+        'end': {
+            'dateTime': end.isoformat(),
+            'timeZone': GOOGLE_CALENDAR_TIMEZONE,
+        },
+        'attendees': [
+            {'email': mentor_email},
+            {'email': student_email}
+        ],
+        'conferenceData': {
+            'createRequest': {
+                'conferenceSolutionKey': {'type': 'hangoutsMeet'},
+                'requestId': f"ummah-{start.timestamp()}"
             }
         }
-
-        created_event = calendar_service.events().insert(
-            calendarId='primary',
-            body=event,
-            conferenceDataVersion=1,
-            sendUpdates='all'
-        ).execute()
-
-        event_id = created_event.get("id")
-        event_link = created_event.get("htmlLink")
-
-        # ✅ Update SQLite with event_id, pickedByEmail, status
-        try:
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
-            cur.execute("""
+    }
+
+    created_event = calendar_service.events().insert(
+        calendarId='primary',
+        body=event,
+        conferenceDataVersion=1,
+        sendUpdates='all'
+    ).execute()
+
+    event_id = created_event.get("id")
+    event_link = created_event.get("htmlLink")
+    forget_busy(mentor_email)
+
+    # Keep the refreshed access token so other workers don't refresh again;
+    # a cached service may hold an older Credentials object than `creds`
+    token = service_credentials(calendar_service).token
+    if token != token_data.get("token"):
+        save_credentials(mentor_email, {**token_data, "token": token})
+
+    # ✅ Update SQLite with event_id, pickedByEmail, status
+    try:
+        with transaction() as conn, tracking_submission(conn, student_id):
+            conn.execute("""
                 INSERT INTO admin_submissions (id, email, status, pickedByEmail, event_id, updated_at)
                 VALUES (?, ?, ?, ?, ?, ?)
                 ON CONFLICT(id) DO UPDATE SET
@@ -98,16 +155,65 @@ def schedule_meeting():
                 event_id,
                 dt.utcnow().isoformat()
             ))
-            conn.commit()
-            conn.close()
-            print(f"✅ SQLite updated with event_id for {student_email}")
+            record_submission_changes(conn, [student_id])
+        print(f"✅ SQLite updated with event_id for {student_email}")
+
+        log_mentor_action(mentor_email, "propose", f"with {student_email}")
+    except Exception as db_err:
+        print("⚠️ Warning: Could not update SQLite with event info:", db_err)
+
+    return {"message": "Invite sent", "eventId": event_id, "eventLink": event_link}
+
+
+# ---------------------------
+# Slot suggestions
+# ---------------------------
+MAX_SUGGEST_MENTORS = 200
+
+
+@schedule.route('/api/suggest-slots', methods=['GET'])
+def suggest_meeting_slots():
+    """
+    Free 30-minute slots for several mentors at once.
+
+    ?mentors= (comma-separated emails; default every mentor signed in with Google),
+    ?submissionId= (use that student's availability and timeline) or ?availability=,
+    ?from= / ?to= (ISO timestamps; default the next 7 days), ?limit= (slots, default 20).
+    """
+    mentors = [m.strip() for m in request.args.get("mentors", "").split(",") if m.strip()]
+    if not mentors:
+        mentors = authenticated_mentors()
+    mentors = list(dict.fromkeys(mentors))
+    if len(mentors) > MAX_SUGGEST_MENTORS:
+        return jsonify({"error": f"At most {MAX_SUGGEST_MENTORS} mentors per request"}), 400
+
+    availability = request.args.get("availability")
+    timeline = None
+    submission_id = request.args.get("submissionId")
+    if submission_id:
+        student = query_one("SELECT availability, timeline FROM monday_items WHERE id = ?", (submission_id,)) \
+            or query_one("SELECT availability, timeline FROM admin_submissions WHERE id = ?", (submission_id,))
+        if student is None:
+            return jsonify({"error": "Submission not found"}), 404
+        availability = availability or student["availability"]
+        timeline = parse_timeline(student["timeline"])
 
-            log_mentor_action(mentor_email, "propose", f"with {student_email}")
-        except Exception as db_err:
-            print("⚠️ Warning: Could not update SQLite with event info:", db_err)
-
-        return jsonify({"message": "Invite sent", "eventLink": event_link})
+    try:
+        time_min = _parse_bound(request.args.get("from"))
+        time_max = _parse_bound(request.args.get("to"))
+        limit = max(1, min(int(request.args.get("limit") or 20), 200))
+    except ValueError:
+        return jsonify({"error": "Invalid from / to / limit"}), 400
 
+    try:
+        return jsonify(suggest_slots(mentors, availability, time_min, time_max, timeline, limit))
     except Exception as e:
-        print("Calendar error:", e)
+        print("❌ Error suggesting slots:", e)
         return jsonify({"error": str(e)}), 500
+
+
+def _parse_bound(value):
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=ZoneInfo(GOOGLE_CALENDAR_TIMEZONE))
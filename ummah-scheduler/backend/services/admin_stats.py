@@ -0,0 +1,266 @@
+# ummah-scheduler/backend/services/admin_stats.py
+"""
+Incrementally maintained aggregates behind /api/admin-stats.
+
+A submission is every admin_submissions row plus every mirrored
+monday_items row nobody has touched yet (counted as "To Do"), the same set
+the dashboards list. stats_submission_daily counts them per submission
+day, status, mentor (pickedBy) and industry combination, together with the
+summed submitted -> updated_at turnaround; stats_industry_sets maps each
+combination to its industries. stats_mentor_daily holds mentor actions per
+mentor, day and action. Writers update them in the same transaction as the
+rows they change, so every filter of the statistics page is a GROUP BY
+over these small tables and never touches the source rows.
+rebuild_stats() recomputes everything for backfills.
+"""
+from contextlib import contextmanager
+from datetime import datetime
+
+from db import bump_table_versions, query_all, transaction
+from services.response_cache import cached
+
+# One row per submission: the saved admin row, else the untouched mirror row
+SUBMISSION_SELECT = """
+    SELECT a.id AS id,
+           COALESCE(NULLIF(a.status, ''), 'To Do') AS status,
+           COALESCE(NULLIF(a.industry, ''), m.industry) AS industry,
+           COALESCE(NULLIF(a.submitted, ''), m.submitted) AS submitted,
+           a.pickedBy AS pickedBy,
+           a.updated_at AS updated_at
+    FROM admin_submissions a
+    LEFT JOIN monday_items m ON m.id = a.id
+    WHERE {admin_where}
+    UNION ALL
+    SELECT m.id, 'To Do', m.industry, m.submitted, NULL, NULL
+    FROM monday_items m
+    WHERE {mirror_where} AND NOT EXISTS (SELECT 1 FROM admin_submissions a WHERE a.id = m.id)
+"""
+
+
+def _industries(value):
+    if not value:
+        return []
+    return sorted({part.strip() for part in value.split(",") if part.strip() and part.strip() != "N/A"})
+
+
+def _day(value):
+    value = (value or "").strip()
+    return value[:10] if len(value) >= 10 and value[4] == "-" else None
+
+
+def _timestamp(value):
+    # Monday's "2025-07-20 23:24:48 UTC", ISO with "Z", or naive UTC isoformat()
+    value = (value or "").strip().removesuffix(" UTC").removesuffix("Z")
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def _turnaround_seconds(row):
+    submitted, updated = _timestamp(row["submitted"]), _timestamp(row["updated_at"])
+    if not submitted or not updated:
+        return None
+    return max(int((updated - submitted).total_seconds()), 0)
+
+
+def submission_counts(row):
+    """{(day, status, mentor, industries): [count, turnaround seconds, turnaround count]} for one submission."""
+    if row is None:
+        return {}
+    key = (
+        _day(row["submitted"]) or "",
+        row["status"] or "To Do",
+        (row["pickedBy"] or "").strip(),
+        ", ".join(_industries(row["industry"])),
+    )
+    seconds = _turnaround_seconds(row)
+    return {key: [1, seconds or 0, 0 if seconds is None else 1]}
+
+
+def _add(totals, counts, sign=1):
+    for key, amounts in counts.items():
+        current = totals.setdefault(key, [0, 0, 0])
+        for n, amount in enumerate(amounts):
+            current[n] += sign * amount
+    return totals
+
+
+def _snapshots(conn, sub_ids):
+    sub_ids, snapshots = list(sub_ids), {}
+    for start in range(0, len(sub_ids), 400):
+        chunk = sub_ids[start:start + 400]
+        marks = ", ".join("?" for _ in chunk)
+        rows = conn.execute(
+            SUBMISSION_SELECT.format(admin_where=f"a.id IN ({marks})", mirror_where=f"m.id IN ({marks})"),
+            chunk + chunk
+        )
+        snapshots.update((row["id"], row) for row in rows)
+    return snapshots
+
+
+def _bump(conn, deltas):
+    rows = [key + tuple(amounts) for key, amounts in deltas.items() if any(amounts)]
+    conn.executemany("""
+        INSERT INTO stats_submission_daily
+            (day, status, mentor, industries, count, turnaround_seconds, turnaround_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(day, status, mentor, industries) DO UPDATE SET
+            count = count + excluded.count,
+            turnaround_seconds = turnaround_seconds + excluded.turnaround_seconds,
+            turnaround_count = turnaround_count + excluded.turnaround_count
+    """, rows)
+    conn.executemany(
+        "INSERT OR IGNORE INTO stats_industry_sets (industries, industry) VALUES (?, ?)",
+        {(row[3], industry) for row in rows if row[3] for industry in row[3].split(", ")}
+    )
+
+
+def apply_submission_change(conn, before, after):
+    """Move one submission's contribution from `before` to `after` (rows or None)."""
+    _bump(conn, _add(_add({}, submission_counts(after)), submission_counts(before), -1))
+
+
+@contextmanager
+def tracking_submissions(conn, sub_ids):
+    """Wrap writes to admin_submissions or monday_items rows so the aggregates follow them."""
+    sub_ids = {str(sub_id) for sub_id in sub_ids}
+    if not sub_ids:
+        yield
+        return
+    before = _snapshots(conn, sub_ids)
+    yield
+    after = _snapshots(conn, sub_ids)
+    deltas = {}
+    for sub_id in sub_ids:
+        _add(deltas, submission_counts(after.get(sub_id)))
+        _add(deltas, submission_counts(before.get(sub_id)), -1)
+    _bump(conn, deltas)
+
+
+def tracking_submission(conn, sub_id):
+    return tracking_submissions(conn, [sub_id])
+
+
+def record_mentor_actions(conn, actions):
+    """Count (email, action, timestamp) tuples into stats_mentor_daily."""
+    conn.executemany("""
+        INSERT INTO stats_mentor_daily (email, day, action, count) VALUES (?, ?, ?, 1)
+        ON CONFLICT(email, day, action) DO UPDATE SET count = count + 1
+    """, [(email, timestamp[:10], action) for email, action, timestamp in actions])
+
+
+def rebuild_stats(conn=None):
+    """Recompute every aggregate from the source tables (for backfills)."""
+    if conn is None:
+        with transaction() as conn:
+            return rebuild_stats(conn)
+
+    conn.execute("DELETE FROM stats_submission_daily")
+    conn.execute("DELETE FROM stats_industry_sets")
+    conn.execute("DELETE FROM stats_mentor_daily")
+
+    counts = {}
+    for row in conn.execute(SUBMISSION_SELECT.format(admin_where="1", mirror_where="1")):
+        _add(counts, submission_counts(row))
+    _bump(conn, counts)
+    conn.execute("""
+        INSERT INTO stats_mentor_daily (email, day, action, count)
+        SELECT email, substr(timestamp, 1, 10), action, COUNT(*)
+        FROM mentor_actions
+        GROUP BY email, substr(timestamp, 1, 10), action
+    """)
+    # The stats' ETag and cache entries are keyed on their source tables
+    bump_table_versions(conn, ["admin_submissions", "monday_items", "mentor_actions"])
+    return len(counts)
+
+
+def _filters(day_from, day_to, statuses, industries, mentor):
+    """WHERE clause and params over stats_submission_daily (aliased s)."""
+    where, params = ["s.count != 0"], []
+    if day_from or day_to:
+        where.append("s.day != ''")
+    if day_from:
+        where.append("s.day >= ?")
+        params.append(day_from)
+    if day_to:
+        where.append("s.day <= ?")
+        params.append(day_to)
+    if statuses:
+        where.append(f"s.status IN ({', '.join('?' for _ in statuses)})")
+        params += statuses
+    if mentor:
+        where.append("s.mentor = ?")
+        params.append(mentor)
+    if industries:
+        where.append(f"""s.industries IN (
+            SELECT industries FROM stats_industry_sets WHERE industry IN ({', '.join('?' for _ in industries)})
+        )""")
+        params += industries
+    return " AND ".join(where), params
+
+
+@cached("admin_submissions", "monday_items", "mentor_actions")
+def get_stats(day_from=None, day_to=None, statuses=(), industries=(), mentor=None):
+    """
+    Aggregates for the statistics page. Every figure covers the submissions
+    submitted in [day_from, day_to] (and mentor actions on those days) that
+    match the status, industry (any of) and mentor (pickedBy) filters.
+    """
+    where, params = _filters(day_from, day_to, list(statuses), list(industries), mentor)
+
+    by_status, by_mentor, by_day = {}, {}, {}
+    seconds = turnarounds = 0
+    for row in query_all(f"""
+        SELECT s.day, s.status, s.mentor, SUM(s.count) AS count,
+               SUM(s.turnaround_seconds) AS seconds, SUM(s.turnaround_count) AS turnarounds
+        FROM stats_submission_daily s
+        WHERE {where}
+        GROUP BY s.day, s.status, s.mentor
+    """, params):
+        by_status[row["status"]] = by_status.get(row["status"], 0) + row["count"]
+        if row["mentor"]:
+            by_mentor[row["mentor"]] = by_mentor.get(row["mentor"], 0) + row["count"]
+        if row["day"]:
+            by_day[row["day"]] = by_day.get(row["day"], 0) + row["count"]
+        seconds += row["seconds"]
+        turnarounds += row["turnarounds"]
+
+    by_industry = {row["industry"]: row["count"] for row in query_all(f"""
+        SELECT i.industry, SUM(s.count) AS count
+        FROM stats_submission_daily s
+        JOIN stats_industry_sets i ON i.industries = s.industries
+        WHERE {where}
+        GROUP BY i.industry
+    """, params)}
+
+    def positive(values):
+        return {key: count for key, count in sorted(values.items()) if count > 0}
+
+    result = {
+        "byStatus": positive(by_status),
+        "byIndustry": positive(by_industry),
+        "byMentor": positive(by_mentor),
+        "byDay": positive(by_day),
+        "mentorActivity": {},
+        "avgDaysToUpdate": round(seconds / turnarounds / 86400, 2) if turnarounds else None,
+    }
+
+    where, params = ["count > 0"], []
+    if day_from:
+        where.append("day >= ?")
+        params.append(day_from)
+    if day_to:
+        where.append("day <= ?")
+        params.append(day_to)
+    if mentor:
+        where.append("email = ?")
+        params.append(mentor)
+    for row in query_all(f"""
+        SELECT email, day, action, count FROM stats_mentor_daily WHERE {" AND ".join(where)}
+    """, params):
+        days = result["mentorActivity"].setdefault(row["email"], {})
+        days.setdefault(row["day"], {})[row["action"]] = row["count"]
+
+    result["totalSubmissions"] = sum(result["byStatus"].values())
+    return result
@@ -0,0 +1,108 @@
+# ummah-scheduler/backend/services/change_events.py
+"""
+Change feed behind the /api/events Server-Sent Events stream.
+
+Writers call record_event(conn, type, payload) inside the transaction that
+makes the change, so an event exists exactly when its change committed.
+Events get increasing ids; streams poll for ids above the client's
+Last-Event-ID, which works across workers and survives reconnects. Only
+the newest CHANGE_EVENTS_KEEP events are retained; a client that fell
+further behind is told to reload.
+
+The stream is opt-in (SSE_ENABLED=true): each open stream holds a request
+thread for up to SSE_MAX_STREAM_SECONDS, so only enable it on a threaded
+server such as gunicorn with backend/gunicorn.conf.py (gthread workers),
+never on plain sync workers. The frontend subscribes only when built with
+VITE_LIVE_UPDATES=true.
+"""
+import json
+import os
+import time
+from datetime import datetime
+
+from db import query_all, query_value
+
+SSE_ENABLED = os.getenv("SSE_ENABLED", "false").lower() == "true"
+CHANGE_EVENTS_KEEP = int(os.getenv("CHANGE_EVENTS_KEEP", "5000"))
+SSE_POLL_INTERVAL = float(os.getenv("SSE_POLL_INTERVAL", "1"))
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+# Streams end after this long; EventSource reconnects with Last-Event-ID
+SSE_MAX_STREAM_SECONDS = float(os.getenv("SSE_MAX_STREAM_SECONDS", "300"))
+SSE_RETRY_MS = 3000
+
+# Prune once every this many events
+_PRUNE_EVERY = 500
+
+
+def record_event(conn, event_type, payload):
+    """Append one event in the caller's transaction."""
+    record_events(conn, [(event_type, payload)])
+
+
+def record_events(conn, events):
+    now = datetime.utcnow().isoformat()
+    for event_type, payload in events:
+        event_id = conn.execute(
+            "INSERT INTO change_events (type, payload_json, created_at) VALUES (?, ?, ?)",
+            (event_type, json.dumps(payload), now)
+        ).lastrowid
+        if event_id % _PRUNE_EVERY == 0:
+            conn.execute("DELETE FROM change_events WHERE id <= ?", (event_id - CHANGE_EVENTS_KEEP,))
+
+
+def record_submission_changes(conn, sub_ids):
+    """Emit a "submission" event with the new status fields of each row."""
+    sub_ids = list(sub_ids)
+    if not sub_ids:
+        return
+    rows = conn.execute(f"""
+        SELECT id, status, pickedBy, pickedByEmail, event_id, updated_at FROM admin_submissions
+        WHERE id IN ({", ".join("?" for _ in sub_ids)})
+    """, sub_ids).fetchall()
+    record_events(conn, [("submission", dict(row)) for row in rows])
+
+
+def latest_event_id():
+    return query_value("SELECT MAX(id) FROM change_events", default=0)
+
+
+def events_after(last_id, limit=500):
+    return query_all("""
+        SELECT id, type, payload_json FROM change_events
+        WHERE id > ? ORDER BY id LIMIT ?
+    """, (last_id, limit))
+
+
+def _format(event_id, event_type, data):
+    return f"id: {event_id}\nevent: {event_type}\ndata: {data}\n\n"
+
+
+def stream(last_id=None):
+    """
+    Yield SSE frames for events after `last_id` (or only new events when
+    None), with heartbeat comments, until SSE_MAX_STREAM_SECONDS pass.
+    """
+    yield f"retry: {SSE_RETRY_MS}\n\n"
+    if last_id is None:
+        last_id = latest_event_id()
+    else:
+        oldest = query_value("SELECT MIN(id) FROM change_events", default=0)
+        if oldest and last_id < oldest - 1:
+            # Missed events were pruned: the client must refetch its lists
+            last_id = latest_event_id()
+            yield _format(last_id, "reset", "{}")
+
+    started = last_beat = time.monotonic()
+    while time.monotonic() - started < SSE_MAX_STREAM_SECONDS:
+        rows = events_after(last_id)
+        for row in rows:
+            last_id = row["id"]
+            yield _format(row["id"], row["type"], row["payload_json"])
+        now = time.monotonic()
+        if rows:
+            last_beat = now
+        elif now - last_beat >= SSE_HEARTBEAT_SECONDS:
+            last_beat = now
+            yield ": keep-alive\n\n"
+        if len(rows) < 500:
+            time.sleep(SSE_POLL_INTERVAL)
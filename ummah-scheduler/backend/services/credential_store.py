@@ -0,0 +1,70 @@
+# ummah-scheduler/backend/services/credential_store.py
+"""
+Mentor OAuth credentials shared by every worker.
+
+Tokens live in the mentor_credentials table so a mentor who logged in on
+one worker (or before a restart) is authenticated on all of them. The
+table is in the separate credentials database (db.CREDENTIALS_DB_PATH,
+attached to every connection), never in the tracked admin_data.db. Reads go
+through a short in-process TTL cache; after the TTL the row is re-read so
+a re-login on another worker is picked up.
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from db import execute, query_all, query_one
+
+CREDENTIAL_CACHE_TTL = float(os.getenv("CREDENTIAL_CACHE_TTL", "60"))
+
+_cache = {}  # { email: (expires_at, token_dict) }
+_lock = threading.Lock()
+
+
+def _remember(email, data):
+    with _lock:
+        _cache[email] = (time.monotonic() + CREDENTIAL_CACHE_TTL, data)
+
+
+def save_credentials(email, data):
+    """Store (or replace) the token dict for `email`."""
+    execute("""
+        INSERT INTO credentials.mentor_credentials (email, token_json, updated_at) VALUES (?, ?, ?)
+        ON CONFLICT(email) DO UPDATE SET
+            token_json = excluded.token_json,
+            updated_at = excluded.updated_at
+    """, (email, json.dumps(data), datetime.utcnow().isoformat()))
+    _remember(email, data)
+
+
+def load_credentials(email):
+    """Token dict for `email`, or None if that mentor never logged in."""
+    if not email:
+        return None
+    with _lock:
+        entry = _cache.get(email)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+
+    row = query_one("SELECT token_json FROM credentials.mentor_credentials WHERE email = ?", (email,))
+    if row is None:
+        # Misses aren't cached: a login on another worker must show up at once
+        with _lock:
+            _cache.pop(email, None)
+        return None
+    data = json.loads(row["token_json"])
+    _remember(email, data)
+    return data
+
+
+def delete_credentials(email):
+    execute("DELETE FROM credentials.mentor_credentials WHERE email = ?", (email,))
+    with _lock:
+        _cache.pop(email, None)
+
+
+def authenticated_mentors():
+    """Emails of every mentor with stored credentials."""
+    return [row["email"] for row in query_all("SELECT email FROM credentials.mentor_credentials ORDER BY email")]
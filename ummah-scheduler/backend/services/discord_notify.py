@@ -0,0 +1,140 @@
+# ummah-scheduler/backend/services/discord_notify.py
+"""
+New-submission notifications for Discord.
+
+Shared by scripts/monday_to_discord.py (cron poster) and the Monday.com
+webhook receiver: parses each raw Monday item with parse_monday_item (so
+MONDAY_COLUMN_MAP decides which columns are read), builds its embed,
+routes it to the industry channels, and records delivered (item, channel)
+pairs in a discord_posted ledger table so an item is never posted to a
+channel twice.
+"""
+from datetime import datetime
+
+from app_config import DISCORD_CHANNEL_WEBHOOKS as CHANNEL_WEBHOOKS
+from app_config import FRONTEND_URL  # clickable scheduler link
+from services import discord_webhook
+from services.monday_parser import parse_monday_item, split_values
+
+# Channel recorded for legacy IDs, which didn't track where they were posted
+ALL_CHANNELS = "*"
+
+LEDGER_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS discord_posted (
+        item_id TEXT NOT NULL,
+        channel TEXT NOT NULL,
+        posted_at TEXT NOT NULL,
+        PRIMARY KEY (item_id, channel)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_discord_posted_posted_at ON discord_posted(posted_at)",
+]
+
+
+def field(name, value):
+    """Embed field; Discord rejects empty values and caps them at 1024 chars."""
+    value = (value or "N/A").strip() or "N/A"
+    return {"name": name, "value": value[:1024], "inline": False}
+
+
+def build_embed(submission):
+    """Compact embed for one parsed Monday item"""
+    return {
+        "title": "New Career-Prep Submission",
+        "url": FRONTEND_URL,
+        "fields": [
+            field("Name", submission["name"]),
+            field("Industry", submission["industry"]),
+            field("Resume", submission["resume"]),
+            field("Availability", submission["availability"]),
+        ],
+    }
+
+
+def webhooks_for(submission):
+    """[(channel, webhook url)] the parsed item belongs in"""
+    industries = split_values(submission["industry"])
+
+    targets = []
+    for industry in industries:
+        channel = None
+        if "business" in industry.lower():
+            channel = "business"
+        elif "education" in industry.lower():
+            channel = "education"
+        elif "engineering" in industry.lower():
+            channel = "engineering"
+        elif "finance" in industry.lower():
+            channel = "finance"
+        elif "information technology" in industry.lower() or industry.lower() == "it":
+            channel = "it"
+        elif "law" in industry.lower():
+            channel = "law"
+
+        if channel and CHANNEL_WEBHOOKS[channel] and (channel, CHANNEL_WEBHOOKS[channel]) not in targets:
+            targets.append((channel, CHANNEL_WEBHOOKS[channel]))
+
+    # Fall back to the general channel when no industry channel matched
+    return targets or [("general", CHANNEL_WEBHOOKS["general"])]
+
+
+# ---------------------------
+# Ledger
+# ---------------------------
+def posted_channels(conn, item_ids):
+    """{item_id: {channel, ...}} for the given IDs"""
+    item_ids = list(item_ids)
+    if not item_ids:
+        return {}
+    posted = {}
+    rows = conn.execute(
+        f"SELECT item_id, channel FROM discord_posted WHERE item_id IN ({', '.join('?' for _ in item_ids)})",
+        item_ids
+    )
+    for item_id, channel in rows:
+        posted.setdefault(item_id, set()).add(channel)
+    return posted
+
+
+def record_posted(conn, pairs):
+    now = datetime.utcnow().isoformat()
+    conn.executemany(
+        "INSERT OR IGNORE INTO discord_posted (item_id, channel, posted_at) VALUES (?, ?, ?)",
+        [(item_id, channel, now) for item_id, channel in pairs]
+    )
+
+
+def post_items(items, posted):
+    """
+    Queue every (item, channel) not in `posted` and send them in one
+    concurrent, rate-limit-aware pass. Returns (delivered pairs, failed item IDs);
+    posts that timed out after sending count as delivered.
+    """
+    messages = []
+    for item in items:
+        done = posted.get(item["id"], set())
+        if ALL_CHANNELS in done:
+            continue
+        submission = parse_monday_item(item)
+        embed = build_embed(submission)
+        for channel, url in webhooks_for(submission):
+            if channel in done:
+                continue
+            if not discord_webhook.is_webhook_url(url):
+                print(f"⚠️ Skipping invalid webhook for {channel} (item {item['id']}) → url={repr(url)}")
+                continue
+            messages.append((url, embed, (item["id"], channel)))
+
+    failures = discord_webhook.dispatch(messages)
+    for (item_id, channel), error in list(failures.items()):
+        if isinstance(error, discord_webhook.MaybeDelivered):
+            # At-most-once: recorded as posted rather than risking a duplicate
+            print(f"⚠️ Posting {item_id} to {channel} timed out; assuming it was delivered → {error}")
+            del failures[(item_id, channel)]
+        else:
+            print(f"❌ Error posting {item_id} to {channel} → {error}")
+
+    delivered = [key for _, _, key in messages if key not in failures]
+    print(f"✅ Posted {len(delivered)}/{len(messages)} channel posts")
+    return delivered, {item_id for item_id, _ in failures}
@@ -0,0 +1,174 @@
+# ummah-scheduler/backend/services/discord_webhook.py
+"""
+Rate-limit-aware Discord webhook dispatcher.
+
+Messages for different webhooks are posted concurrently (one worker per
+webhook, so each webhook's bucket is only ever used by one thread).
+Embeds bound for the same webhook are packed into as few messages as
+Discord allows. Before each post the webhook's bucket is consulted
+(X-RateLimit-Remaining / X-RateLimit-Reset-After), and a 429 is retried
+after its advertised retry_after instead of being dropped.
+
+    failures = dispatch([(webhook_url, embed, key), ...])
+    # {key: "error message"} for every key with an undelivered embed;
+    # MaybeDelivered errors (read timeouts) may have been posted anyway
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from services import http_client
+
+DISCORD_MAX_WORKERS = int(os.getenv("DISCORD_MAX_WORKERS", "8"))
+DISCORD_MAX_ATTEMPTS = int(os.getenv("DISCORD_MAX_ATTEMPTS", "5"))
+
+# Discord limits per message
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+# Overridable so local runs can point at fakes.discord
+WEBHOOK_PREFIX = os.getenv("DISCORD_WEBHOOK_PREFIX", "https://discord.com/api/webhooks/")
+
+class MaybeDelivered(str):
+    """Error after Discord received the message (read timeout): it may have been posted."""
+
+
+_buckets = {}  # { webhook_url: {"remaining": int, "reset_at": monotonic seconds} }
+_buckets_lock = threading.Lock()
+
+
+def is_webhook_url(url):
+    return bool(url) and url.strip().startswith(WEBHOOK_PREFIX)
+
+
+def embed_size(embed):
+    """Characters Discord counts towards the 6000-per-message embed limit."""
+    size = len(embed.get("title", "")) + len(embed.get("description", ""))
+    size += len(embed.get("footer", {}).get("text", "")) + len(embed.get("author", {}).get("name", ""))
+    for field in embed.get("fields", []):
+        size += len(field.get("name", "")) + len(field.get("value", ""))
+    return size
+
+
+def pack_embeds(entries):
+    """Group [(embed, key)] into message-sized batches, preserving order."""
+    batches, batch, chars = [], [], 0
+    for embed, key in entries:
+        size = embed_size(embed)
+        if batch and (len(batch) >= MAX_EMBEDS_PER_MESSAGE or chars + size > MAX_EMBED_CHARS_PER_MESSAGE):
+            batches.append(batch)
+            batch, chars = [], 0
+        batch.append((embed, key))
+        chars += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+# ---------------------------
+# Rate-limit buckets
+# ---------------------------
+def _wait_for_bucket(url):
+    with _buckets_lock:
+        bucket = dict(_buckets.get(url, {}))
+    if bucket.get("remaining", 1) <= 0:
+        delay = bucket["reset_at"] - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _update_bucket(url, resp):
+    remaining = resp.headers.get("X-RateLimit-Remaining")
+    reset_after = resp.headers.get("X-RateLimit-Reset-After")
+    if remaining is None or reset_after is None:
+        return
+    try:
+        bucket = {"remaining": int(remaining), "reset_at": time.monotonic() + float(reset_after)}
+    except ValueError:
+        return
+    with _buckets_lock:
+        _buckets[url] = bucket
+
+
+def _retry_after(resp):
+    """Seconds to wait after a 429, from the JSON body or the headers."""
+    try:
+        delay = float(resp.json().get("retry_after"))
+    except (ValueError, TypeError, AttributeError):
+        delay = http_client.retry_after_delay(resp)
+        if delay is None:
+            delay = float(resp.headers.get("X-RateLimit-Reset-After") or 1)
+    return max(delay, 0)
+
+
+# ---------------------------
+# Sending
+# ---------------------------
+def send_message(url, payload):
+    """Post one message, waiting out rate limits. Returns None or an error string."""
+    error = None
+    for attempt in range(DISCORD_MAX_ATTEMPTS):
+        _wait_for_bucket(url)
+        try:
+            # Retries are handled here so 429s follow Discord's own delays
+            resp = http_client.post(url, json=payload, params={"wait": "true"}, max_retries=0)
+        except requests.ReadTimeout as e:
+            # The message may already have been posted: not retried here, and
+            # callers record it as sent so later runs don't post it again
+            return MaybeDelivered(str(e))
+        except requests.RequestException as e:
+            error = str(e)
+            time.sleep(http_client.backoff_delay(attempt))
+            continue
+
+        _update_bucket(url, resp)
+        if resp.status_code == 429:
+            delay = _retry_after(resp)
+            scope = "global" if resp.headers.get("X-RateLimit-Global") else "webhook"
+            print(f"⏳ Discord {scope} rate limit; retrying in {delay:.2f}s")
+            time.sleep(delay)
+            error = "rate limited"
+            continue
+        if resp.status_code >= 500:
+            error = f"HTTP {resp.status_code}"
+            time.sleep(http_client.backoff_delay(attempt))
+            continue
+        if resp.status_code >= 400:
+            return f"HTTP {resp.status_code}: {resp.text[:200]}"
+        return None
+    return error
+
+
+def _drain(url, entries):
+    failures = {}
+    for batch in pack_embeds(entries):
+        error = send_message(url, {"embeds": [embed for embed, _ in batch]})
+        if error:
+            for _, key in batch:
+                failures[key] = error
+    return failures
+
+
+def dispatch(messages, max_workers=None):
+    """
+    Deliver [(webhook_url, embed, key)] and return {key: error} for failures.
+    Order is kept within each webhook; webhooks are drained in parallel.
+    """
+    by_url, queued = {}, set()
+    for url, embed, key in messages:
+        url = url.strip()
+        if (url, key) not in queued:  # two industries can share a channel
+            queued.add((url, key))
+            by_url.setdefault(url, []).append((embed, key))
+    if not by_url:
+        return {}
+
+    failures = {}
+    workers = min(max_workers or DISCORD_MAX_WORKERS, len(by_url))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="discord") as pool:
+        for result in pool.map(lambda args: _drain(*args), by_url.items()):
+            failures.update(result)
+    return failures
@@ -0,0 +1,93 @@
+# ummah-scheduler/backend/services/google_services.py
+"""
+Google API service factory.
+
+Discovery documents come from the static copies bundled with
+google-api-python-client and are parsed once per process. Built service
+objects are kept in a bounded LRU keyed by credential identity (e.g. the
+mentor's email), so a repeat schedule / cancel call reuses the client and
+its already-refreshed credentials. An entry is rebuilt when the refresh
+token behind that identity changes (re-login / re-consent).
+
+GOOGLE_API_ROOT_URL points every API (batch endpoint included) at another
+host, e.g. fakes.google_calendar for local runs and load tests.
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
+
+GOOGLE_SERVICE_CACHE_SIZE = int(os.getenv("GOOGLE_SERVICE_CACHE_SIZE", "64"))
+GOOGLE_API_ROOT_URL = os.getenv("GOOGLE_API_ROOT_URL")
+
+_documents = {}
+_services = OrderedDict()
+_lock = threading.Lock()
+
+
+def discovery_document(api, version):
+    """Parsed discovery document from the bundled static copy (loaded once)."""
+    key = (api, version)
+    doc = _documents.get(key)
+    if doc is None:
+        content = discovery_cache.get_static_doc(api, version)
+        if content is None:
+            raise ValueError(f"No bundled discovery document for {api} {version}")
+        doc = json.loads(content)
+        if GOOGLE_API_ROOT_URL:
+            doc.update(rootUrl=GOOGLE_API_ROOT_URL, mtlsRootUrl=GOOGLE_API_ROOT_URL)
+        _documents[key] = doc
+    return doc
+
+
+def _fingerprint(credentials):
+    secret = getattr(credentials, "refresh_token", None) or getattr(credentials, "token", None) or ""
+    return hashlib.sha256(secret.encode()).hexdigest()
+
+
+def get_service(api, version, credentials, identity=None):
+    """
+    Return a service object for `credentials`. With an `identity` the service
+    is cached; without one (e.g. a one-off OAuth callback) it is only built
+    from the cached discovery document.
+    """
+    doc = discovery_document(api, version)
+    if identity is None:
+        return build_from_document(doc, credentials=credentials)
+
+    # httplib2 connections aren't thread-safe, so each thread gets its own client
+    key = (api, version, identity, threading.get_ident())
+    fingerprint = _fingerprint(credentials)
+    with _lock:
+        entry = _services.get(key)
+        if entry and entry[0] == fingerprint:
+            _services.move_to_end(key)
+            return entry[1]
+
+    service = build_from_document(doc, credentials=credentials)
+    with _lock:
+        _services[key] = (fingerprint, service)
+        _services.move_to_end(key)
+        while len(_services) > GOOGLE_SERVICE_CACHE_SIZE:
+            _services.popitem(last=False)
+    return service
+
+
+def service_credentials(service):
+    """
+    The credentials a service object actually sends. A cached service keeps
+    the ones it was first built with, not the caller's, so read refreshed
+    tokens from here.
+    """
+    return service._http.credentials
+
+
+def evict(identity):
+    """Drop every cached service built for `identity` (e.g. on logout)."""
+    with _lock:
+        for key in [key for key in _services if key[2] == identity]:
+            del _services[key]
@@ -0,0 +1,91 @@
+# ummah-scheduler/backend/services/http_cache.py
+"""
+Conditional GETs and response compression for the list endpoints.
+
+@conditional("admin_submissions", ...) tags a view's response with an ETag
+built from the request URL and the tables' write counters (data_versions,
+bumped by triggers), and answers If-None-Match with 304 before the view
+runs. compress_response() is an after_request hook that gzips (or, when
+the optional brotli package is installed, brotli-encodes) larger bodies.
+"""
+import gzip
+import hashlib
+import os
+from functools import wraps
+
+from flask import make_response, request
+
+from db import table_versions
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+COMPRESS_LEVEL = int(os.getenv("COMPRESS_LEVEL", "6"))
+COMPRESSIBLE_TYPES = {"application/json", "text/html", "text/plain", "text/csv"}
+
+
+def make_etag(tables):
+    versions = table_versions(tables)
+    key = request.full_path + "|" + ",".join(f"{t}:{versions.get(t, 0)}" for t in tables)
+    return hashlib.sha1(key.encode()).hexdigest()[:20]
+
+
+def conditional(*tables):
+    """Serve 304 when nothing in `tables` changed since the client's copy."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag = make_etag(tables)
+            if request.if_none_match.contains_weak(etag):
+                response = make_response("", 304)
+                response.set_etag(etag, weak=True)
+                return response
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                response.set_etag(etag, weak=True)
+                # Let browsers cache but always revalidate with If-None-Match
+                response.headers["Cache-Control"] = "no-cache"
+            return response
+        return wrapper
+    return decorator
+
+
+def _accepted_encoding():
+    accepted = request.accept_encodings
+    if brotli is not None and accepted["br"]:
+        return "br"
+    if accepted["gzip"]:
+        return "gzip"
+    return None
+
+
+def compress_response(response):
+    """after_request hook: compress large text/JSON bodies the client accepts."""
+    if (
+        response.status_code != 200
+        or response.is_streamed
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_TYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = _accepted_encoding()
+    if encoding is None:
+        return response
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+
+    if encoding == "br":
+        body = brotli.compress(body, quality=min(COMPRESS_LEVEL, 11))
+    else:
+        body = gzip.compress(body, compresslevel=COMPRESS_LEVEL)
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    return response
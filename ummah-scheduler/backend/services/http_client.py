@@ -0,0 +1,109 @@
+# ummah-scheduler/backend/services/http_client.py
+"""
+Shared outbound HTTP client for Monday.com, Discord and other upstreams.
+
+One keep-alive requests.Session per host (so TLS handshakes are reused),
+default connect/read timeouts on every call, and retries with jittered
+exponential backoff that honour Retry-After on 429 and 5xx responses.
+"""
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_BASE = float(os.getenv("HTTP_BACKOFF_BASE", "0.5"))
+HTTP_MAX_RETRY_DELAY = float(os.getenv("HTTP_MAX_RETRY_DELAY", "60"))
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(url):
+    """Return the pooled keep-alive session for the URL's scheme + host."""
+    parts = urlsplit(url)
+    base = f"{parts.scheme}://{parts.netloc}"
+    with _sessions_lock:
+        session = _sessions.get(base)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=0)
+            session.mount(base, adapter)
+            _sessions[base] = session
+        return session
+
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff: uniform(0, base * 2^attempt)."""
+    return random.uniform(0, min(HTTP_MAX_RETRY_DELAY, HTTP_BACKOFF_BASE * (2 ** attempt)))
+
+
+def retry_after_delay(resp):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0), HTTP_MAX_RETRY_DELAY)
+
+
+def request(method, url, timeout=None, max_retries=None, idempotent=None, **kwargs):
+    """
+    Send a request through the pooled session for the URL's host.
+    `idempotent` allows retrying read timeouts for POST-style reads (e.g. GraphQL queries).
+    """
+    method = method.upper()
+    timeout = timeout or (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+    retries = HTTP_MAX_RETRIES if max_retries is None else max_retries
+    if idempotent is None:
+        idempotent = method in IDEMPOTENT_METHODS
+    session = get_session(url)
+
+    for attempt in range(retries + 1):
+        try:
+            resp = session.request(method, url, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            # A read timeout may mean the upstream already acted on the request
+            unsafe = isinstance(e, requests.ReadTimeout) and not idempotent
+            if attempt >= retries or unsafe:
+                raise
+            delay = backoff_delay(attempt)
+            print(f"⚠️ {method} {urlsplit(url).netloc} failed ({e.__class__.__name__}); retrying in {delay:.1f}s")
+            time.sleep(delay)
+            continue
+
+        if resp.status_code in RETRY_STATUSES and attempt < retries:
+            delay = retry_after_delay(resp)
+            if delay is None:
+                delay = backoff_delay(attempt)
+            print(f"⚠️ {method} {urlsplit(url).netloc} returned {resp.status_code}; retrying in {delay:.1f}s")
+            resp.close()
+            time.sleep(delay)
+            continue
+        return resp
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
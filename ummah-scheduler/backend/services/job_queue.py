@@ -0,0 +1,124 @@
+# ummah-scheduler/backend/services/job_queue.py
+"""
+In-process background job queue.
+
+Slow work (e.g. Google Calendar inserts) runs on a small thread pool so
+request workers return immediately with a job id. Job state is kept in
+the jobs table, so any worker can answer a status poll.
+
+Jobs still queued/running after JOB_STALE_SECONDS (their worker was
+restarted mid-job) are marked failed, and finished jobs are pruned after
+JOB_RETENTION_HOURS, by sweep_jobs() at startup and every
+JOB_SWEEP_INTERVAL seconds on submit.
+
+    job_id = submit("schedule_meeting", payload, handler)
+    get_job(job_id)  # {"jobId", "kind", "status", "result", "error", ...}
+"""
+import json
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from db import execute, query_one, transaction
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_STALE_SECONDS = int(os.getenv("JOB_STALE_SECONDS", "900"))
+JOB_RETENTION_HOURS = float(os.getenv("JOB_RETENTION_HOURS", "72"))
+JOB_SWEEP_INTERVAL = 300
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+_executor = None
+_last_sweep = 0.0
+
+
+def _pool():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="job")
+    return _executor
+
+
+def _set_state(job_id, status, result=None, error=None):
+    execute("""
+        UPDATE jobs SET status = ?, result_json = ?, error = ?, updated_at = ?
+        WHERE id = ?
+    """, (
+        status,
+        json.dumps(result) if result is not None else None,
+        error,
+        datetime.utcnow().isoformat(),
+        job_id
+    ))
+
+
+def _run(job_id, handler, payload):
+    _set_state(job_id, RUNNING)
+    try:
+        result = handler(payload)
+    except Exception as e:
+        print(f"❌ Job {job_id} failed:", e)
+        _set_state(job_id, FAILED, error=str(e))
+    else:
+        _set_state(job_id, DONE, result=result)
+
+
+def sweep_jobs():
+    """
+    Fail jobs left queued/running by a stopped worker and prune old finished
+    jobs. Staleness goes by age, not "at startup", since other workers may
+    still be running their own jobs.
+    """
+    now = datetime.utcnow()
+    stale_before = (now - timedelta(seconds=JOB_STALE_SECONDS)).isoformat()
+    prune_before = (now - timedelta(hours=JOB_RETENTION_HOURS)).isoformat()
+    with transaction() as conn:
+        failed = conn.execute("""
+            UPDATE jobs SET status = ?, error = ?, updated_at = ?
+            WHERE status IN (?, ?) AND updated_at < ?
+        """, (FAILED, "Interrupted: the worker running this job stopped", now.isoformat(),
+              QUEUED, RUNNING, stale_before)).rowcount
+        pruned = conn.execute("""
+            DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?
+        """, (DONE, FAILED, prune_before)).rowcount
+    if failed or pruned:
+        print(f"🧹 Jobs: {failed} interrupted marked failed, {pruned} finished pruned")
+    return failed, pruned
+
+
+def _maybe_sweep():
+    global _last_sweep
+    if time.monotonic() - _last_sweep >= JOB_SWEEP_INTERVAL:
+        _last_sweep = time.monotonic()
+        sweep_jobs()
+
+
+def submit(kind, payload, handler):
+    """Record a queued job and hand `handler(payload)` to the pool."""
+    _maybe_sweep()
+    job_id = uuid.uuid4().hex
+    now = datetime.utcnow().isoformat()
+    execute("""
+        INSERT INTO jobs (id, kind, status, payload_json, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, (job_id, kind, QUEUED, json.dumps(payload), now, now))
+    _pool().submit(_run, job_id, handler, payload)
+    return job_id
+
+
+def get_job(job_id, kind=None):
+    """Job status dict, or None if unknown (or of another kind)."""
+    row = query_one("SELECT * FROM jobs WHERE id = ?", (job_id,))
+    if row is None or (kind and row["kind"] != kind):
+        return None
+    return {
+        "jobId": row["id"],
+        "kind": row["kind"],
+        "status": row["status"],
+        "result": json.loads(row["result_json"]) if row["result_json"] else None,
+        "error": row["error"],
+        "createdAt": row["created_at"],
+        "updatedAt": row["updated_at"],
+    }
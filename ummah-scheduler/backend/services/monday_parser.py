@@ -1,22 +1,65 @@
 # services/monday_parser.py
+"""
+Flatten raw Monday.com items into submission dicts.
+
+MONDAY_COLUMN_MAP (field -> board column id) is compiled once into a
+reverse lookup, so parsing is a single pass over an item's column_values.
+The same map drives the GraphQL projection in services.monday_poll, so
+only these columns are ever requested. Point fields at other board columns
+with a JSON object in the MONDAY_COLUMN_MAP environment variable; only the
+fields below can be remapped (they are the monday_items columns), and any
+other key is rejected at import.
+"""
+import json
+import os
+
+MONDAY_COLUMN_MAP = {
+    "email": "email_mksanes7",
+    "phone": "phone_mksam3k4",
+    "industry": "dropdown_mksazheg",
+    "academicStanding": "dropdown_mksank0m",
+    "lookingFor": "dropdown_mksa2xnv",
+    "resume": "files_1",
+    "howTheyHeard": "dropdown_mksatymx",
+    "availability": "dropdown_mksddh69",
+    "timeline": "project_timeline",
+    "otherInfo": "text9",
+    "submitted": "last_updated",
+    "status": "status_1",
+}
+_overrides = json.loads(os.getenv("MONDAY_COLUMN_MAP") or "{}")
+_unknown = sorted(set(_overrides) - set(MONDAY_COLUMN_MAP))
+if _unknown:
+    raise ValueError(f"MONDAY_COLUMN_MAP: unknown field(s) {', '.join(_unknown)}; "
+                     f"expected some of {', '.join(MONDAY_COLUMN_MAP)}")
+MONDAY_COLUMN_MAP.update(_overrides)
+
+# Compiled once: column id -> field, and the ids to request
+FIELD_BY_COLUMN = {column_id: field for field, column_id in MONDAY_COLUMN_MAP.items()}
+COLUMN_IDS = list(FIELD_BY_COLUMN)
+
+# Value when the column is missing from the item
+_MISSING = {"submitted": None, "status": ""}
+
+# Dropdown columns Monday joins into one ", "-separated text value;
+# indexed per value in submission_tags (migration 013)
+MULTI_VALUE_FIELDS = ["industry", "lookingFor", "availability"]
+
 
 def parse_monday_item(item):
-    # Extract and flatten columns like in your working Discord bot
-    columns = {c["id"]: c.get("text", "") for c in item["column_values"]}
-    
-    return {
-        "id": item["id"],
-        "name": item["name"],
-        "email": columns.get("email_mksanes7", "N/A"),
-        "phone": columns.get("phone_mksam3k4", "N/A"),
-        "industry": columns.get("dropdown_mksazheg", "N/A"),
-        "academicStanding": columns.get("dropdown_mksank0m", "N/A"),
-        "lookingFor": columns.get("dropdown_mksa2xnv", "N/A"),
-        "resume": columns.get("files_1", "N/A"),
-        "howTheyHeard": columns.get("dropdown_mksatymx", "N/A"),
-        "availability": columns.get("dropdown_mksddh69", "N/A"),
-        "timeline": columns.get("project_timeline", "N/A"),
-        "otherInfo": columns.get("text9", "N/A"),
-        "submitted": columns.get("last_updated", item["created_at"]),
-        "status": columns.get("status_1", ""),
-    }
+    parsed = {"id": item["id"], "name": item["name"]}
+    parsed.update((field, _MISSING.get(field, "N/A")) for field in MONDAY_COLUMN_MAP)
+    for column in item["column_values"]:
+        field = FIELD_BY_COLUMN.get(column["id"])
+        if field:
+            parsed[field] = column.get("text", "")
+    if parsed["submitted"] is None:
+        parsed["submitted"] = item["created_at"]
+    return parsed
+
+
+def split_values(text):
+    """'Finance, Information Technology' -> ['Finance', 'Information Technology']"""
+    if not text:
+        return []
+    return [value.strip() for value in text.split(",") if value.strip() and value.strip() != "N/A"]
@@ -1,42 +1,192 @@
 # ummah-scheduler/backend/services/monday_poll.py
+"""
+Monday.com GraphQL reads.
+
+Item queries project only the mapped board columns (column_values(ids:))
+and their `text`, never the bulky `value` JSON. Item pages are parsed
+straight off the response stream with ijson, one small item at a time,
+instead of loading the whole body and tree.
+"""
+import json
 import os
-import requests
 from dotenv import load_dotenv
 from pathlib import Path
-from services.monday_parser import parse_monday_item
+
+import ijson
+from ijson.common import ObjectBuilder
+
+from services import http_client
+from services.monday_parser import COLUMN_IDS, parse_monday_item
 
 load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent / '.env')
 
 MONDAY_API_KEY = os.getenv("MONDAY_API_KEY")
 MONDAY_BOARD_ID = os.getenv("MONDAY_BOARD_ID")
-MONDAY_API = "https://api.monday.com/v2"
+MONDAY_API = os.getenv("MONDAY_API_URL", "https://api.monday.com/v2")
+
+# Monday caps items_page / next_items_page at 500 items per call
+MONDAY_PAGE_SIZE = 500
+
+ITEM_FIELDS = """
+    id
+    name
+    state
+    created_at
+    updated_at
+    column_values(ids: %s) {
+      id
+      text
+    }
+""" % json.dumps(COLUMN_IDS)
+
+FIRST_PAGE_QUERY = """
+query ($boardId: [ID!], $limit: Int!, $queryParams: ItemsQuery) {
+  boards(ids: $boardId) {
+    items_page(limit: $limit, query_params: $queryParams) {
+      cursor
+      items { %s }
+    }
+  }
+}
+""" % ITEM_FIELDS
+
+NEXT_PAGE_QUERY = """
+query ($cursor: String!, $limit: Int!) {
+  next_items_page(limit: $limit, cursor: $cursor) {
+    cursor
+    items { %s }
+  }
+}
+""" % ITEM_FIELDS
+
+ITEMS_BY_ID_QUERY = """
+query ($ids: [ID!]) {
+  items(ids: $ids) { %s }
+}
+""" % ITEM_FIELDS
 
-def get_latest_items(limit: int = 20):
-    query = f"""
-    query {{
-      boards(ids: [{MONDAY_BOARD_ID}]) {{
-        items_page(limit: {limit}) {{
-          items {{
-            id
-            name
-            created_at
-            column_values {{
-              id
-              text
-              value
-            }}
-          }}
-        }}
-      }}
-    }}
-    """
 
-    resp = requests.post(
+def run_query(query, variables=None):
+    """POST a GraphQL query to Monday.com and return its `data` block."""
+    resp = http_client.post(
         MONDAY_API,
         headers={"Authorization": MONDAY_API_KEY},
-        json={"query": query}
+        json={"query": query, "variables": variables or {}},
+        idempotent=True
     )
-
     resp.raise_for_status()
-    items = resp.json()["data"]["boards"][0]["items_page"]["items"]
-    return [parse_monday_item(item) for item in items]
\ No newline at end of file
+    data = resp.json()
+    if "errors" in data:
+        raise Exception(f"Monday API error: {data['errors']}")
+    return data["data"]
+
+
+def _stream_items(raw, items_path, cursor_path, cursor_box):
+    """Yield items under `items_path` as they finish parsing; stores the cursor in cursor_box."""
+    item_prefix = f"{items_path}.item"
+    builder, errors = None, []
+    for prefix, event, value in ijson.parse(raw):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == item_prefix and event == "end_map":
+                yield builder.value
+                builder = None
+        elif prefix == item_prefix and event == "start_map":
+            builder = ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == cursor_path:
+            cursor_box.append(value)
+        elif prefix == "errors.item.message":
+            errors.append(value)
+    if errors:
+        raise Exception(f"Monday API error: {errors}")
+
+
+def run_items_query(query, variables, items_path, cursor_path=None):
+    """
+    Run an item query and return (raw_items, cursor). Paths are dotted
+    (`item` = array element), e.g. "data.boards.item.items_page.items".
+    """
+    resp = http_client.post(
+        MONDAY_API,
+        headers={"Authorization": MONDAY_API_KEY},
+        json={"query": query, "variables": variables or {}},
+        idempotent=True,
+        stream=True
+    )
+    with resp:
+        resp.raise_for_status()
+        resp.raw.decode_content = True  # undo gzip transfer encoding
+        cursor = []
+        items = list(_stream_items(resp.raw, items_path, cursor_path, cursor))
+    return items, cursor[0] if cursor else None
+
+
+def iter_item_pages(cursor=None, query_params=None, page_size=MONDAY_PAGE_SIZE):
+    """
+    Walk the board with items_page / next_items_page cursors.
+    Yields (raw_items, next_cursor) per page; next_cursor is None on the last page.
+    Pass a saved cursor to resume a walk (Monday keeps cursors for 60 minutes).
+    """
+    if cursor is None:
+        items, cursor = run_items_query(FIRST_PAGE_QUERY, {
+            "boardId": [MONDAY_BOARD_ID],
+            "limit": page_size,
+            "queryParams": query_params,
+        }, "data.boards.item.items_page.items", "data.boards.item.items_page.cursor")
+    else:
+        items, cursor = _next_page(cursor, page_size)
+
+    while True:
+        yield items, cursor
+        if not cursor:
+            return
+        items, cursor = _next_page(cursor, page_size)
+
+
+def _next_page(cursor, page_size):
+    return run_items_query(NEXT_PAGE_QUERY, {"cursor": cursor, "limit": page_size},
+                           "data.next_items_page.items", "data.next_items_page.cursor")
+
+
+def updated_since_params(watermark):
+    """
+    items_page filter for items updated on/after the watermark's day, newest
+    first: the filter only has day granularity, so callers stop paging once
+    they reach items older than the watermark itself.
+    """
+    return {
+        "rules": [{
+            "column_id": "__last_updated__",
+            "compare_value": ["EXACT", watermark[:10]],
+            "compare_attribute": "UPDATED_AT",
+            "operator": "greater_than_or_equals",
+        }],
+        "order_by": [{"column_id": "__last_updated__", "direction": "desc"}],
+    }
+
+
+def get_items_by_id(item_ids):
+    """Raw items for the given IDs (missing / deleted items are left out)."""
+    if not item_ids:
+        return []
+    items, _ = run_items_query(ITEMS_BY_ID_QUERY, {"ids": [str(item_id) for item_id in item_ids]}, "data.items")
+    return items
+
+
+def created_since_params(watermark):
+    """items_page filter for items created on/after the watermark's day, oldest first."""
+    return {
+        "rules": [{
+            "column_id": "__creation_log__",
+            "compare_value": ["EXACT", watermark[:10]],
+            "operator": "greater_than_or_equals",
+        }],
+        "order_by": [{"column_id": "__creation_log__", "direction": "asc"}],
+    }
+
+
+def get_latest_items(limit: int = 20):
+    items, _ = run_items_query(FIRST_PAGE_QUERY, {"boardId": [MONDAY_BOARD_ID], "limit": limit},
+                               "data.boards.item.items_page.items")
+    return [parse_monday_item(item) for item in items]
@@ -0,0 +1,307 @@
+# ummah-scheduler/backend/services/monday_sync.py
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+from db import query_all, transaction
+from services.admin_stats import tracking_submissions
+from services.change_events import record_events
+from services.pagination import fetch_keyset_page
+from services.monday_parser import MULTI_VALUE_FIELDS, parse_monday_item
+from services.monday_poll import iter_item_pages, updated_since_params
+from services.response_cache import cached
+
+# How often (seconds) the background thread refreshes the local mirror
+MONDAY_SYNC_INTERVAL = int(os.getenv("MONDAY_SYNC_INTERVAL", "60"))
+# A worker holding the sync lease must renew it within this many seconds
+MONDAY_SYNC_LEASE = int(os.getenv("MONDAY_SYNC_LEASE", "300"))
+# Monday expires items_page cursors after 60 minutes; don't resume older ones
+CURSOR_MAX_AGE = timedelta(minutes=55)
+# How often (seconds) a full board walk reconciles the mirror, dropping
+# items that were deleted or archived on Monday
+MONDAY_RECONCILE_INTERVAL = int(os.getenv("MONDAY_RECONCILE_INTERVAL", "21600"))
+
+# Same shape as services.monday_parser.parse_monday_item
+ITEM_FIELDS = [
+    "id", "name", "email", "phone", "industry", "academicStanding",
+    "lookingFor", "resume", "howTheyHeard", "availability", "timeline",
+    "otherInfo", "submitted", "status",
+]
+
+_sync_thread = None
+_sync_lock = threading.Lock()
+
+
+def upsert_monday_items(conn, items, synced_at=None):
+    """
+    Insert or refresh parsed Monday items in the local mirror. Unchanged
+    rows are left alone, so synced_at is when a row last changed.
+    """
+    synced_at = synced_at or datetime.utcnow().isoformat()
+    columns = ITEM_FIELDS + ["synced_at"]
+    updates = ", ".join(f"{col}=excluded.{col}" for col in columns[1:])
+    changed = " OR ".join(f"{col} IS NOT excluded.{col}" for col in ITEM_FIELDS[1:])
+    with tracking_submissions(conn, [item["id"] for item in items]):
+        conn.executemany(f"""
+            INSERT INTO monday_items ({", ".join(columns)})
+            VALUES ({", ".join("?" for _ in columns)})
+            ON CONFLICT(id) DO UPDATE SET {updates}
+            WHERE {changed}
+        """, [
+            tuple(item.get(field) for field in ITEM_FIELDS) + (synced_at,)
+            for item in items
+        ])
+
+
+def delete_monday_items(conn, item_ids):
+    """Remove items from the local mirror and tell stream clients they are gone."""
+    item_ids = [str(item_id) for item_id in item_ids]
+    for start in range(0, len(item_ids), 500):
+        chunk = item_ids[start:start + 500]
+        with tracking_submissions(conn, chunk):
+            conn.execute(f"DELETE FROM monday_items WHERE id IN ({', '.join('?' for _ in chunk)})", chunk)
+    record_events(conn, [("monday_item", {"id": item_id, "deleted": True}) for item_id in item_ids])
+    return len(item_ids)
+
+
+# ---------------------------
+# Sync state (cursor / watermark / lease)
+# ---------------------------
+def get_sync_state(conn):
+    return dict(conn.execute("SELECT key, value FROM monday_sync_state").fetchall())
+
+
+def set_sync_state(conn, **values):
+    conn.executemany("""
+        INSERT INTO monday_sync_state (key, value) VALUES (?, ?)
+        ON CONFLICT(key) DO UPDATE SET value = excluded.value
+    """, list(values.items()))
+
+
+def claim_sync_lease(force=False):
+    """
+    Atomically claim the right to sync so only one worker talks to Monday
+    per interval. Returns the current sync state, or None if not due yet.
+    """
+    now = datetime.utcnow()
+    with transaction() as conn:
+        state = get_sync_state(conn)
+        next_run_at = state.get("next_run_at")
+        if not force and next_run_at and datetime.fromisoformat(next_run_at) > now:
+            return None
+        lease_until = now + timedelta(seconds=MONDAY_SYNC_LEASE)
+        set_sync_state(conn, next_run_at=lease_until.isoformat())
+    return state
+
+
+def _store_page(items, seen=False, **state):
+    """
+    Upsert one page of raw Monday items and persist progress atomically.
+    With `seen`, the ids are also noted for the reconcile at the end of a full walk.
+    """
+    now = datetime.utcnow()
+    with transaction() as conn:
+        upsert_monday_items(conn, [parse_monday_item(item) for item in items], now.isoformat())
+        if seen:
+            conn.executemany("INSERT OR IGNORE INTO monday_sync_seen (id) VALUES (?)",
+                             [(str(item["id"]),) for item in items])
+        lease_until = now + timedelta(seconds=MONDAY_SYNC_LEASE)
+        set_sync_state(conn, next_run_at=lease_until.isoformat(), **state)
+
+
+def _max_updated_at(items, watermark):
+    for item in items:
+        updated_at = item.get("updated_at")
+        if updated_at and (not watermark or updated_at > watermark):
+            watermark = updated_at
+    return watermark
+
+
+def _walk(cursor, query_params, watermark, cursor_key, seen=False, stop_before=None):
+    """
+    Walk pages from `cursor`, saving the cursor after each stored page.
+    With `stop_before` (pages newest first), stop after the first page that
+    holds only items updated before it; returns the count of items updated since.
+    """
+    total = 0
+    for items, next_cursor in iter_item_pages(cursor=cursor, query_params=query_params):
+        watermark = _max_updated_at(items, watermark)
+        _store_page(items, seen=seen, **{
+            cursor_key: next_cursor or "",
+            f"{cursor_key}_at": datetime.utcnow().isoformat(),
+        })
+        if stop_before is None:
+            total += len(items)
+            continue
+        fresh = sum(1 for item in items if (item.get("updated_at") or "") >= stop_before)
+        total += fresh
+        if fresh < len(items):
+            break
+    return total, watermark
+
+
+def _resumable(state, cursor_key):
+    cursor = state.get(cursor_key)
+    saved_at = state.get(f"{cursor_key}_at")
+    if cursor and saved_at and datetime.utcnow() - datetime.fromisoformat(saved_at) < CURSOR_MAX_AGE:
+        return cursor
+    return None
+
+
+def _full_walk_due(state):
+    if state.get("full_sync_done") != "1":
+        return True
+    last = state.get("full_sync_at")
+    return not last or datetime.utcnow() - datetime.fromisoformat(last) >= timedelta(seconds=MONDAY_RECONCILE_INTERVAL)
+
+
+def _drop_unseen(started_at):
+    """After a full walk: delete mirrored items the walk didn't return (deleted or archived)."""
+    with transaction() as conn:
+        # Rows written after the walk started (e.g. by the webhook) may be newer than the walk
+        gone = [row[0] for row in conn.execute("""
+            SELECT id FROM monday_items
+            WHERE synced_at < ? AND id NOT IN (SELECT id FROM monday_sync_seen)
+        """, (started_at,))]
+        delete_monday_items(conn, gone)
+        conn.execute("DELETE FROM monday_sync_seen")
+    return len(gone)
+
+
+def sync_monday_items(force=False):
+    """
+    Mirror the Monday.com board into monday_items.
+
+    The first run, and then one run every MONDAY_RECONCILE_INTERVAL, walks
+    the whole board page by page (resuming from the saved cursor if a
+    previous walk was interrupted) and drops mirrored items the walk didn't
+    see. Other runs fetch items updated since the stored watermark, newest
+    first, and stop at the first page older than it.
+    """
+    state = claim_sync_lease(force=force)
+    if state is None:
+        return 0
+
+    watermark = state.get("watermark")
+    if _full_walk_due(state):
+        cursor = _resumable(state, "full_sync_cursor")
+        started_at = state.get("full_sync_started")
+        if cursor is None or not started_at:
+            started_at = datetime.utcnow().isoformat()
+            with transaction() as conn:
+                conn.execute("DELETE FROM monday_sync_seen")
+                set_sync_state(conn, full_sync_started=started_at)
+        total, watermark = _walk(cursor, None, watermark, "full_sync_cursor", seen=True)
+        removed = _drop_unseen(started_at)
+        done = {"full_sync_done": "1", "full_sync_at": datetime.utcnow().isoformat()}
+        print(f"🔄 Full Monday.com board walk stored {total} items, removed {removed} gone from the board")
+    else:
+        cursor = _resumable(state, "incremental_cursor")
+        query_params = updated_since_params(watermark) if watermark else None
+        total, watermark = _walk(cursor, query_params, watermark, "incremental_cursor",
+                                 stop_before=state.get("watermark") or None)
+        # An early stop leaves a cursor behind; the next run starts over
+        done = {"incremental_cursor": ""}
+        if total:
+            print(f"🔄 Synced {total} changed Monday.com items since {state.get('watermark')}")
+
+    with transaction() as conn:
+        next_run_at = datetime.utcnow() + timedelta(seconds=MONDAY_SYNC_INTERVAL)
+        set_sync_state(
+            conn,
+            watermark=watermark or "",
+            next_run_at=next_run_at.isoformat(),
+            **done,
+        )
+    return total
+
+
+# Mirrored items with the admin status/pickedBy merged in (one PK lookup per item)
+MERGED_SELECT = f"""
+    SELECT {", ".join(f"m.{f} AS {f}" for f in ITEM_FIELDS if f != "status")},
+           CASE WHEN a.id IS NULL THEN m.status
+                ELSE COALESCE(NULLIF(a.status, ''), 'To Do') END AS status,
+           a.pickedBy AS pickedBy
+    FROM monday_items m
+    LEFT JOIN admin_submissions a ON a.id = m.id
+"""
+
+
+@cached("admin_submissions", "monday_items")
+def get_submissions(newest_first=True, status=None):
+    """
+    Mirrored submissions merged with their saved status, optionally filtered by it.
+    Cached until either table changes; treat the result as read-only.
+    """
+    order = "DESC" if newest_first else "ASC"
+    if status is None:
+        rows = query_all(f"{MERGED_SELECT} ORDER BY m.submitted {order}, m.id {order}")
+    else:
+        # Saved statuses come from the admin_submissions index; unsaved items
+        # fall back to the status column mirrored from Monday
+        rows = query_all(f"""
+            {MERGED_SELECT} WHERE a.status = ?
+            UNION ALL
+            {MERGED_SELECT} WHERE a.id IS NULL AND m.status = ?
+            ORDER BY submitted {order}, id {order}
+        """, (status, status))
+    return [dict(row) for row in rows]
+
+
+def get_mentor_queue(tags, statuses=("To Do",), limit=50, cursor=None):
+    """
+    Mirrored submissions carrying any of the given values for each field in
+    `tags` ({"industry": [...], "lookingFor": [...], "availability": [...]}),
+    matched case-insensitively through submission_tags, newest first.
+    Returns (rows, headers) like fetch_keyset_page.
+    """
+    where, params = [], []
+    for field in MULTI_VALUE_FIELDS:
+        values = tags.get(field)
+        if values:
+            where.append(f"""m.id IN (
+                SELECT item_id FROM submission_tags
+                WHERE field = ? AND value IN ({", ".join("?" for _ in values)})
+            )""")
+            params += [field, *values]
+    if not where:
+        raise ValueError("At least one of industry, lookingFor or availability is required")
+
+    status_filter, status_params = "1", []
+    if statuses:
+        # Items nobody has touched yet may have a blank Monday status
+        status_filter = f"COALESCE(NULLIF(status, ''), 'To Do') IN ({', '.join('?' for _ in statuses)})"
+        status_params = list(statuses)
+
+    def fetch(condition, extra_params, n):
+        rows = query_all(f"""
+            SELECT * FROM ({MERGED_SELECT} WHERE {" AND ".join(where)})
+            WHERE {status_filter} AND {condition}
+            ORDER BY submitted DESC, id DESC
+            LIMIT ?
+        """, params + status_params + extra_params + [n])
+        return [dict(row) for row in rows]
+
+    return fetch_keyset_page(fetch, "submitted", "id", cursor, limit)
+
+
+def _sync_loop():
+    while True:
+        try:
+            sync_monday_items()
+        except Exception as e:
+            print("❌ Monday.com background sync failed:", e)
+        time.sleep(MONDAY_SYNC_INTERVAL)
+
+
+def start_background_sync():
+    """Start the mirror refresh thread once per process."""
+    global _sync_thread
+    with _sync_lock:
+        if _sync_thread and _sync_thread.is_alive():
+            return _sync_thread
+        _sync_thread = threading.Thread(target=_sync_loop, name="monday-sync", daemon=True)
+        _sync_thread.start()
+        print(f"🔄 Monday.com background sync every {MONDAY_SYNC_INTERVAL}s")
+        return _sync_thread
@@ -0,0 +1,85 @@
+# ummah-scheduler/backend/services/pagination.py
+"""
+Keyset (cursor) pagination helpers shared by the list endpoints.
+
+Lists are ordered newest-first by (sort_key, tiebreak) and a page ends
+with an opaque cursor encoding the last row's pair. The next page asks
+for rows strictly "before" that pair, so each page is an index range
+scan no matter how deep the client pages.
+"""
+import base64
+import json
+
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 1000
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(*values):
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token, size=2):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise InvalidCursor("Malformed cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursor("Malformed cursor")
+    return values
+
+
+def parse_limit(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Clamp a ?limit= value to [1, maximum]."""
+    try:
+        limit = int(value) if value not in (None, "") else default
+    except ValueError:
+        limit = default
+    return max(1, min(limit, maximum))
+
+
+def fetch_keyset_page(fetch, sort_col, tie_col, cursor_token, limit):
+    """
+    Fetch one newest-first page ordered by (sort_col DESC, tie_col DESC).
+
+    `fetch(condition, params, n)` must run the list query with the extra
+    WHERE condition, that ordering and LIMIT n. Rows whose sort key is NULL
+    sort last; they are read by a second query once the non-NULL rows run
+    out, so both halves stay index range scans on (sort_col, tie_col).
+    Returns (rows, headers) as paginate() does.
+    """
+    want = limit + 1
+    rows = []
+    sort_value = tie_value = None
+    if cursor_token:
+        sort_value, tie_value = decode_cursor(cursor_token)
+
+    if not cursor_token:
+        rows = fetch(f"{sort_col} IS NOT NULL", [], want)
+    elif sort_value is not None:
+        rows = fetch(f"({sort_col}, {tie_col}) < (?, ?)", [sort_value, tie_value], want)
+
+    if len(rows) < want:
+        if cursor_token and sort_value is None:
+            rows += fetch(f"{sort_col} IS NULL AND {tie_col} < ?", [tie_value], want)
+        else:
+            rows += fetch(f"{sort_col} IS NULL", [], want - len(rows))
+
+    return paginate(rows, limit, sort_col, tie_col)
+
+
+def paginate(rows, limit, sort_col, tie_col):
+    """
+    Split a `LIMIT limit + 1` result into (page, headers). The extra row only
+    signals that another page exists; X-Next-Cursor points past the page.
+    """
+    if len(rows) <= limit:
+        return rows, {}
+    page = rows[:limit]
+    last = page[-1]
+    return page, {"X-Next-Cursor": encode_cursor(last[sort_col], last[tie_col])}
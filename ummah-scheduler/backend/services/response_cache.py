@@ -0,0 +1,76 @@
+# ummah-scheduler/backend/services/response_cache.py
+"""
+Bounded TTL cache for read paths (submission listings, stats).
+
+Entries are per process but tagged with the generation of the tables they
+were built from (data_versions, bumped by triggers on every write). A
+lookup re-reads the generation, so any committed write on any worker
+(save-status, schedule-meeting, cancel-meeting, sync) invalidates the
+entry at once and readers never see stale status after their own write.
+
+    @cached("admin_submissions", "monday_items")
+    def get_submissions(...): ...
+
+    cache_stats()  # hits, misses, stale, evictions, size
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from db import table_versions
+
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "128"))
+
+_entries = OrderedDict()  # { key: (generation, expires_at, value) }
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0}
+
+
+def _generation(tables):
+    if not tables:
+        return ()
+    versions = table_versions(tables)
+    return tuple(versions.get(table, 0) for table in tables)
+
+
+def cached(*tables, ttl=None):
+    """Cache a function's result per arguments until `tables` change or the TTL passes."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (fn.__module__, fn.__qualname__, args, tuple(sorted(kwargs.items())))
+            generation = _generation(tables)
+            now = time.monotonic()
+            with _lock:
+                entry = _entries.get(key)
+                if entry and entry[0] == generation and entry[1] > now:
+                    _entries.move_to_end(key)
+                    _stats["hits"] += 1
+                    return entry[2]
+                _stats["stale" if entry else "misses"] += 1
+
+            value = fn(*args, **kwargs)
+            with _lock:
+                _entries[key] = (generation, now + (ttl or RESPONSE_CACHE_TTL), value)
+                _entries.move_to_end(key)
+                while len(_entries) > RESPONSE_CACHE_SIZE:
+                    _entries.popitem(last=False)
+                    _stats["evictions"] += 1
+            return value
+        return wrapper
+    return decorator
+
+
+def cache_stats():
+    with _lock:
+        lookups = _stats["hits"] + _stats["misses"] + _stats["stale"]
+        return {
+            **_stats,
+            "size": len(_entries),
+            "maxSize": RESPONSE_CACHE_SIZE,
+            "ttlSeconds": RESPONSE_CACHE_TTL,
+            "hitRate": round(_stats["hits"] / lookups, 3) if lookups else None,
+        }
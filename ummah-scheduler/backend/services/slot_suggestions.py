@@ -0,0 +1,308 @@
+# ummah-scheduler/backend/services/slot_suggestions.py
+"""
+Meeting slot suggestions from mentors' Google Calendar free/busy.
+
+Busy intervals are fetched with one Calendar batch request per
+FREEBUSY_BATCH_SIZE mentors (each freeBusy sub-request carries that
+mentor's own credentials) and cached per mentor for FREEBUSY_CACHE_TTL
+seconds. The student's availability text ("Monday Morning, Friday
+Evening" or "Anytime", as on the Monday form) becomes local-time windows;
+each mentor's free time is those windows minus their merged busy
+intervals, cut into SLOT_MINUTES slots.
+"""
+import os
+import re
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from google.auth.exceptions import RefreshError
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.http import build_http
+
+from app_config import GOOGLE_CALENDAR_TIMEZONE
+from services.credential_store import load_credentials, save_credentials
+from services.google_services import get_service
+
+FREEBUSY_CACHE_TTL = float(os.getenv("FREEBUSY_CACHE_TTL", "120"))
+FREEBUSY_BATCH_SIZE = 50  # Calendar batch limit
+SLOT_MINUTES = 30         # same length schedule_meeting books
+SLOT_STEP_MINUTES = 30
+SLOT_LEAD_MINUTES = int(os.getenv("SLOT_LEAD_MINUTES", "60"))
+SUGGEST_WINDOW_DAYS = 7
+
+# Local hour ranges of the form's day parts (as DashboardModal.jsx offers them)
+DAY_PARTS = {"morning": (7, 12), "afternoon": (12, 17), "evening": (17, 20)}
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+_busy = {}  # { email: (expires_at, time_min, time_max, [(start, end)] or None, error) }
+_lock = threading.Lock()
+
+
+class _BatchCredentials(Credentials):
+    """Keeps a failed refresh (revoked token) to itself, so only that mentor's sub-request fails."""
+    refresh_error = None
+
+    def refresh(self, request):
+        try:
+            super().refresh(request)
+        except RefreshError as e:
+            self.refresh_error = e
+
+
+# ---------------------------
+# Intervals
+# ---------------------------
+def merge_intervals(intervals):
+    """Union of (start, end) pairs as a sorted list of disjoint intervals."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(windows, busy):
+    """Parts of sorted, disjoint `windows` not covered by sorted, disjoint `busy` (one sweep)."""
+    free, i = [], 0
+    for start, end in windows:
+        while i < len(busy) and busy[i][1] <= start:
+            i += 1
+        j, cursor = i, start
+        while j < len(busy) and busy[j][0] < end:
+            if busy[j][0] > cursor:
+                free.append((cursor, busy[j][0]))
+            cursor = max(cursor, busy[j][1])
+            j += 1
+        if cursor < end:
+            free.append((cursor, end))
+    return free
+
+
+def cut_slots(free, minutes=SLOT_MINUTES, step=SLOT_STEP_MINUTES, not_before=None):
+    """Slot starts inside `free`, on `step`-minute boundaries."""
+    length, step_delta = timedelta(minutes=minutes), timedelta(minutes=step)
+    slots = []
+    for start, end in free:
+        if not_before and start < not_before:
+            start = not_before
+        # Round up to the next step boundary (step divides an hour)
+        rounded = start.replace(second=0, microsecond=0)
+        if rounded < start:
+            rounded += timedelta(minutes=1)
+        start = rounded + timedelta(minutes=-rounded.minute % step)
+        while start + length <= end:
+            slots.append((start, start + length))
+            start += step_delta
+    return slots
+
+
+# ---------------------------
+# Student availability
+# ---------------------------
+def parse_availability(text):
+    """
+    'Monday Morning, Friday Evening' -> {0: [(7, 12)], 4: [(17, 20)]}.
+    "Anytime" or an empty / unknown preference allows every day part.
+    """
+    raw = re.sub(r"\s+", " ", str(text or "")).strip().lower()
+    everything = {day: sorted(DAY_PARTS.values()) for day in range(7)}
+    if not raw or raw == "n/a" or "anytime" in raw:
+        return everything
+    prefs = {}
+    for item in raw.split(","):
+        parts = re.split(r"[\s:]+", item.strip())
+        if len(parts) >= 2 and parts[0] in WEEKDAYS and parts[1] in DAY_PARTS:
+            prefs.setdefault(WEEKDAYS.index(parts[0]), []).append(DAY_PARTS[parts[1]])
+    return {day: sorted(set(hours)) for day, hours in prefs.items()} or everything
+
+
+def parse_timeline(text):
+    """'2025-07-01 - 2025-07-20' -> (date, date), or None."""
+    match = re.search(r"(\d{4}-\d{2}-\d{2})\s*[-—–−]\s*(\d{4}-\d{2}-\d{2})", str(text or ""))
+    if not match:
+        return None
+    return date.fromisoformat(match.group(1)), date.fromisoformat(match.group(2))
+
+
+def availability_windows(prefs, time_min, time_max, tz=None):
+    """Merged UTC windows for `prefs` (parse_availability) between two aware datetimes."""
+    tz = tz or ZoneInfo(GOOGLE_CALENDAR_TIMEZONE)
+    windows = []
+    day = time_min.astimezone(tz).date()
+    while day <= time_max.astimezone(tz).date():
+        for start_hour, end_hour in prefs.get(day.weekday(), []):
+            start = datetime(day.year, day.month, day.day, start_hour, tzinfo=tz).astimezone(timezone.utc)
+            end = datetime(day.year, day.month, day.day, end_hour, tzinfo=tz).astimezone(timezone.utc)
+            start, end = max(start, time_min), min(end, time_max)
+            if start < end:
+                windows.append((start, end))
+        day += timedelta(days=1)
+    return merge_intervals(windows)
+
+
+# ---------------------------
+# Free/busy (batched, cached)
+# ---------------------------
+def _parse_time(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _cached_busy(email, time_min, time_max):
+    """(intervals, error) from the cache, or None on a miss. Failures are cached too."""
+    with _lock:
+        entry = _busy.get(email)
+    if entry and entry[0] > time.monotonic() and entry[1] <= time_min and entry[2] >= time_max:
+        return entry[3], entry[4]
+    return None
+
+
+def _remember(email, time_min, time_max, intervals, error=None):
+    with _lock:
+        _busy[email] = (time.monotonic() + FREEBUSY_CACHE_TTL, time_min, time_max, intervals, error)
+
+
+def forget_busy(email):
+    """Drop a mentor's cached intervals (after booking on their calendar, or re-login)."""
+    with _lock:
+        _busy.pop(email, None)
+
+
+def is_busy(email, start, end):
+    """True if cached free/busy already shows `email` busy in [start, end); never calls Google."""
+    with _lock:
+        entry = _busy.get(email)
+    if not entry or entry[3] is None or entry[0] <= time.monotonic():
+        return False
+    if not (entry[1] <= start and end <= entry[2]):
+        return False
+    return any(s < end and start < e for s, e in entry[3])
+
+
+def _fetch_window(time_min, time_max):
+    # Whole UTC days, so nearby requests (same week, later "now") hit the cache
+    start = time_min.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    end = time_max.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return start, end + timedelta(days=1)
+
+
+def get_busy(emails, time_min, time_max):
+    """
+    ({email: merged busy intervals}, {email: error}) for [time_min, time_max).
+    Cache misses go to Google in batches, one sub-request per mentor.
+    """
+    busy, errors, missing = {}, {}, []
+    for email in emails:
+        cached = _cached_busy(email, time_min, time_max)
+        if cached is None:
+            missing.append(email)
+        elif cached[1]:
+            errors[email] = cached[1]
+        else:
+            busy[email] = cached[0]
+    if not missing:
+        return busy, errors
+
+    fetch_min, fetch_max = _fetch_window(time_min, time_max)
+    body = {
+        "timeMin": fetch_min.isoformat().replace("+00:00", "Z"),
+        "timeMax": fetch_max.isoformat().replace("+00:00", "Z"),
+        "items": [{"id": "primary"}],
+    }
+    mentors = []
+    for email in missing:
+        token_data = load_credentials(email)
+        if not token_data:
+            errors[email] = "Mentor not authenticated with Google"
+            continue
+        creds = _BatchCredentials(**token_data)
+        mentors.append((email, token_data, creds, get_service("calendar", "v3", creds, identity=email)))
+
+    def on_response(email, response, exception):
+        if exception is not None:
+            creds = next(c for e, _, c, _ in mentors if e == email)
+            errors[email] = str(creds.refresh_error or exception)
+        else:
+            calendar = response.get("calendars", {}).get("primary", {})
+            if calendar.get("errors"):
+                errors[email] = calendar["errors"][0].get("reason", "unknown error")
+            else:
+                busy[email] = merge_intervals(
+                    (_parse_time(b["start"]), _parse_time(b["end"])) for b in calendar.get("busy", [])
+                )
+        _remember(email, fetch_min, fetch_max, busy.get(email), errors.get(email))
+
+    for start in range(0, len(mentors), FREEBUSY_BATCH_SIZE):
+        chunk = mentors[start:start + FREEBUSY_BATCH_SIZE]
+        batch = chunk[0][3].new_batch_http_request(callback=on_response)
+        for email, _, creds, service in chunk:
+            request = service.freebusy().query(body=body)
+            # Sign with this call's credentials, which the batch refreshes on a 401
+            request.http = AuthorizedHttp(creds, http=build_http())
+            batch.add(request, request_id=email)
+        batch.execute()
+
+    # Keep access tokens the batch refreshed so other workers don't refresh again
+    for email, token_data, creds, _ in mentors:
+        if creds.token != token_data.get("token"):
+            save_credentials(email, {**token_data, "token": creds.token})
+    return busy, errors
+
+
+# ---------------------------
+# Suggestions
+# ---------------------------
+def suggest_slots(mentors, availability=None, time_min=None, time_max=None, timeline=None, limit=20):
+    """
+    Ranked candidate slots for `mentors` inside the student's availability.
+
+    Returns {"slots": [{start, end, mentors}], "mentors": [{email, freeMinutes,
+    nextSlot, error}]}. Slots are earliest first; each lists the free mentors
+    least-booked first. The mentor summary is ordered by free time.
+    """
+    now = datetime.now(timezone.utc)
+    time_min = max(time_min or now, now)
+    time_max = time_max or time_min + timedelta(days=SUGGEST_WINDOW_DAYS)
+    if timeline:
+        tz = ZoneInfo(GOOGLE_CALENDAR_TIMEZONE)
+        first, last = timeline
+        time_min = max(time_min, datetime(first.year, first.month, first.day, tzinfo=tz))
+        time_max = min(time_max, datetime(last.year, last.month, last.day, tzinfo=tz) + timedelta(days=1))
+
+    windows = availability_windows(parse_availability(availability), time_min, time_max) if time_min < time_max else []
+    window_minutes = sum((end - start).total_seconds() for start, end in windows) / 60
+    busy, errors = get_busy(mentors, time_min, time_max) if windows else ({}, {})
+
+    by_start, summary = {}, []
+    not_before = now + timedelta(minutes=SLOT_LEAD_MINUTES)
+    for email in mentors:
+        if email in errors or email not in busy:
+            summary.append({"email": email, "freeMinutes": 0, "nextSlot": None, "error": errors.get(email)})
+            continue
+        free = subtract_intervals(windows, busy[email])
+        free_minutes = sum((end - start).total_seconds() for start, end in free) / 60
+        slots = cut_slots(free, not_before=not_before)
+        for start, end in slots:
+            by_start.setdefault((start, end), []).append((window_minutes - free_minutes, email))
+        summary.append({
+            "email": email,
+            "freeMinutes": int(free_minutes),
+            "nextSlot": slots[0][0].isoformat() if slots else None,
+            "error": None,
+        })
+
+    ranked = [
+        {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "mentors": [email for _, email in sorted(free_mentors)],
+        }
+        for (start, end), free_mentors in sorted(by_start.items())[:limit]
+    ]
+    summary.sort(key=lambda m: (m["error"] is not None, -m["freeMinutes"], m["email"]))
+    return {"slots": ranked, "mentors": summary}
@@ -0,0 +1,66 @@
+# ummah-scheduler/backend/services/submission_search.py
+"""
+Full-text search over admin_submissions (FTS5 index from migration 012).
+
+User input is never passed to MATCH as-is: it is split into words and each
+becomes a quoted prefix term ("term"*), all of which must match. Single
+characters are dropped: they would match most of the table and fall
+outside the 2/3-character prefix indexes. Results are ranked by BM25 with
+name/email hits weighted above free-text fields.
+"""
+import re
+
+from db import query_all, transaction
+from migrations import SEARCH_COLUMNS
+
+# bm25() weights, in SEARCH_COLUMNS order
+COLUMN_WEIGHTS = {
+    "name": 10.0,
+    "email": 8.0,
+    "industry": 4.0,
+    "lookingFor": 4.0,
+    "otherInfo": 1.0,
+    "academicStanding": 2.0,
+}
+MAX_TERMS = 8
+MIN_TERM_LENGTH = 2
+
+RESULT_FIELDS = [
+    "id", "name", "email", "status", "pickedBy", "pickedByEmail", "event_id",
+    "phone", "industry", "academicStanding", "lookingFor", "availability",
+    "timeline", "resume", "otherInfo", "submitted", "updated_at",
+]
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def build_match_query(text):
+    """'Jane eng' -> '"jane"* "eng"*' (None when there is nothing to search for)."""
+    terms = [t for t in _WORD.findall((text or "").lower()) if len(t) >= MIN_TERM_LENGTH][:MAX_TERMS]
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def search_submissions(text, limit, offset=0):
+    """One page of matches, best first; each row carries its bm25 `score` (lower is better)."""
+    match = build_match_query(text)
+    if match is None:
+        return []
+    weights = ", ".join(str(COLUMN_WEIGHTS[c]) for c in SEARCH_COLUMNS)
+    rows = query_all(f"""
+        SELECT {", ".join(f"a.{f}" for f in RESULT_FIELDS)},
+               bm25(admin_submissions_fts, {weights}) AS score
+        FROM admin_submissions_fts
+        JOIN admin_submissions a ON a.rowid = admin_submissions_fts.rowid
+        WHERE admin_submissions_fts MATCH ?
+        ORDER BY score, a.id
+        LIMIT ? OFFSET ?
+    """, (match, limit, offset))
+    return [dict(row) for row in rows]
+
+
+def rebuild_index():
+    """Re-index every row (e.g. after a VACUUM renumbered rowids)."""
+    with transaction() as conn:
+        conn.execute("INSERT INTO admin_submissions_fts (admin_submissions_fts) VALUES ('rebuild')")
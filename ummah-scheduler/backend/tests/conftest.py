@@ -0,0 +1,16 @@
+# ummah-scheduler/backend/tests/conftest.py
+"""
+Point the backend at a throwaway database before any test imports it:
+db.DB_PATH and the credentials path are read once, at import time.
+"""
+import atexit
+import os
+import shutil
+import tempfile
+
+_tmp = tempfile.mkdtemp(prefix="ummah-tests-")
+atexit.register(shutil.rmtree, _tmp, ignore_errors=True)
+
+os.environ["ADMIN_DB_PATH"] = os.path.join(_tmp, "admin_data.db")
+os.environ["MENTOR_CREDENTIALS_DB_PATH"] = os.path.join(_tmp, "mentor_credentials.db")
+os.environ["MONDAY_SYNC_ENABLED"] = "false"
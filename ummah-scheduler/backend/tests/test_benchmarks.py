@@ -0,0 +1,29 @@
+# ummah-scheduler/backend/tests/test_benchmarks.py
+"""
+Smoke run of the benchmark suite: seeds a small database, serves the app
+against fakes.monday / fakes.google_calendar / fakes.discord and drives
+every endpoint plus scripts/monday_to_discord.py. Any call the fakes don't
+understand shows up as an endpoint error.
+"""
+import json
+
+from benchmarks import compare, run
+from benchmarks.endpoints import build_endpoints
+
+
+def test_benchmark_run_against_fakes(tmp_path):
+    output = tmp_path / "results.json"
+    run.main([
+        "--scales", "60", "--requests", "6", "--warmup", "1", "--concurrency", "2",
+        "--mentors", "4", "--script-items", "4", "--script-runs", "1", "--output", str(output),
+    ])
+    report = json.loads(output.read_text())
+
+    results = {result["endpoint"]: result for result in report["results"]}
+    assert set(results) == set(build_endpoints(60, ["m@example.com"])) | {run.SCRIPT_NAME}
+    for name, result in results.items():
+        assert result["errors"] == 0, f"{name}: {result['errorSamples']}"
+    assert results[run.SCRIPT_NAME]["discordMessagesPerRun"] >= 4
+
+    _, loaded = compare._load(output)
+    assert compare.compare(loaded, loaded, threshold=0)[1] == []
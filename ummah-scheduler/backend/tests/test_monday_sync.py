@@ -0,0 +1,116 @@
+# ummah-scheduler/backend/tests/test_monday_sync.py
+"""Board sync and the webhook receiver against fakes.monday, through the real GraphQL client."""
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from db import query_all, query_one, transaction
+from fakes.monday import FakeMonday
+from migrations import run_migrations
+from routes import monday_webhook
+from services import monday_poll
+from services.job_queue import get_job
+from services.monday_sync import delete_monday_items, set_sync_state, sync_monday_items
+
+JOB_TIMEOUT = 10
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    run_migrations()
+    fake = FakeMonday(webhook_secret="test-secret").start()
+    monkeypatch.setattr(monday_poll, "MONDAY_API", fake.url)
+    monkeypatch.setattr(monday_poll, "MONDAY_API_KEY", "fake-key")
+    monkeypatch.setattr(monday_poll, "MONDAY_BOARD_ID", fake.board_id)
+    monkeypatch.setattr(monday_poll, "MONDAY_PAGE_SIZE", 2)  # several pages per walk
+    monkeypatch.setattr(monday_webhook, "MONDAY_WEBHOOK_SECRET", "test-secret")
+    monkeypatch.setattr(monday_webhook, "MONDAY_WEBHOOK_NOTIFY_DISCORD", False)
+    yield fake
+    fake.stop()
+    with transaction() as conn:
+        delete_monday_items(conn, [row["id"] for row in conn.execute("SELECT id FROM monday_items")])
+        conn.execute("DELETE FROM monday_sync_state")
+        conn.execute("DELETE FROM monday_sync_seen")
+
+
+def _add_items(fake, count):
+    created = datetime.utcnow() - timedelta(hours=1)
+    return [
+        fake.add_item(f"Student {n}", created_at=(created + timedelta(minutes=n)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                      industry="Finance, Law", email=f"student{n}@example.com")
+        for n in range(count)
+    ]
+
+
+def _mirrored(item_id):
+    return query_one("SELECT * FROM monday_items WHERE id = ?", (item_id,))
+
+
+def _wait(job_id):
+    deadline = time.monotonic() + JOB_TIMEOUT
+    while time.monotonic() < deadline:
+        job = get_job(job_id)
+        if job and job["status"] in ("done", "failed"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def _force_reconcile():
+    with transaction() as conn:
+        set_sync_state(conn, full_sync_at="2000-01-01T00:00:00")
+
+
+def test_full_then_incremental_sync(fake):
+    items = _add_items(fake, 5)
+    assert sync_monday_items(force=True) == 5
+    row = _mirrored(items[0]["id"])
+    assert (row["name"], row["industry"], row["email"]) == ("Student 0", "Finance, Law", "student0@example.com")
+
+    fake.update_item(items[3]["id"], industry="Engineering")
+    sync_monday_items(force=True)
+    assert _mirrored(items[3]["id"])["industry"] == "Engineering"
+    assert len(query_all("SELECT id FROM monday_items")) == 5
+
+
+def test_reconcile_drops_deleted_and_archived_items(fake):
+    items = _add_items(fake, 4)
+    sync_monday_items(force=True)
+    fake.delete_item(items[0]["id"])
+    fake.archive_item(items[1]["id"])
+
+    sync_monday_items(force=True)  # incremental runs only upsert
+    assert _mirrored(items[0]["id"]) is not None
+
+    _force_reconcile()
+    sync_monday_items(force=True)
+    assert _mirrored(items[0]["id"]) is None
+    assert _mirrored(items[1]["id"]) is None
+    assert [row["id"] for row in query_all("SELECT id FROM monday_items ORDER BY id")] == \
+        [items[2]["id"], items[3]["id"]]
+
+
+def test_webhook_mirrors_and_confirms_deletes(fake):
+    from app import app
+    client = app.test_client()
+    item = _add_items(fake, 1)[0]
+
+    assert fake.send_challenge(client).get_json() == {"challenge": "fake-challenge"}
+    fake.webhook_secret = "wrong"
+    assert fake.send_event(client, "create_pulse", item["id"]).status_code == 401
+    fake.webhook_secret = "test-secret"
+
+    resp = fake.send_event(client, "create_pulse", item["id"])
+    assert _wait(resp.get_json()["jobId"])["status"] == "done"
+    assert _mirrored(item["id"])["name"] == item["name"]
+
+    # Still on the board: a delete event alone doesn't remove it
+    resp = fake.send_event(client, "delete_pulse", item["id"])
+    _wait(resp.get_json()["jobId"])
+    assert _mirrored(item["id"]) is not None
+
+    fake.delete_item(item["id"])
+    resp = fake.send_event(client, "delete_pulse", item["id"])
+    _wait(resp.get_json()["jobId"])
+    assert _mirrored(item["id"]) is None
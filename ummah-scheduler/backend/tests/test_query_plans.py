@@ -0,0 +1,23 @@
+# ummah-scheduler/backend/tests/test_query_plans.py
+"""EXPLAIN QUERY PLAN regression check for the hot queries (migrations.QUERY_PLAN_CHECKS)."""
+import pytest
+
+from migrations import MIGRATIONS, QUERY_PLAN_CHECKS, check_query_plans, current_version, run_migrations
+
+
+@pytest.fixture(scope="module", autouse=True)
+def migrated():
+    run_migrations()
+
+
+def test_migrations_reach_latest_version():
+    assert current_version() == MIGRATIONS[-1][0]
+
+
+@pytest.mark.parametrize("sql, index", QUERY_PLAN_CHECKS, ids=[index for _, index in QUERY_PLAN_CHECKS])
+def test_query_uses_its_index(sql, index):
+    assert check_query_plans([(sql, index)]) == []
+
+
+def test_check_flags_a_table_scan():
+    assert check_query_plans([("SELECT * FROM admin_submissions WHERE name = 'x'", "idx_admin_submissions_name")])
@@ -8,6 +8,7 @@ import soft_delete_icon from '../assets/soft_delete.svg';
 import restore_icon from '../assets/restore.svg';
 import search_icon from '../assets/search_icon.svg';
 import Sidebar from './Sidebar';
+import useChangeEvents, { LIVE_UPDATES } from '../useChangeEvents';
 
 const SOFT_DELETE_KEY = 'softDeletedAdminSubmissions';
 const BACKEND_URL = import.meta.env.VITE_BACKEND_URL;
@@ -315,17 +316,33 @@ export default function AdminDashboard() {
   const fetchJSON = (url) =>
     fetch(url).then((r) => (r.ok ? r.json() : Promise.reject(new Error(`${r.status} ${r.statusText}`))));
 
+  // Follow X-Next-Cursor until the paginated endpoint is exhausted
+  const fetchAllPages = async (url) => {
+    let all = [];
+    let cursor = null;
+    do {
+      const sep = url.includes('?') ? '&' : '?';
+      const r = await fetch(cursor ? `${url}${sep}cursor=${encodeURIComponent(cursor)}` : url);
+      if (!r.ok) throw new Error(`${r.status} ${r.statusText}`);
+      const data = await r.json();
+      if (!Array.isArray(data)) return data;
+      all = all.concat(data);
+      cursor = r.headers.get('X-Next-Cursor');
+    } while (cursor);
+    return all;
+  };
+
   const fetchSubmissions = () => {
     setLoading(true);
 
-    const primaryUrl = `${BACKEND_URL}/api/admin-submissions`;
+    const primaryUrl = `${BACKEND_URL}/api/admin-submissions?limit=1000`;
 const fallbacks = [
   `${BACKEND_URL}/api/submissions`,
   `${BACKEND_URL}/api/form-submissions`,
   `${BACKEND_URL}/api/all-submissions`,
 ];
 
-    fetchJSON(primaryUrl)
+    fetchAllPages(primaryUrl)
       .then((primaryRaw) => {
         const primary = Array.isArray(primaryRaw) ? primaryRaw.map(normalize) : [];
         const toDoCountPrimary = primary.filter((r) => r.status === 'To Do').length;
@@ -380,6 +397,28 @@ const fallbacks = [
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [showDeleted]);
 
+  // Live updates: patch rows in place instead of reloading the whole list
+  useChangeEvents({
+    submission: (change) => {
+      setSubmissions((prev) => prev.map((s) => (s.id === change.id ? {
+        ...s,
+        status: canonicalStatus(change.status),
+        pickedBy: change.pickedBy || s.pickedBy,
+        event_id: change.event_id || s.event_id,
+      } : s)));
+    },
+    monday_item: (item) => {
+      if (item.deleted) {
+        setSubmissions((prev) => prev.filter((s) => s.id !== item.id));
+        return;
+      }
+      setSubmissions((prev) => prev.map((s) => (s.id === item.id
+        ? { ...s, ...normalize({ ...item, status: s.status, pickedBy: s.pickedBy }), uid: s.uid }
+        : s)));
+    },
+    reset: () => fetchSubmissions(),
+  });
+
   const handleCancel = (sub) => {
     if (!sub.id) {
       alert('This submission has no server id; cannot cancel from here.');
@@ -398,7 +437,7 @@ const fallbacks = [
           alert(`Error canceling meeting: ${data.error}`);
         } else {
           alert(`✅ ${data.message}`);
-          fetchSubmissions();
+          if (!LIVE_UPDATES) fetchSubmissions(); // otherwise the change stream updates the row
         }
       })
       .catch(() => {
@@ -103,82 +103,31 @@ const IconChevronLeft = ({ className = '', size = 18 }) => (
   </svg>
 );
 
-// 🔧 Normalize status variants (same map as Dashboard)
-const CANON_MAP = {
-  '': 'To Do',
-  'to do': 'To Do',
-  'todo': 'To Do',
-  'to-do': 'To Do',
-  'pending': 'To Do',
-  'new': 'To Do',
-  'submitted': 'To Do',
-  'in progress': 'In Progress',
-  'in-progress': 'In Progress',
-  'working': 'In Progress',
-  'done': 'Done',
-  'complete': 'Done',
-  'completed': 'Done',
-  'canceled': 'Canceled',
-  'cancelled': 'Canceled',
-  'cancel': 'Canceled',
-};
-const canonicalStatus = (raw) => {
-  const key = (raw ?? '').toString().trim().toLowerCase();
-  return CANON_MAP[key] || 'To Do';
-};
-
-// De-dupe by id helper (no ?? + || mixing)
-const getStableId = (item) => {
-  const primary = item?.id ?? item?._id ?? item?.submissionId;
-  if (primary !== undefined && primary !== null && primary !== '') return primary;
-
-  const email = item?.email ?? '';
-  const submittedLike = item?.submitted ?? item?.created_at ?? item?.createdAt ?? '';
-  const composite = `${email}|${submittedLike}`;
-  return composite !== '' ? composite : JSON.stringify(item);
-};
-
-const dedupeById = (arr) => {
-  const seen = new Set();
-  const out = [];
-  for (const item of arr) {
-    const id = getStableId(item);
-    if (!seen.has(id)) {
-      seen.add(id);
-      out.push(item);
-    }
-  }
-  return out;
+// Local YYYY-MM-DD (the day keys /api/admin-stats uses)
+const isoDay = (d) => {
+  const pad = (n) => String(n).padStart(2, '0');
+  return `${d.getFullYear()}-${pad(d.getMonth() + 1)}-${pad(d.getDate())}`;
 };
 
+// Rows shown in the detail modals (first page only)
+const MODAL_LIMIT = 200;
 
-// Prefer-first helper
-const pickFirst = (...vals) => vals.find(v => v !== undefined && v !== null && v !== '');
-
-// Ensure submissions have consistent fields + canonical status
-const normalizeSubmission = (s) => {
-  const statusRaw = pickFirst(s.status, s.state, s.currentStatus, s.progress, s.phase);
-  const submitted = pickFirst(s.submitted, s.created_at, s.createdAt, s.created, s.timestamp, s.date);
-  const updated_at = pickFirst(s.updated_at, s.updatedAt, s.scheduled_at, s.scheduledAt, s.lastUpdated, s.modifiedAt);
-  const pickedBy = pickFirst(s.pickedBy, s.pickedByName, s.mentor, s.advisor, s.owner, s.assignedTo, s.pickedByEmail);
-  const industry = pickFirst(s.industry, s.segment, s.category, s.vertical);
-  return {
-    ...s,
-    status: canonicalStatus(statusRaw),
-    submitted,
-    updated_at,
-    pickedBy,
-    industry,
-  };
-};
+// Sum one action across stats.mentorActivity ({ email: { day: { action: n } } })
+const countAction = (mentorActivity, action) =>
+  Object.values(mentorActivity || {}).reduce(
+    (sum, days) => sum + Object.values(days).reduce((s, counts) => s + (counts[action] || 0), 0),
+    0
+  );
 
 export default function AdminStatistics() {
-  const [submissions, setSubmissions] = useState([]);
-  const [mentorActivity, setMentorActivity] = useState([]);
+  const [stats, setStats] = useState(null);
+  const [facets, setFacets] = useState({ advisors: [], industries: [] });
+  const [activity, setActivity] = useState([]);
   const [loading, setLoading] = useState(true);
 
   const [selectedMetric, setSelectedMetric] = useState(null);
   const [showModal, setShowModal] = useState(false);
+  const [modalRows, setModalRows] = useState({ rows: [], more: false, loading: false });
 
   // ── Theme (sync with dashboard) ─────────────────────────────────────────────
   const [theme, setTheme] = useState(() => {
@@ -288,7 +237,6 @@ export default function AdminStatistics() {
   useEffect(() => setChartKey(k => k + 1), [theme]);
 
   // ── Filters ────────────────────────────────────────────────────────────────
-  const [search, setSearch] = useState('');
   const [advisor, setAdvisor] = useState('All');
   const [statusPill, setStatusPill] = useState('All');
   const [timePreset, setTimePreset] = useState('30d');   // 'all' | '<nd>'
@@ -302,175 +250,125 @@ export default function AdminStatistics() {
   const [advisorQuery, setAdvisorQuery] = useState('');
   const advisorMenuRef = useRef(null);
 
-  // 🚀 Fetch ALL submissions (including "To Do" from alternate endpoints)
+  // ⏱️ Time cutoff (supports '7d', '30d', and 'all')
+  const cutoffDay = useMemo(() => {
+    if (timePreset === 'all') return null;
+    const days = parseInt(timePreset, 10);
+    if (!Number.isFinite(days)) return null;
+    const d = new Date();
+    d.setDate(d.getDate() - days);
+    return isoDay(d);
+  }, [timePreset]);
+
+  // 🔑 Filters are applied by the server (/api/admin-stats, /api/admin-submissions, /api/mentor-activity)
+  const statsQuery = useMemo(() => {
+    const params = new URLSearchParams();
+    if (cutoffDay) params.set('from', cutoffDay);
+    if (statusPill !== 'All') params.set('status', statusPill);
+    if (industrySelected.size) params.set('industry', [...industrySelected].join(','));
+    if (advisor !== 'All') params.set('mentor', advisor);
+    return params.toString();
+  }, [cutoffDay, statusPill, industrySelected, advisor]);
+
+  const activityQuery = useMemo(() => {
+    const params = new URLSearchParams({ limit: String(MODAL_LIMIT) });
+    if (cutoffDay) params.set('from', cutoffDay);
+    if (advisor !== 'All') params.set('email', advisor);
+    if (statusPill === 'In Progress') params.set('action', 'propose');
+    if (statusPill === 'Canceled') params.set('action', 'cancel');
+    return params.toString();
+  }, [cutoffDay, advisor, statusPill]);
+
+  // 🚀 Precomputed statistics for the current filters
   useEffect(() => {
     let isMounted = true;
     (async () => {
       try {
-        setLoading(true);
-
-        // Primary sources first
-       const primaryUrls = [
-  `${BACKEND_URL}/api/admin-submissions?all=true`,
-  `${BACKEND_URL}/api/admin-submissions?limit=5000`,
-];
-
-        // Additional likely sources for open/unscheduled leads
-const todoUrls = [
-  // generic pools
-  `${BACKEND_URL}/api/submissions?all=true`,
-  `${BACKEND_URL}/api/leads?all=true`,
-  `${BACKEND_URL}/api/pending-submissions?all=true`,
-  `${BACKEND_URL}/api/incoming-submissions?all=true`,
-  // status-filtered variants
-  `${BACKEND_URL}/api/admin-submissions?status=todo`,
-  `${BACKEND_URL}/api/admin-submissions?status=pending`,
-  `${BACKEND_URL}/api/submissions?status=todo`,
-  `${BACKEND_URL}/api/submissions?status=pending`,
-  `${BACKEND_URL}/api/submissions?status=new`,
-  `${BACKEND_URL}/api/submissions?status=to-do`,
-];
-
-        let all = [];
-
-        // Helper to try a list of URLs
-        const tryUrls = async (urls) => {
-          for (const url of urls) {
-            try {
-              const res = await fetch(url);
-              if (!res.ok) continue;
-              const data = await res.json();
-              if (Array.isArray(data) && data.length) {
-                all = all.concat(data);
-              }
-            } catch {}
-          }
-        };
-
-        // A) Try to get giant dumps
-        await tryUrls(primaryUrls);
-
-        // B) Paginate if needed
-        if (all.length === 0) {
-          const LIMIT = 200;
-          let offset = 0;
-          while (true) {
-            const url = `${BACKEND_URL}/api/admin-submissions?offset=${offset}&limit=${LIMIT}`;
-            const res = await fetch(url);
-            if (!res.ok) break;
-            const data = await res.json();
-            if (!Array.isArray(data) || data.length === 0) break;
-            all = all.concat(data);
-            if (data.length < LIMIT) break;
-            offset += data.length;
-          }
-        }
-
-        // C) Page/limit style as fallback
-        if (all.length === 0) {
-          const LIMIT = 200;
-          for (let page = 1; page <= 50; page++) {
-           const url = `${BACKEND_URL}/api/admin-submissions?page=${page}&limit=${LIMIT}`;
-            const res = await fetch(url);
-            if (!res.ok) break;
-            const data = await res.json();
-            if (!Array.isArray(data) || data.length === 0) break;
-            all = all.concat(data);
-            if (data.length < LIMIT) break;
-          }
-        }
-
-        // D) Base endpoint as final fallback
-        if (all.length === 0) {
-          try {
-             const res = await fetch(`${BACKEND_URL}/api/admin-submissions`);
-            if (res.ok) {
-              const data = await res.json();
-              if (Array.isArray(data)) all = all.concat(data);
-            }
-          } catch {}
-        }
-
-        // E) Now aggressively try likely "To Do" pools and merge in
-        await tryUrls(todoUrls);
-
-        // Normalize + de-dupe
-        let normalized = dedupeById(all).map(normalizeSubmission);
+        const res = await fetch(`${BACKEND_URL}/api/admin-stats?${statsQuery}`);
+        if (!res.ok) throw new Error(`HTTP ${res.status}`);
+        const data = await res.json();
+        if (isMounted) setStats(data);
+      } catch (err) {
+        console.error('[AdminStatistics] Failed to load stats:', err);
+      } finally {
+        if (isMounted) setLoading(false);
+      }
+    })();
+    return () => { isMounted = false; };
+  }, [statsQuery]);
 
+  // Dropdown options (all-time advisors and industries)
+  useEffect(() => {
+    let isMounted = true;
+    (async () => {
+      try {
+        const res = await fetch(`${BACKEND_URL}/api/admin-stats`);
+        if (!res.ok) return;
+        const data = await res.json();
         if (isMounted) {
-          setSubmissions(normalized);
-
-          // Debug counts in console (helps confirm "To Do" presence)
-          const counts = normalized.reduce((acc, s) => {
-            const c = s.status || 'To Do';
-            acc[c] = (acc[c] || 0) + 1;
-            return acc;
-          }, {});
-          console.log('[AdminStatistics] Loaded submissions:', normalized.length, counts);
+          setFacets({
+            advisors: Object.keys(data.byMentor || {}).sort((a, b) => a.localeCompare(b)),
+            industries: Object.keys(data.byIndustry || {}).sort((a, b) => a.localeCompare(b)),
+          });
         }
       } catch (err) {
-        console.error('[AdminStatistics] Failed to load submissions:', err);
-      } finally {
-        if (isMounted) setLoading(false);
+        console.error('[AdminStatistics] Failed to load filter options:', err);
       }
     })();
     return () => { isMounted = false; };
   }, []);
 
-  // Fetch mentor activity
+  // Activity Center: newest page of the activity log
   useEffect(() => {
     let isMounted = true;
     (async () => {
       try {
-        const tryAllUrls = [
-  `${BACKEND_URL}/api/mentor-activity?all=true`,
-  `${BACKEND_URL}/api/mentor-activity?limit=5000`,
-];
-        let all = [];
-        let gotAll = false;
-        for (const url of tryAllUrls) {
-          try {
-            const res = await fetch(url);
-            if (!res.ok) continue;
-            const data = await res.json();
-            if (Array.isArray(data) && data.length >= 1) {
-              all = all;
-              all = all.concat(data);
-              gotAll = true;
-              break;
-            }
-          } catch {}
-        }
-        if (!gotAll) {
-          const LIMIT = 500;
-          let offset = 0;
-          while (true) {
-            const url = `${BACKEND_URL}/api/mentor-activity?offset=${offset}&limit=${LIMIT}`;
-            const res = await fetch(url);
-            if (!res.ok) break;
-            const data = await res.json();
-            if (!Array.isArray(data) || data.length === 0) break;
-            all = all.concat(data);
-            if (data.length < LIMIT) break;
-            offset += data.length;
-          }
-        }
-        if (all.length === 0) {
-         const res = await fetch(`${BACKEND_URL}/api/mentor-activity`);
-          const data = await res.json();
-          if (Array.isArray(data)) all = data;
+        const res = await fetch(`${BACKEND_URL}/api/mentor-activity?${activityQuery}`);
+        if (!res.ok) return;
+        const data = await res.json();
+        if (isMounted && Array.isArray(data)) setActivity(data);
+      } catch (err) {
+        console.error('[AdminStatistics] Failed to load mentor activity:', err);
+      }
+    })();
+    return () => { isMounted = false; };
+  }, [activityQuery]);
+
+  // Detail modals fetch their rows on open
+  useEffect(() => {
+    if (!showModal || !['submissions', 'canceled', 'avgDays', 'proposed'].includes(selectedMetric)) return;
+    let isMounted = true;
+    (async () => {
+      setModalRows({ rows: [], more: false, loading: true });
+      try {
+        let url;
+        if (selectedMetric === 'proposed') {
+          const params = new URLSearchParams(activityQuery);
+          params.set('action', 'propose');
+          url = `${BACKEND_URL}/api/mentor-activity?${params}`;
+        } else {
+          const params = new URLSearchParams({ limit: String(MODAL_LIMIT) });
+          if (cutoffDay) params.set('from', cutoffDay);
+          if (advisor !== 'All') params.set('mentor', advisor);
+          if (selectedMetric === 'canceled') params.set('status', 'Canceled');
+          else if (statusPill !== 'All') params.set('status', statusPill);
+          if (industrySelected.size === 1) params.set('industry', [...industrySelected][0]);
+          url = `${BACKEND_URL}/api/admin-submissions?${params}`;
         }
-        all = dedupeById(all);
-        if (isMounted) {
-          setMentorActivity(all);
-          console.log('[AdminStatistics] Loaded activity:', all.length);
+        const res = await fetch(url);
+        const data = res.ok ? await res.json() : [];
+        let rows = Array.isArray(data) ? data : [];
+        if (industrySelected.size > 1 && selectedMetric !== 'proposed') {
+          rows = rows.filter(s => (s.industry || '').split(',').some(i => industrySelected.has(i.trim())));
         }
+        if (isMounted) setModalRows({ rows, more: Boolean(res.headers.get('X-Next-Cursor')), loading: false });
       } catch (err) {
-        console.error('[AdminStatistics] Failed to load mentor activity:', err);
+        console.error('[AdminStatistics] Failed to load details:', err);
+        if (isMounted) setModalRows({ rows: [], more: false, loading: false });
       }
     })();
     return () => { isMounted = false; };
-  }, []);
+  }, [showModal, selectedMetric, activityQuery, cutoffDay, advisor, statusPill, industrySelected]);
 
   useEffect(() => {
     const onDocClick = (e) => {
@@ -481,102 +379,24 @@ const todoUrls = [
     return () => document.removeEventListener('mousedown', onDocClick);
   }, [industryOpen, advisorOpen]);
 
-  const advisorOptions = useMemo(() => {
-    const set = new Set(submissions.map(s => (s.pickedBy || '').trim()).filter(Boolean));
-    return Array.from(set).sort((a, b) => a.localeCompare(b));
-  }, [submissions]);
-
-  const allIndustries = useMemo(() => {
-    const set = new Set(submissions.map(s => (s.industry || '').trim()).filter(Boolean));
-    return Array.from(set).sort((a, b) => a.localeCompare(b));
-  }, [submissions]);
-
-  const stringIncludes = (haystack, needle) =>
-    (haystack || '').toLowerCase().includes((needle || '').toLowerCase());
-
-  // ⏱️ Time cutoff (supports '7d', '30d', and 'all')
-  const cutoffDate = useMemo(() => {
-    if (timePreset === 'all') return null;
-    const days = parseInt(timePreset, 10);
-    if (!Number.isFinite(days)) return null;
-    const d = new Date();
-    d.setDate(d.getDate() - days);
-    return d;
-  }, [timePreset]);
-
-  const isAllIndustries = industrySelected.size === 0;
-
-  // 🔑 Filters (NEVER time-exclude "To Do")
-  const filtered = useMemo(() => {
-    const subs = submissions.filter(s => {
-      const sStatus = canonicalStatus(s.status);
-
-      if (cutoffDate && sStatus !== 'To Do') {
-        const subDate = s.submitted ? new Date(s.submitted) : null;
-        if (!subDate || Number.isNaN(subDate.getTime()) || subDate < cutoffDate) return false;
-      }
-
-      if (advisor !== 'All' && (s.pickedBy || '').trim() !== advisor) return false;
-
-      if (statusPill !== 'All' && sStatus !== canonicalStatus(statusPill)) return false;
-
-      const ind = (s.industry || '').trim();
-      if (!isAllIndustries && !industrySelected.has(ind)) return false;
-
-      if (search) {
-        const fields = [
-          s.name, s.email, s.phone, s.industry, s.howTheyHeard,
-          s.availability, s.timeline, s.otherInfo, s.pickedBy
-        ];
-        if (!fields.some(f => stringIncludes(f, search))) return false;
-      }
-      return true;
-    });
-
-    const activity = mentorActivity.filter(a => {
-      if (cutoffDate) {
-        const d = a.timestamp ? new Date(a.timestamp) : null;
-        if (!d || Number.isNaN(d.getTime()) || d < cutoffDate) return false;
-      }
-      if (advisor !== 'All' && (a.email || '').trim() !== advisor) return false;
-      if (statusPill === 'In Progress' && a.action !== 'propose') return false;
-      if (statusPill === 'Canceled' && a.action !== 'cancel') return false;
-      if (search) {
-        if (!['email', 'action', 'details'].some(k => stringIncludes(a[k], search))) return false;
-      }
-      return true;
-    });
-
-    return { subs, activity };
-  }, [submissions, mentorActivity, advisor, statusPill, industrySelected, isAllIndustries, search, cutoffDate]);
+  const advisorOptions = facets.advisors;
+  const allIndustries = facets.industries;
 
   // Metrics
   const metrics = useMemo(() => {
-    const total = filtered.subs.length;
-    const scheduled = filtered.activity.filter(a => a.action === 'propose').length;
-    const canceled = filtered.subs.filter(s => canonicalStatus(s.status) === 'Canceled').length;
-    const advisors = new Set(filtered.subs.map(s => s.pickedBy).filter(Boolean)).size;
-
-    const times = filtered.subs
-      .filter(s => s.submitted && s.updated_at)
-      .map(s => new Date(s.updated_at) - new Date(s.submitted))
-      .filter(t => !Number.isNaN(t));
-
-    const avgDays = times.length
-      ? (times.reduce((a, b) => a + b, 0) / times.length / (1000 * 60 * 60 * 24)).toFixed(1)
-      : 'N/A';
-
-    return { total, scheduled, canceled, advisors, avgDays };
-  }, [filtered]);
+    if (!stats) return { total: 0, scheduled: 0, canceled: 0, advisors: 0, avgDays: 'N/A' };
+    return {
+      total: stats.totalSubmissions,
+      scheduled: countAction(stats.mentorActivity, 'propose'),
+      canceled: stats.byStatus?.Canceled || 0,
+      advisors: Object.keys(stats.byMentor || {}).length,
+      avgDays: stats.avgDaysToUpdate != null ? stats.avgDaysToUpdate.toFixed(1) : 'N/A',
+    };
+  }, [stats]);
 
   // Charts
   const getIndustryChartData = () => {
-    const counts = filtered.subs.reduce((acc, s) => {
-      const k = (s.industry || '').trim() || 'Unknown';
-      acc[k] = (acc[k] || 0) + 1;
-      return acc;
-    }, {});
-    const entries = Object.entries(counts).sort((a, b) => b[1] - a[1]);
+    const entries = Object.entries(stats?.byIndustry || {}).sort((a, b) => b[1] - a[1]);
     const top5 = entries.slice(0, 5);
     const other = entries.slice(5).reduce((sum, [, n]) => sum + n, 0);
     if (other > 0) top5.push(['Other', other]);
@@ -588,11 +408,7 @@ const todoUrls = [
   };
 
   const getStatusBarData = () => {
-    const counts = filtered.subs.reduce((acc, s) => {
-      const c = canonicalStatus(s.status);
-      acc[c] = (acc[c] || 0) + 1;
-      return acc;
-    }, {});
+    const counts = { ...(stats?.byStatus || {}) };
 
     // Ensure all buckets exist so "To Do" shows even if 0 after filters
     ['To Do','In Progress','Done','Canceled'].forEach(k => { if (!(k in counts)) counts[k] = 0; });
@@ -605,18 +421,15 @@ const todoUrls = [
   };
 
   const getSubmissionTrendData = () => {
-    const dateCounts = filtered.subs.reduce((acc, s) => {
-      if (!s.submitted) return acc;
-      const d = new Date(s.submitted);
-      if (Number.isNaN(d.getTime())) return acc;
-      const key = d.toLocaleDateString();
-      acc[key] = (acc[key] || 0) + 1;
-      return acc;
-    }, {});
-    const labels = Object.keys(dateCounts).sort((a, b) => new Date(a) - new Date(b));
+    // byDay keys are YYYY-MM-DD, already sorted
+    const days = Object.entries(stats?.byDay || {});
+    const labels = days.map(([day]) => {
+      const [y, m, d] = day.split('-').map(Number);
+      return new Date(y, m - 1, d).toLocaleDateString();
+    });
     return {
       labels,
-      datasets: [{ label: 'Submissions', data: labels.map(k => dateCounts[k]), fill: false, borderColor: '#3b82f6', backgroundColor: '#3b82f6', tension: 0.3 }]
+      datasets: [{ label: 'Submissions', data: days.map(([, n]) => n), fill: false, borderColor: '#3b82f6', backgroundColor: '#3b82f6', tension: 0.3 }]
     };
   };
 
@@ -624,38 +437,33 @@ const todoUrls = [
   const renderModalContent = () => {
     if (!selectedMetric) return null;
     let content = null;
+    const rows = modalRows.rows;
 
     switch (selectedMetric) {
       case 'submissions':
-        content = filtered.subs.map((s, i) => (
+        content = rows.map((s, i) => (
           <p key={i}>{s.name} – {s.email} – {s.phone}</p>
         ));
         break;
       case 'proposed':
-        content = filtered.activity
-          .filter(e => e.action === 'propose')
-          .map((e, i) => (
-            <p key={i}>
-              {e.email} has proposed a meeting {e.details} – {new Date(e.timestamp).toLocaleString()}
-            </p>
-          ));
+        content = rows.map((e, i) => (
+          <p key={i}>
+            {e.email} has proposed a meeting {e.details} – {new Date(e.timestamp).toLocaleString()}
+          </p>
+        ));
         break;
       case 'canceled':
-        content = filtered.subs
-          .filter(s => canonicalStatus(s.status) === 'Canceled')
-          .map((s, i) => (
-            <p key={i}>
-              {(s.pickedByEmail || s.pickedBy || 'Unknown mentor')} canceled a meeting with {s.name} – {s.email} – {s.phone}
-            </p>
-          ));
+        content = rows.map((s, i) => (
+          <p key={i}>
+            {(s.pickedByEmail || s.pickedBy || 'Unknown mentor')} canceled a meeting with {s.name} – {s.email} – {s.phone}
+          </p>
+        ));
         break;
-      case 'advisors': {
-        const uniq = [...new Set(filtered.subs.map(s => s.pickedBy).filter(Boolean))];
-        content = uniq.map((a, i) => <p key={i}>{a}</p>);
+      case 'advisors':
+        content = Object.keys(stats?.byMentor || {}).map((a, i) => <p key={i}>{a}</p>);
         break;
-      }
       case 'avgDays':
-        content = filtered.subs
+        content = rows
           .filter(s => s.submitted && s.updated_at)
           .map((s, i) => (
             <p key={i}>
@@ -666,20 +474,23 @@ const todoUrls = [
       default:
         content = <p>No data available</p>;
     }
+    if (modalRows.loading && selectedMetric !== 'advisors') content = <p>Loading...</p>;
 
     return (
       <div className="modal-overlay" onClick={() => setShowModal(false)}>
         <div className="modal-content" onClick={(e) => e.stopPropagation()}>
           <button className="close-btn" onClick={() => setShowModal(false)} aria-label="Close modal">&times;</button>
           <h2 style={{ marginBottom: '16px' }}>{selectedMetric.toUpperCase()}</h2>
-          <div style={{ maxHeight: '400px', overflowY: 'auto' }}>{content}</div>
+          <div style={{ maxHeight: '400px', overflowY: 'auto' }}>
+            {content}
+            {modalRows.more && selectedMetric !== 'advisors' && <p><em>Showing the first {MODAL_LIMIT}.</em></p>}
+          </div>
         </div>
       </div>
     );
   };
 
   const clearFilters = () => {
-    setSearch('');
     setAdvisor('All');
     setStatusPill('All');
     setTimePreset('30d');
@@ -945,7 +756,7 @@ const todoUrls = [
                   </tr>
                 </thead>
                 <tbody>
-                  {filtered.activity.map((entry, index) => {
+                  {activity.map((entry, index) => {
                     const base = entry.email;
                     const action = entry.action;
                     const details = entry.details ? ` ${entry.details}` : '';
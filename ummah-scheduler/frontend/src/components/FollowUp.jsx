@@ -9,6 +9,7 @@ import search_icon from '../assets/search_icon.svg';
 import light_mode_icon from '../assets/light_mode.svg';
 import dark_mode_icon from '../assets/dark_mode.svg';
 import Sidebar from "./Sidebar";
+import useChangeEvents from "../useChangeEvents";
 import FollowUpModal from "./FollowUpModal";
 
 const BACKEND_URL = import.meta.env.VITE_BACKEND_URL;
@@ -44,7 +45,7 @@ export default function FollowUp() {
   };
 
   // --- data fetch with loading state ---
-  useEffect(() => {
+  const loadFollowUps = () => {
     setLoading(true);
      fetch(`${BACKEND_URL}/api/followup`)
       .then((res) => res.json())
@@ -57,8 +58,24 @@ export default function FollowUp() {
       })
       .catch((err) => console.error("Error fetching follow-ups:", err))
       .finally(() => setLoading(false));
+  };
+
+  useEffect(() => {
+    loadFollowUps();
   }, []);
 
+  // Live updates: drop rows that leave "Done"; reload only when one joins
+  useChangeEvents({
+    submission: (change) => {
+      if (change.status !== "Done") {
+        setDoneSubmissions((prev) => prev.filter((s) => s.id !== change.id));
+      } else if (!doneSubmissions.some((s) => s.id === change.id)) {
+        loadFollowUps();
+      }
+    },
+    reset: () => loadFollowUps(),
+  });
+
   // store current mentor (if any)
   useEffect(() => {
     setMentorEmail(sessionStorage.getItem("mentorEmail") || "");
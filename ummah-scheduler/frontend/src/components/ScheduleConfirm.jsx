@@ -5,6 +5,21 @@ import { useNavigate, useLocation } from 'react-router-dom';
 
 const BACKEND_URL = import.meta.env.VITE_BACKEND_URL;
 const FRONTEND_URL = import.meta.env.VITE_FRONTEND_URL;
+const POLL_INTERVAL_MS = 1000;
+const POLL_TIMEOUT_MS = 120000;
+
+// Poll a queued scheduling job until it finishes (or fails / times out)
+async function waitForJob(job) {
+  if (!job.jobId) return job; // validation errors come back directly
+  const deadline = Date.now() + POLL_TIMEOUT_MS;
+  while (Date.now() < deadline) {
+    await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+    const res = await fetch(`${BACKEND_URL}/api/schedule-meeting/${job.jobId}`);
+    const status = await res.json();
+    if (status.status === "done" || status.status === "failed" || !res.ok) return status;
+  }
+  return { error: "Timed out waiting for the calendar invite" };
+}
 
 export default function ScheduleConfirm() {
   const navigate = useNavigate();
@@ -53,6 +68,7 @@ export default function ScheduleConfirm() {
           }),
         })
           .then((res) => res.json())
+          .then(waitForJob)
           .then((data) => {
             if (!data.eventLink) {
               alert(`❌ Error scheduling meeting: ${data.error || "Unknown error"}`);
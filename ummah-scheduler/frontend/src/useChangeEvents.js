@@ -0,0 +1,39 @@
+// src/useChangeEvents.js
+import { useEffect, useRef } from 'react';
+
+const BACKEND_URL = import.meta.env.VITE_BACKEND_URL;
+// Opt-in: the backend only serves /api/events with SSE_ENABLED=true.
+// Without it, callers must refresh after their own writes.
+export const LIVE_UPDATES = import.meta.env.VITE_LIVE_UPDATES === 'true';
+
+// Subscribe to /api/events (Server-Sent Events). `handlers` maps an event
+// type ("submission", "mentor_action", "monday_item", "reset") to a
+// callback receiving the parsed payload. EventSource reconnects on its own
+// and resumes after the last event id it saw.
+export default function useChangeEvents(handlers) {
+  const handlersRef = useRef(handlers);
+  handlersRef.current = handlers;
+
+  useEffect(() => {
+    if (!LIVE_UPDATES || typeof EventSource === 'undefined') return undefined;
+    const source = new EventSource(`${BACKEND_URL}/api/events`);
+    const types = ['submission', 'mentor_action', 'monday_item', 'reset'];
+    const listeners = types.map((type) => {
+      const listener = (e) => {
+        const handler = handlersRef.current[type];
+        if (!handler) return;
+        try {
+          handler(JSON.parse(e.data || '{}'));
+        } catch (err) {
+          console.error(`Bad ${type} event:`, err);
+        }
+      };
+      source.addEventListener(type, listener);
+      return [type, listener];
+    });
+    return () => {
+      listeners.forEach(([type, listener]) => source.removeEventListener(type, listener));
+      source.close();
+    };
+  }, []);
+}
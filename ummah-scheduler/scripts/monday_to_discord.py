@@ -1,123 +1,151 @@
 """
 Pull new submissions from a Monday.com board and post them
 to Discord channels via webhook.
-Only posts items that have never been sent before.
-Keeps messages short to avoid truncation.
+Only posts items that have never been sent before: a small SQLite
+ledger records each (item, channel) post, and a created_at watermark
+limits each run to items created since the last one.
+Keeps messages short to avoid truncation; items bound for the same
+channel are packed into multi-embed messages.
 Designed for GitHub Actions: runs once per execution and exits.
 """
 
 import os
-import requests
+import sys
 import json
+import sqlite3
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from pathlib import Path
 
 # Load keys from .env (only needed locally; in Actions you'll use secrets)
 load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent / '.env')
 
+# Share the Monday.com pager with the backend services
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+from services import discord_notify  # noqa: E402
+from services.discord_notify import ALL_CHANNELS, posted_channels, record_posted  # noqa: E402
+from services.monday_poll import created_since_params, iter_item_pages  # noqa: E402
+
 # Variables
 MONDAY_API_KEY  = os.getenv("MONDAY_API_KEY")
 MONDAY_BOARD_ID = os.getenv("MONDAY_BOARD_ID")
 
-DISCORD_GENERAL_WEBHOOK     = os.getenv("DISCORD_GENERAL_WEBHOOK")
-DISCORD_BUSINESS_WEBHOOK    = os.getenv("DISCORD_BUSINESS_WEBHOOK")
-DISCORD_EDUCATION_WEBHOOK   = os.getenv("DISCORD_EDUCATION_WEBHOOK")
-DISCORD_ENGINEERING_WEBHOOK = os.getenv("DISCORD_ENGINEERING_WEBHOOK")
-DISCORD_FINANCE_WEBHOOK     = os.getenv("DISCORD_FINANCE_WEBHOOK")
-DISCORD_IT_WEBHOOK          = os.getenv("DISCORD_IT_WEBHOOK")
-DISCORD_LAW_WEBHOOK         = os.getenv("DISCORD_LAW_WEBHOOK")
-
-# Frontend URL for clickable scheduler link
-FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
-
-# File to persist seen item IDs between runs
+# SQLite ledger of posted (item, channel) pairs plus the created_at watermark
+LEDGER_PATH = Path(os.getenv("DISCORD_LEDGER_PATH") or Path(__file__).resolve().parent / "discord_ledger.db")
+# Legacy ID list, imported into the ledger once
 SEEN_FILE = Path(__file__).resolve().parent / "seen_items.json"
 
+# Ledger rows older than this (and than the watermark's day) are pruned
+LEDGER_RETENTION_DAYS = int(os.getenv("DISCORD_LEDGER_RETENTION_DAYS", "14"))
+
 print("🔑 MONDAY_BOARD_ID:", MONDAY_BOARD_ID)
-print("🔗 FRONTEND_URL:", FRONTEND_URL)
-
-MONDAY_API = "https://api.monday.com/v2"
-
-
-def load_seen_ids():
-    """Load previously posted item IDs"""
-    if SEEN_FILE.exists():
-        with open(SEEN_FILE, "r") as f:
-            return set(json.load(f))
-    return set()
-
-
-def save_seen_ids(ids):
-    """Save updated set of posted item IDs"""
-    with open(SEEN_FILE, "w") as f:
-        json.dump(list(ids), f)
-
-
-def get_latest_items(limit: int = 100):
-    """Pull most recent items from Monday board"""
-    query = f"""
-    query {{
-      boards(ids: [{MONDAY_BOARD_ID}]) {{
-        items_page(limit: {limit}) {{
-          items {{
-            id
-            name
-            created_at
-            column_values {{
-              id
-              text
-              value
-            }}
-          }}
-        }}
-      }}
-    }}
-    """
-    resp = requests.post(
-        MONDAY_API,
-        headers={"Authorization": MONDAY_API_KEY},
-        json={"query": query}
+print("🔗 FRONTEND_URL:", discord_notify.FRONTEND_URL)
+
+PAGE_SIZE = 100
+
+
+# ---------------------------
+# Ledger
+# ---------------------------
+def open_ledger(path=LEDGER_PATH):
+    conn = sqlite3.connect(str(path), isolation_level=None)
+    # Ledgers written before the table was shared with the backend
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posted'").fetchone():
+        conn.execute("ALTER TABLE posted RENAME TO discord_posted")
+        conn.execute("DROP INDEX IF EXISTS idx_posted_posted_at")
+    for statement in discord_notify.LEDGER_SCHEMA:
+        conn.execute(statement)
+    conn.execute("CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT)")
+    import_seen_file(conn)
+    return conn
+
+
+def import_seen_file(conn):
+    """One-shot import of the old seen_items.json ID list."""
+    if not SEEN_FILE.exists():
+        return
+    with open(SEEN_FILE, "r") as f:
+        seen_ids = json.load(f)
+    now = datetime.utcnow().isoformat()
+    conn.execute("BEGIN")
+    conn.executemany(
+        "INSERT OR IGNORE INTO discord_posted (item_id, channel, posted_at) VALUES (?, ?, ?)",
+        [(str(item_id), ALL_CHANNELS, now) for item_id in seen_ids]
     )
-    resp.raise_for_status()
-    data = resp.json()
-    if "errors" in data:
-        raise Exception(f"Monday API error: {data['errors']}")
-    return data["data"]["boards"][0]["items_page"]["items"]
+    conn.execute("COMMIT")
+    SEEN_FILE.unlink()
+    print(f"📦 Imported {len(seen_ids)} IDs from {SEEN_FILE.name}")
+
+
+def get_watermark(conn):
+    row = conn.execute("SELECT value FROM state WHERE key = 'created_at_watermark'").fetchone()
+    return row[0] if row else None
+
 
+def set_watermark(conn, value):
+    conn.execute("""
+        INSERT INTO state (key, value) VALUES ('created_at_watermark', ?)
+        ON CONFLICT(key) DO UPDATE SET value = excluded.value
+    """, (value,))
 
-def safe_post(url, content, industry, item_id):
-    """Safe wrapper to post to Discord"""
-    if not url or not url.startswith("https://discord.com/api/webhooks/"):
-        print(f"⚠️ Skipping invalid webhook for {industry} (item {item_id}) → url={repr(url)}")
+
+def prune_ledger(conn, watermark):
+    cutoff = (datetime.utcnow() - timedelta(days=LEDGER_RETENTION_DAYS)).isoformat()
+    if watermark:
+        # Items from the watermark's day are re-read every run; keep their rows
+        cutoff = min(cutoff, watermark[:10])
+    removed = conn.execute("DELETE FROM discord_posted WHERE posted_at < ?", (cutoff,)).rowcount
+    if removed:
+        print(f"🧹 Pruned {removed} ledger entries older than {LEDGER_RETENTION_DAYS} days")
+
+
+# ---------------------------
+# Monday.com
+# ---------------------------
+def iter_new_pages(watermark):
+    """
+    Yield pages of items created since the watermark's day, oldest first.
+    Without a watermark (first run) only the newest page is considered.
+    """
+    if watermark:
+        for items, _cursor in iter_item_pages(query_params=created_since_params(watermark), page_size=PAGE_SIZE):
+            yield items
         return
-    try:
-        resp = requests.post(url.strip(), json={"content": content})
-        resp.raise_for_status()
-        print(f"✅ Posted {item_id} to {industry} channel")
-    except Exception as e:
-        print(f"❌ Error posting {item_id} to {industry} → {e}")
-
-
-def post_to_discord(item):
-    """Send a short Monday item to the right Discord channel"""
-    columns = {c["id"]: c.get("text", "") for c in item["column_values"]}
-    industry_str = columns.get("dropdown_mksazheg", "N/A")
-    industries = [i.strip() for i in industry_str.split(",")] if industry_str and industry_str != "N/A" else []
-
-    # Compact message — avoids Discord truncation
-    content = (
-        f"**New Career-Prep Submission**\n"
-        f"**Name:** {item['name']}\n"
-        f"**Industry:** {industry_str}\n"
-        f"**Resume:** {columns.get('files_1', 'N/A')}\n"
-        f"**Availability:** {columns.get('dropdown_mksddh69', 'N/A')}\n"
-        f"[View in Scheduler Tool]({FRONTEND_URL})"
-    )
+    query_params = {"order_by": [{"column_id": "__creation_log__", "direction": "desc"}]}
+    for items, _cursor in iter_item_pages(query_params=query_params, page_size=PAGE_SIZE):
+        yield list(reversed(items))
+        return
+
 
-    posted_to_industry = False
-    for industry in industries:
-        url = None
-        if "business" in industry.lower():
-            url = DISCORD_BUSINESS_WEBHOOK
-        elif "education" in industry.lower():
-            url = DISC
\ No newline at end of file
+def main():
+    conn = open_ledger()
+    watermark = get_watermark(conn)
+    print(f"🕒 Watermark: {watermark or 'none (first run)'}")
+
+    total = 0
+    for items in iter_new_pages(watermark):
+        posted = posted_channels(conn, (item["id"] for item in items))
+        delivered, failed = discord_notify.post_items(items, posted)
+        total += len(delivered)
+
+        # Advance the watermark only past items fully delivered; failed posts
+        # stay unrecorded and are retried on the next run
+        safe = [item["created_at"] for item in items if item["id"] not in failed]
+        conn.execute("BEGIN")
+        record_posted(conn, delivered)
+        if failed:
+            oldest_failed = min(item["created_at"] for item in items if item["id"] in failed)
+            safe = [created for created in safe if created < oldest_failed]
+        if safe:
+            set_watermark(conn, max(watermark or "", *safe))
+        conn.execute("COMMIT")
+        if failed:
+            break
+
+    prune_ledger(conn, get_watermark(conn))
+    print(f"📬 {total} new channel posts")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()